@@ -1,6 +1,7 @@
 """The Ikea Obegraensad integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -8,38 +9,71 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform, ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, DEFAULT_PORT, DEFAULT_TIMEOUT, BRIGHTNESS_MAX_API
+from .const import (
+    DOMAIN,
+    DEFAULT_PORT,
+    DEFAULT_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    BRIGHTNESS_MAX_API,
+    CONF_SCAN_INTERVAL,
+    CONF_TRACE,
+    STORAGE_VERSION,
+    TEXT_DEFAULT_SPEED,
+    TEXT_MAX_LENGTH,
+    TEXT_MAX_REPEAT,
+    TEXT_MAX_SPEED,
+    EFFECTS,
+    TIMEZONES,
+    DATA_FLEET,
+    DATA_IMAGE_CACHE,
+    DATA_TARGETS,
+    DATA_SENSORS,
+    IMAGE_DEFAULT_DURATION,
+    IMAGE_MAX_DURATION,
+    CONF_ENTRY_TYPE,
+    CONF_MAX_CONCURRENT,
+    CONF_MEMBERS,
+    ENTRY_TYPE_GROUP,
+    GROUP_DEFAULT_MAX_CONCURRENT,
+)
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .group import IkeaObegraensadGroupCoordinator
+from .framebuffer import parse_frame
+from .imaging import FrameCache, ImageError, async_get_frames, async_load_image
+from .fleet import FleetPollManager
+from .sensorpush import SensorDispatcher
+from .targets import TargetIndex
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def get_device_info(entry: ConfigEntry, coordinator: IkeaObegraensadDataUpdateCoordinator) -> dict[str, Any]:
     """Get device info for entities."""
+    if _is_group(entry):
+        return {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.data.get("name", "Ikea Clock Group"),
+            "manufacturer": "Abrechen2",
+            "model": "Obegraensad group",
+        }
+
     host = entry.data.get("host", "")
     port = entry.data.get("port", DEFAULT_PORT)
     
-    # Try to get firmware version from coordinator data
-    # Check multiple possible field names
+    # Firmware version aliases are resolved by the status model
     sw_version = "Unknown"
     if coordinator.data:
-        # Try various possible field names for firmware version
-        sw_version = (
-            coordinator.data.get("firmwareVersion") or
-            coordinator.data.get("firmware") or
-            coordinator.data.get("version") or
-            coordinator.data.get("sw_version") or
-            coordinator.data.get("fw_version") or
-            "Unknown"
-        )
+        sw_version = coordinator.data.firmware_version or "Unknown"
         # Log available keys for debugging if firmware not found
         if sw_version == "Unknown" and _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("Firmware not found in API response. Available keys: %s", list(coordinator.data.keys()))
+            _LOGGER.debug("Firmware not found in API response. Available keys: %s", list(coordinator.data.raw))
     
     return {
         "identifiers": {(DOMAIN, entry.entry_id)},
@@ -50,6 +84,128 @@ def get_device_info(entry: ConfigEntry, coordinator: IkeaObegraensadDataUpdateCo
         "configuration_url": f"http://{host}:{port}",
     }
 
+def _find_coordinator(
+    hass: HomeAssistant, entity_ids: str | list[str]
+) -> IkeaObegraensadDataUpdateCoordinator | None:
+    """Return the coordinator behind the first matching entity."""
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    if (index := hass.data.get(DOMAIN, {}).get(DATA_TARGETS)) is None:
+        return None
+    for entity_id in entity_ids:
+        coord = hass.data[DOMAIN].get(index.async_entry_id(entity_id))
+        if isinstance(coord, IkeaObegraensadDataUpdateCoordinator):
+            return coord
+    return None
+
+
+def _resolve_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[IkeaObegraensadDataUpdateCoordinator]:
+    """Return the clocks behind the entity, device and area targets of a call.
+
+    Groups are replaced by their member clocks; every clock appears once.
+    """
+    if (index := hass.data.get(DOMAIN, {}).get(DATA_TARGETS)) is None:
+        return []
+    coordinators: dict[int, IkeaObegraensadDataUpdateCoordinator] = {}
+    selected = async_extract_referenced_entity_ids(hass, call)
+    for entry_id in index.async_entry_ids(selected):
+        coord = hass.data[DOMAIN].get(entry_id)
+        if isinstance(coord, IkeaObegraensadGroupCoordinator):
+            coordinators.update((id(member), member) for member in coord.members)
+        elif isinstance(coord, IkeaObegraensadDataUpdateCoordinator):
+            coordinators[id(coord)] = coord
+    return list(coordinators.values())
+
+
+@callback
+def _async_index_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Make the entities and device of a set up entry resolvable as targets."""
+    if (index := hass.data[DOMAIN].get(DATA_TARGETS)) is None:
+        index = hass.data[DOMAIN][DATA_TARGETS] = TargetIndex(hass)
+        index.async_start()
+    index.async_add_entry(entry.entry_id)
+
+
+@callback
+def _async_unindex_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop an unloaded entry from the target index; stop it with the last entry."""
+    if (index := hass.data[DOMAIN].get(DATA_TARGETS)) is None:
+        return
+    index.async_remove_entry(entry.entry_id)
+    if not _loaded_coordinators(hass) and not _loaded_groups(hass):
+        index.async_stop()
+        del hass.data[DOMAIN][DATA_TARGETS]
+
+
+def _hardware_id(entry: ConfigEntry) -> str | None:
+    """Return the hardware id an entry is keyed by, None for `host:port` entries."""
+    if entry.unique_id is None or ":" in entry.unique_id:
+        return None
+    return entry.unique_id
+
+
+@callback
+def _async_adopt_hardware_id(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: IkeaObegraensadDataUpdateCoordinator
+) -> None:
+    """Re-key an entry created by address with the hardware id its clock reports."""
+    if coordinator.hardware_id is not None or coordinator.data is None:
+        return
+    if (hardware_id := coordinator.data.hardware_id) is None:
+        return
+    if any(other.unique_id == hardware_id for other in hass.config_entries.async_entries(DOMAIN)):
+        _LOGGER.warning("%s is configured twice; remove one of its entries", entry.title)
+        return
+    hass.config_entries.async_update_entry(entry, unique_id=hardware_id)
+    coordinator.hardware_id = hardware_id
+    _LOGGER.debug("%s is now identified by %s", entry.title, hardware_id)
+
+
+@callback
+def _async_update_configuration_url(hass: HomeAssistant, entry: ConfigEntry, host: str, port: int) -> None:
+    """Point the device page's link at the clock's current address."""
+    device_registry = dr.async_get(hass)
+    if (device := device_registry.async_get_device(identifiers={(DOMAIN, entry.entry_id)})) is not None:
+        device_registry.async_update_device(device.id, configuration_url=f"http://{host}:{port}")
+
+
+def _trace_path(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
+    """Return the request trace file of an entry, None if tracing is off."""
+    if not entry.options.get(CONF_TRACE):
+        return None
+    return hass.config.path(DOMAIN, f"trace_{entry.entry_id}.jsonl")
+
+
+def _is_group(entry: ConfigEntry) -> bool:
+    """Return True for entries that group several clocks."""
+    return entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_GROUP
+
+
+def _loaded_groups(hass: HomeAssistant) -> list[IkeaObegraensadGroupCoordinator]:
+    """Return the coordinators of all loaded groups."""
+    return [
+        value
+        for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, IkeaObegraensadGroupCoordinator)
+    ]
+
+
+def _status_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the last known status of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def _loaded_coordinators(hass: HomeAssistant) -> list[IkeaObegraensadDataUpdateCoordinator]:
+    """Return the coordinators of all loaded config entries."""
+    return [
+        value
+        for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, IkeaObegraensadDataUpdateCoordinator)
+    ]
+
+
 PLATFORMS: list[Platform] = [
     Platform.SWITCH,
     Platform.SELECT,
@@ -59,20 +215,77 @@ PLATFORMS: list[Platform] = [
     Platform.NUMBER,
 ]
 
+# Groups only get the entities that can be fanned out to their members
+GROUP_PLATFORMS: list[Platform] = [
+    Platform.SWITCH,
+    Platform.SELECT,
+    Platform.LIGHT,
+]
+
+
+async def _async_setup_group_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up a group of clocks from a config entry."""
+    coordinator = IkeaObegraensadGroupCoordinator(
+        hass,
+        entry.title,
+        entry.data[CONF_MEMBERS],
+        entry.data.get(CONF_MAX_CONCURRENT, GROUP_DEFAULT_MAX_CONCURRENT),
+    )
+    if not coordinator.members:
+        # Retried until the clocks themselves are set up
+        raise ConfigEntryNotReady("None of the group's clocks is loaded yet")
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Members loaded later attach themselves in async_setup_entry
+    coordinator.async_attach_members()
+
+    await hass.config_entries.async_forward_entry_setups(entry, GROUP_PLATFORMS)
+    _async_index_entry(hass, entry)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Ikea Obegraensad from a config entry."""
+    if _is_group(entry):
+        return await _async_setup_group_entry(hass, entry)
+
     host = entry.data[CONF_HOST]
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
-    
-    coordinator = IkeaObegraensadDataUpdateCoordinator(hass, host, port)
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+
+    coordinator = IkeaObegraensadDataUpdateCoordinator(
+        hass, host, port, scan_interval, _status_store(hass, entry.entry_id)
+    )
+    coordinator.hardware_id = _hardware_id(entry)
+    # Before the first poll, so a trace starts with it
+    await coordinator.async_set_trace(_trace_path(hass, entry))
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Error connecting to device: {err}") from err
+    if await coordinator.async_restore_status():
+        # Entities start from the last known status; go live off the critical path
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {host}"
+        )
+    else:
+        # Nothing known yet (first setup): the device has to answer now
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            await coordinator.async_shutdown()
+            raise ConfigEntryNotReady(f"Error connecting to device: {err}") from err
+    _async_adopt_hardware_id(hass, entry, coordinator)
 
-    # Set up SensorClock sensor listeners using merged data + options
+    # Hand polling over to the domain-wide manager so devices are staggered
+    hass.data.setdefault(DOMAIN, {})
+    if (fleet := hass.data[DOMAIN].get(DATA_FLEET)) is None:
+        fleet = hass.data[DOMAIN][DATA_FLEET] = FleetPollManager()
+        fleet.async_start()
+    coordinator.async_attach_poll_manager(fleet.async_register(entry.entry_id, coordinator))
+
+    # Set up SensorClock sensor listeners using merged data + options;
+    # clocks showing the same sensors share one listener per sensor
+    if (dispatcher := hass.data[DOMAIN].get(DATA_SENSORS)) is None:
+        dispatcher = hass.data[DOMAIN][DATA_SENSORS] = SensorDispatcher(hass)
+    coordinator.async_attach_sensor_dispatcher(dispatcher)
     sensor_config = {**entry.data, **entry.options}
     await coordinator.async_setup_sensor_listeners(hass, sensor_config)
 
@@ -81,16 +294,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             coordinator._unsub_state_listener()
     entry.async_on_unload(_unsub_sensor_listener)
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    for group in _loaded_groups(hass):
+        group.async_attach_members()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _async_index_entry(hass, entry)
 
     async def async_options_updated(hass, entry) -> None:
-        """Re-wire sensor listeners when options are changed."""
+        """Re-wire sensor listeners and polling when options are changed.
+
+        Also follows a new address written by discovery, without a reload.
+        """
         coord = hass.data[DOMAIN].get(entry.entry_id)
         if coord is None:
             return
+        host = entry.data[CONF_HOST]
+        port = entry.data.get(CONF_PORT, DEFAULT_PORT)
+        if (host, port) != (coord.host, coord.port):
+            _async_update_configuration_url(hass, entry, host, port)
+            await coord.async_set_address(host, port)
+        coord.async_set_base_interval(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        await coord.async_set_trace(_trace_path(hass, entry))
         sensor_config = {**entry.data, **entry.options}
         await coord.async_setup_sensor_listeners(hass, sensor_config)
 
@@ -100,25 +325,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not hass.services.has_service(DOMAIN, "configure_auto_brightness"):
         async def async_handle_configure_auto_brightness(call: ServiceCall) -> None:
             """Handle configure_auto_brightness service call."""
-            entity_ids = call.data[ATTR_ENTITY_ID]
-            if isinstance(entity_ids, str):
-                entity_ids = [entity_ids]
-            
-            registry = er.async_get(hass)
-            coordinator_found = None
-            
-            # Find coordinator for the entity
-            for entity_id in entity_ids:
-                if entity := registry.async_get(entity_id):
-                    # Get the config entry ID from the entity
-                    if entity.config_entry_id and entity.config_entry_id in hass.data.get(DOMAIN, {}):
-                        coord = hass.data[DOMAIN][entity.config_entry_id]
-                        if isinstance(coord, IkeaObegraensadDataUpdateCoordinator):
-                            coordinator_found = coord
-                            break
-            
-            if coordinator_found is None:
-                _LOGGER.error(f"Could not find coordinator for entity {entity_ids}")
+            coordinators = _resolve_coordinators(hass, call)
+            if not coordinators:
+                _LOGGER.error("Could not find a clock for the targets of %s", call.service)
                 return
             
             enabled = call.data.get("enabled")
@@ -141,35 +350,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 _LOGGER.error("sensor_max must be between 0 and 1024")
                 return
             
-            # Call coordinator method - only enabled if explicitly provided
-            if enabled is not None:
-                await coordinator_found.async_set_auto_brightness(
-                    enabled=enabled,
-                    min_brightness=min_brightness,
-                    max_brightness=max_brightness,
-                    sensor_min=sensor_min,
-                    sensor_max=sensor_max,
-                )
-            else:
-                # Get current enabled state from coordinator data
-                current_enabled = True
-                if coordinator_found.data:
-                    current_enabled = coordinator_found.data.get("autoBrightnessEnabled", True)
-                
-                await coordinator_found.async_set_auto_brightness(
+            async def _async_configure(coord: IkeaObegraensadDataUpdateCoordinator) -> bool:
+                # Without `enabled`, every clock keeps its own current state
+                current_enabled = enabled
+                if current_enabled is None:
+                    current_enabled = True
+                    if coord.data and coord.data.auto_brightness_enabled is not None:
+                        current_enabled = coord.data.auto_brightness_enabled
+                return await coord.async_set_auto_brightness(
                     enabled=current_enabled,
                     min_brightness=min_brightness,
                     max_brightness=max_brightness,
                     sensor_min=sensor_min,
                     sensor_max=sensor_max,
                 )
+
+            # All clocks at once, so a whole floor takes about one round-trip
+            results = await asyncio.gather(
+                *(_async_configure(coord) for coord in coordinators), return_exceptions=True
+            )
+            for coord, result in zip(coordinators, results):
+                if result is True:
+                    _LOGGER.debug("Auto-brightness configured on %s", coord.host)
+                else:
+                    _LOGGER.error("Failed to configure auto-brightness on %s: %s", coord.host, result)
+            if len(coordinators) > 1:
+                _LOGGER.info(
+                    "Auto-brightness configured on %d of %d clocks",
+                    results.count(True),
+                    len(coordinators),
+                )
         
         hass.services.async_register(
             DOMAIN,
             "configure_auto_brightness",
             async_handle_configure_auto_brightness,
-            schema=vol.Schema({
-                vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+            schema=cv.make_entity_service_schema({
                 vol.Optional("enabled"): cv.boolean,
                 vol.Optional("min"): vol.All(vol.Coerce(int), vol.Range(min=0, max=BRIGHTNESS_MAX_API)),
                 vol.Optional("max"): vol.All(vol.Coerce(int), vol.Range(min=0, max=BRIGHTNESS_MAX_API)),
@@ -177,23 +393,190 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 vol.Optional("sensor_max"): vol.All(vol.Coerce(int), vol.Range(min=0, max=1024)),
             }),
         )
+
+    # Register service for applying several settings in one go
+    if not hass.services.has_service(DOMAIN, "apply_state"):
+        async def async_handle_apply_state(call: ServiceCall) -> None:
+            """Handle apply_state service call."""
+            entity_ids = call.data[ATTR_ENTITY_ID]
+            coordinator_found = _find_coordinator(hass, entity_ids)
+            if coordinator_found is None:
+                _LOGGER.error(f"Could not find coordinator for entity {entity_ids}")
+                return
+
+            success = await coordinator_found.async_apply_state(
+                display=call.data.get("display"),
+                effect=call.data.get("effect"),
+                brightness=call.data.get("brightness"),
+                auto_brightness=call.data.get("auto_brightness"),
+                timezone=call.data.get("timezone"),
+            )
+            if not success:
+                _LOGGER.error("Failed to apply state to %s", coordinator_found.host)
+
+        hass.services.async_register(
+            DOMAIN,
+            "apply_state",
+            async_handle_apply_state,
+            schema=vol.All(
+                vol.Schema({
+                    vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                    vol.Optional("display"): cv.boolean,
+                    vol.Optional("effect"): vol.In(EFFECTS),
+                    vol.Optional("brightness"): vol.All(vol.Coerce(int), vol.Range(min=0, max=BRIGHTNESS_MAX_API)),
+                    vol.Optional("auto_brightness"): cv.boolean,
+                    vol.Optional("timezone"): vol.In(TIMEZONES),
+                }),
+                cv.has_at_least_one_key("display", "effect", "brightness", "auto_brightness", "timezone"),
+            ),
+        )
+
+    # Register service for drawing raw frames
+    if not hass.services.has_service(DOMAIN, "draw_frame"):
+        async def async_handle_draw_frame(call: ServiceCall) -> None:
+            """Handle draw_frame service call."""
+            entity_ids = call.data[ATTR_ENTITY_ID]
+            coordinator_found = _find_coordinator(hass, entity_ids)
+            if coordinator_found is None:
+                _LOGGER.error(f"Could not find coordinator for entity {entity_ids}")
+                return
+
+            if not await coordinator_found.async_draw_frame(call.data["frame"]):
+                _LOGGER.error("Failed to draw frame on %s", coordinator_found.host)
+
+        hass.services.async_register(
+            DOMAIN,
+            "draw_frame",
+            async_handle_draw_frame,
+            schema=vol.Schema({
+                vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                vol.Required("frame"): parse_frame,
+            }),
+        )
+
+    # Register service for scrolling text
+    if not hass.services.has_service(DOMAIN, "show_text"):
+        async def async_handle_show_text(call: ServiceCall) -> None:
+            """Handle show_text service call."""
+            entity_ids = call.data[ATTR_ENTITY_ID]
+            coordinator_found = _find_coordinator(hass, entity_ids)
+            if coordinator_found is None:
+                _LOGGER.error(f"Could not find coordinator for entity {entity_ids}")
+                return
+
+            coordinator_found.async_show_text(
+                call.data["text"], call.data["speed"], call.data["repeat"]
+            )
+
+        hass.services.async_register(
+            DOMAIN,
+            "show_text",
+            async_handle_show_text,
+            schema=vol.Schema({
+                vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                vol.Required("text"): vol.All(cv.string, vol.Length(min=1, max=TEXT_MAX_LENGTH)),
+                vol.Optional("speed", default=TEXT_DEFAULT_SPEED): vol.All(
+                    vol.Coerce(float), vol.Range(min=1, max=TEXT_MAX_SPEED)
+                ),
+                vol.Optional("repeat", default=1): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=TEXT_MAX_REPEAT)
+                ),
+            }),
+        )
+
+    # Register service for images and animated GIFs
+    if not hass.services.has_service(DOMAIN, "show_image"):
+        async def async_handle_show_image(call: ServiceCall) -> None:
+            """Handle show_image service call."""
+            entity_ids = call.data[ATTR_ENTITY_ID]
+            coordinator_found = _find_coordinator(hass, entity_ids)
+            if coordinator_found is None:
+                _LOGGER.error(f"Could not find coordinator for entity {entity_ids}")
+                return
+            if not coordinator_found.supports_frames:
+                _LOGGER.error("%s does not support raw frames (firmware too old)", coordinator_found.host)
+                return
+
+            cache: FrameCache = hass.data[DOMAIN].setdefault(DATA_IMAGE_CACHE, FrameCache())
+            try:
+                data = await async_load_image(
+                    hass, path=call.data.get("path"), entity_id=call.data.get("image_entity")
+                )
+                frames = await async_get_frames(hass, cache, data, call.data["dither"])
+            except ImageError as err:
+                _LOGGER.error("Cannot show image: %s", err)
+                return
+
+            if len(frames) == 1:
+                coordinator_found.async_play_frames([(frames[0][0], call.data["duration"])])
+            else:
+                coordinator_found.async_play_frames(
+                    frame for _ in range(call.data["repeat"]) for frame in frames
+                )
+
+        hass.services.async_register(
+            DOMAIN,
+            "show_image",
+            async_handle_show_image,
+            schema=vol.All(
+                vol.Schema({
+                    vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                    vol.Exclusive("path", "image"): cv.string,
+                    vol.Exclusive("image_entity", "image"): cv.entity_domain(["camera", "image"]),
+                    vol.Optional("dither", default=True): cv.boolean,
+                    vol.Optional("duration", default=IMAGE_DEFAULT_DURATION): vol.All(
+                        vol.Coerce(float), vol.Range(min=1, max=IMAGE_MAX_DURATION)
+                    ),
+                    vol.Optional("repeat", default=1): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=TEXT_MAX_REPEAT)
+                    ),
+                }),
+                cv.has_at_least_one_key("path", "image_entity"),
+            ),
+        )
     
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if _is_group(entry):
+        unload_ok = await hass.config_entries.async_unload_platforms(entry, GROUP_PLATFORMS)
+        if unload_ok:
+            await hass.data[DOMAIN].pop(entry.entry_id).async_shutdown()
+            _async_unindex_entry(hass, entry)
+        return unload_ok
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-    
-    # Unregister service if no entries left
-    if not hass.data.get(DOMAIN):
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        fleet: FleetPollManager = hass.data[DOMAIN][DATA_FLEET]
+        fleet.async_unregister(entry.entry_id)
+        for group in _loaded_groups(hass):
+            group.async_detach_member(entry.entry_id)
+        _async_unindex_entry(hass, entry)
+
+    # Unregister service and stop the poll manager if no entries left
+    if not _loaded_coordinators(hass):
         hass.services.async_remove(DOMAIN, "configure_auto_brightness")
+        hass.services.async_remove(DOMAIN, "apply_state")
+        hass.services.async_remove(DOMAIN, "draw_frame")
+        hass.services.async_remove(DOMAIN, "show_text")
+        hass.services.async_remove(DOMAIN, "show_image")
+        hass.data.get(DOMAIN, {}).pop(DATA_IMAGE_CACHE, None)
+        hass.data.get(DOMAIN, {}).pop(DATA_SENSORS, None)
+        if (fleet := hass.data.get(DOMAIN, {}).pop(DATA_FLEET, None)) is not None:
+            await fleet.async_stop()
     
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored status of a removed entry."""
+    await _status_store(hass, entry.entry_id).async_remove()
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate config entry from v1 to v2 (adds sensor fields with defaults)."""
     _LOGGER.debug("Migrating config entry from version %s", config_entry.version)
@@ -11,7 +11,6 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -19,6 +18,8 @@ from .const import (
     KEY_DISPLAY_ENABLED,
 )
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .entity import IkeaObegraensadEntity
+from .model import FIELD_BY_KEY
 from . import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,7 +54,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class IkeaObegraensadBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class IkeaObegraensadBinarySensor(IkeaObegraensadEntity, BinarySensorEntity):
     """Representation of a Binary Sensor."""
 
     def __init__(
@@ -69,14 +70,13 @@ class IkeaObegraensadBinarySensor(CoordinatorEntity, BinarySensorEntity):
         base_name = entry.data.get("name", "Ikea Clock")
         self._attr_name = f"{base_name} {description.name}"
         self._attr_device_info = get_device_info(entry, coordinator)
+        self._field = FIELD_BY_KEY[description.key]
+        self._watched_keys = frozenset({self._field})
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
         if self.coordinator.data is None:
             return None
-        value = self.coordinator.data.get(self.entity_description.key)
-        if value is None:
-            return None
-        return bool(value)
+        return getattr(self.coordinator.data, self._field)
 
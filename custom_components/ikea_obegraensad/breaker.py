@@ -0,0 +1,127 @@
+"""Circuit breaker for unreachable Ikea Obegraensad devices."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+from typing import Any
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RESET_TIMEOUT,
+    BREAKER_PROBE_TIMEOUT,
+    BREAKER_RESET_TIMEOUT,
+)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Timers may fire a hair early; a probe that is this close to due counts
+_PROBE_TOLERANCE = 0.05
+
+
+class CircuitOpenError(Exception):
+    """Error to indicate a request was rejected without contacting the device."""
+
+
+class CircuitBreaker:
+    """Fail fast while a device does not answer.
+
+    After `failure_threshold` consecutive transport failures (timeouts,
+    refused connections) the breaker opens and requests are rejected at once.
+    Once the reset timeout has passed, a single probe request is let through
+    (half-open). Success closes the breaker. Failure reopens it with twice
+    the timeout, up to BREAKER_MAX_RESET_TIMEOUT. `on_change` is called with
+    the new state on every transition. A probe that is abandoned
+    (cancelled) or never settles within `probe_timeout` makes room for the
+    next one.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        probe_timeout: float = BREAKER_PROBE_TIMEOUT,
+    ) -> None:
+        """Initialize the breaker (closed)."""
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.probe_timeout = probe_timeout
+        self.state = STATE_CLOSED
+        self.on_change: Callable[[str], None] | None = None
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until a probe is allowed (0 unless open)."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == STATE_CLOSED:
+            return True
+        if (self.state == STATE_OPEN and self.retry_in <= _PROBE_TOLERANCE) or (
+            self.state == STATE_HALF_OPEN
+            and time.monotonic() - self._probe_started >= self.probe_timeout
+        ):
+            # This request is the probe; others wait for its outcome
+            self._set_state(STATE_HALF_OPEN)
+            self._probe_started = time.monotonic()
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after the device answered."""
+        self._set_state(STATE_CLOSED)
+        self.consecutive_failures = 0
+        self.reset_timeout = self.base_reset_timeout
+
+    def record_failure(self) -> bool:
+        """Count a transport failure; return True if the breaker (re)opened."""
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, BREAKER_MAX_RESET_TIMEOUT)
+        elif self.state == STATE_OPEN or self.consecutive_failures < self.failure_threshold:
+            return False
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        self._set_state(STATE_OPEN)
+        return True
+
+    def record_abandoned(self) -> None:
+        """Reopen after the probe was cancelled before the device answered.
+
+        That says nothing about the device, so the timeout stays and the next
+        request may probe right away.
+        """
+        if self.state != STATE_HALF_OPEN:
+            return
+        self._opened_at = time.monotonic() - self.reset_timeout
+        self._set_state(STATE_OPEN)
+
+    def _set_state(self, state: str) -> None:
+        """Move to `state`, telling the listener if it changed."""
+        if state == self.state:
+            return
+        self.state = state
+        if self.on_change is not None:
+            self.on_change(state)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "reset_timeout": self.reset_timeout,
+            "retry_in": round(self.retry_in, 1),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
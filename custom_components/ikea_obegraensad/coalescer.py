@@ -0,0 +1,93 @@
+"""Latest-wins write coalescing for Ikea Obegraensad commands."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any, Generic, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class LatestWinsWriter(Generic[_T]):
+    """Send at most one write at a time for a single device parameter.
+
+    While a write is in flight, newer values replace any pending one, so a
+    burst of slider moves collapses into the value currently being sent plus
+    the last value requested. Every caller receives the result of the write
+    that carried its value or superseded it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: Callable[[_T], Awaitable[bool]],
+        merge: Callable[[_T, _T], _T] | None = None,
+    ) -> None:
+        """Initialize the writer."""
+        self.name = name
+        self._send = send
+        self._merge = merge
+        self._pending: _T | None = None
+        self._has_pending = False
+        self._waiters: list[asyncio.Future[bool]] = []
+        self._task: asyncio.Task[None] | None = None
+        self.requested = 0
+        self.sent = 0
+
+    async def async_write(self, value: _T) -> bool:
+        """Queue a value and wait until it (or a newer value) was sent."""
+        self.requested += 1
+        if self._has_pending and self._merge is not None:
+            value = self._merge(self._pending, value)
+        self._pending = value
+        self._has_pending = True
+
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._async_drain())
+        return await asyncio.shield(waiter)
+
+    async def _async_drain(self) -> None:
+        """Send pending values until no newer value is waiting."""
+        while self._has_pending:
+            value = self._pending
+            waiters, self._waiters = self._waiters, []
+            self._pending = None
+            self._has_pending = False
+
+            try:
+                self.sent += 1
+                result = await self._send(value)
+            except asyncio.CancelledError:
+                _resolve(waiters, False)
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error("Error sending %s: %s", self.name, err)
+                result = False
+
+            _resolve(waiters, result)
+
+    def async_cancel(self) -> None:
+        """Drop any pending value and stop the drain task."""
+        self._pending = None
+        self._has_pending = False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        _resolve(self._waiters, False)
+        self._waiters = []
+
+
+def _resolve(waiters: list[asyncio.Future[bool]], result: bool) -> None:
+    """Hand the result of a write to everyone waiting on it."""
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_result(result)
+
+
+def merge_params(pending: dict[str, Any], value: dict[str, Any]) -> dict[str, Any]:
+    """Merge partial parameter dicts, newer keys winning."""
+    return {**pending, **value}
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import ipaddress
 import logging
 from typing import Any
 
@@ -11,55 +11,55 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.components import zeroconf
+from homeassistant.components.network import async_get_source_ip
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     EntitySelector,
     EntitySelectorConfig,
 )
 
-from .const import DOMAIN, DEFAULT_PORT, DEFAULT_TIMEOUT, API_STATUS, CONF_TEMP_ENTITY, CONF_HUMI_ENTITY
+from .decoder import ResponseRejected, decode_json, read_body
+from .model import DeviceStatus, normalize_hardware_id
+from .scanner import FoundDevice, NetworkTooLarge, async_scan_network, parse_network
+from .const import (
+    DOMAIN,
+    DEFAULT_PORT,
+    DEFAULT_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    API_STATUS,
+    CONF_TEMP_ENTITY,
+    CONF_HUMI_ENTITY,
+    CONF_SCAN_INTERVAL,
+    CONF_TRACE,
+    CONF_HARDWARE_ID,
+    CONF_NETWORK,
+    CONF_DEVICES,
+    CONF_ENTRY_TYPE,
+    CONF_MEMBERS,
+    CONF_MAX_CONCURRENT,
+    ENTRY_TYPE_GROUP,
+    GROUP_DEFAULT_MAX_CONCURRENT,
+    GROUP_MAX_CONCURRENT,
+    GROUP_MIN_MEMBERS,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    MAX_SENSOR_DEADBAND,
+    MAX_SENSOR_MIN_INTERVAL,
+    ZEROCONF_HARDWARE_ID_KEYS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def decode_response_text(response: aiohttp.ClientResponse) -> str:
-    """Decode response text with robust encoding handling (async version).
-
-    Tries multiple encodings to handle devices that may not send UTF-8.
-    """
-    # Read bytes first
-    try:
-        content_bytes = await response.read()
-    except Exception as err:
-        _LOGGER.debug("Error reading response bytes: %s, trying text() with error handling", err)
-        # Fallback to text() with error handling
-        try:
-            return await response.text(encoding='utf-8', errors='replace')
-        except Exception:
-            # Last resort: try latin-1 (can decode any byte)
-            return await response.text(encoding='latin-1')
-
-    # Try different encodings
-    encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-
-    for encoding in encodings:
-        try:
-            text = content_bytes.decode(encoding)
-            if encoding != 'utf-8':
-                _LOGGER.debug("Decoded response using %s encoding", encoding)
-            return text
-        except UnicodeDecodeError:
-            continue
-
-    # If all encodings fail, use replace to handle invalid bytes
-    _LOGGER.warning("Could not decode response with standard encodings, using utf-8 with error replacement")
-    return content_bytes.decode('utf-8', errors='replace')
-
-
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -80,7 +80,7 @@ STEP_SENSOR_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     host = data[CONF_HOST]
     port = data.get(CONF_PORT, DEFAULT_PORT)
@@ -88,34 +88,39 @@ async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
 
     _LOGGER.debug("Validating connection to %s", url)
 
+    session = async_get_clientsession(hass)
+
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-            async with session.get(url) as response:
-                _LOGGER.debug("Response status: %s, Content-Type: %s", response.status, response.content_type)
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as response:
+            _LOGGER.debug("Response status: %s, Content-Type: %s", response.status, response.content_type)
 
-                if response.status != 200:
-                    _LOGGER.warning("HTTP error %s from %s (reason: %s)", response.status, url, response.reason)
-                    raise CannotConnect(f"HTTP {response.status}: {response.reason}")
+            if response.status != 200:
+                _LOGGER.warning("HTTP error %s from %s (reason: %s)", response.status, url, response.reason)
+                raise CannotConnect(f"HTTP {response.status}: {response.reason}")
 
-                text = await decode_response_text(response)
-                _LOGGER.debug("Response text length: %d characters", len(text))
+            try:
+                body = await read_body(response, expect_json=True)
+            except ResponseRejected as err:
+                _LOGGER.warning("Rejected response from %s: %s", url, err)
+                raise CannotConnect(str(err)) from err
+            _LOGGER.debug("Response length: %d bytes", len(body))
 
-                if not text:
-                    _LOGGER.error("Empty response from %s", url)
-                    raise CannotConnect("Empty response from device")
+            if not body:
+                _LOGGER.error("Empty response from %s", url)
+                raise CannotConnect("Empty response from device")
 
-                try:
-                    result = json.loads(text)
-                except json.JSONDecodeError as err:
-                    _LOGGER.error("Invalid JSON response from %s: %s. Response: %s", url, err, text[:200])
-                    raise CannotConnect from err
+            try:
+                result = decode_json(body)
+            except ValueError as err:
+                _LOGGER.error("Invalid JSON response from %s: %s. Response: %s", url, err, body[:200])
+                raise CannotConnect from err
 
-                # Log full API response for debugging (first 500 characters)
-                _LOGGER.debug("API response from %s (first 500 chars): %s", url, text[:500])
-                _LOGGER.debug("Parsed JSON keys: %s", list(result.keys()) if isinstance(result, dict) else "Not a dict")
+            # Log full API response for debugging (first 500 bytes)
+            _LOGGER.debug("API response from %s (first 500 bytes): %s", url, body[:500])
+            _LOGGER.debug("Parsed JSON keys: %s", list(result.keys()) if isinstance(result, dict) else "Not a dict")
 
-                _LOGGER.debug("Successfully validated connection to %s", url)
-                return {"title": data.get(CONF_NAME, "Ikea Clock"), "device_info": result}
+            _LOGGER.debug("Successfully validated connection to %s", url)
+            return {"title": data.get(CONF_NAME, "Ikea Clock"), "device_info": result}
 
     except asyncio.TimeoutError as err:
         _LOGGER.error("Timeout connecting to %s (timeout: %s seconds)", url, DEFAULT_TIMEOUT)
@@ -125,6 +130,26 @@ async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
         raise CannotConnect(f"Connection error: {err}") from err
 
 
+def _unique_id(host: str, port: int, hardware_id: str | None) -> str:
+    """Return the unique id of a clock; its address only if it reports no hardware id."""
+    return hardware_id or f"{host}:{port}"
+
+
+def _status_hardware_id(info: dict[str, Any]) -> str | None:
+    """Return the hardware id from a validated status response."""
+    payload = info.get("device_info")
+    return DeviceStatus(payload).hardware_id if isinstance(payload, dict) else None
+
+
+def _zeroconf_hardware_id(properties: dict[str, Any]) -> str | None:
+    """Return the hardware id announced in an mDNS TXT record."""
+    lowered = {str(key).lower(): value for key, value in properties.items()}
+    for key in ZEROCONF_HARDWARE_ID_KEYS:
+        if (hardware_id := normalize_hardware_id(lowered.get(key))) is not None:
+            return hardware_id
+    return None
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ikea Obegraensad."""
 
@@ -132,21 +157,31 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         self._user_data: dict[str, Any] = {}
+        self._found: dict[str, FoundDevice] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Let the user enter an address or scan the network."""
+        if user_input is not None:
+            # Discovery hands over a pre-filled address
+            return await self.async_step_manual(user_input)
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan", "group"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a manually entered address."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+                step_id="manual", data_schema=STEP_USER_DATA_SCHEMA
             )
 
         errors = {}
 
         try:
             _LOGGER.info("Starting validation for device at %s:%s", user_input[CONF_HOST], user_input.get(CONF_PORT, DEFAULT_PORT))
-            info = await validate_input(user_input)
+            info = await validate_input(self.hass, user_input)
         except CannotConnect as err:
             _LOGGER.warning("Cannot connect to device at %s:%s: %s", user_input[CONF_HOST], user_input.get(CONF_PORT, DEFAULT_PORT), err)
             errors["base"] = "cannot_connect"
@@ -154,10 +189,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Unexpected exception while validating device at %s:%s: %s", user_input[CONF_HOST], user_input.get(CONF_PORT, DEFAULT_PORT), err)
             errors["base"] = "unknown"
         else:
-            unique_id = f"{user_input[CONF_HOST]}:{user_input.get(CONF_PORT, DEFAULT_PORT)}"
+            host = user_input[CONF_HOST]
+            port = user_input.get(CONF_PORT, DEFAULT_PORT)
+            unique_id = _unique_id(host, port, _status_hardware_id(info))
             _LOGGER.info("Validation successful. Setting unique_id: %s", unique_id)
             await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
+            # A known clock entered at a new address keeps its entry
+            self._abort_if_unique_id_configured(
+                updates={CONF_HOST: host, CONF_PORT: port}, reload_on_update=False
+            )
+            self._async_abort_entries_match({CONF_HOST: host, CONF_PORT: port})
             _LOGGER.debug("Unique ID %s is not yet configured, proceeding with entry creation", unique_id)
 
             _LOGGER.info("Creating config entry for device at %s:%s with title: %s", user_input[CONF_HOST], user_input.get(CONF_PORT, DEFAULT_PORT), info["title"])
@@ -166,8 +207,137 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_sensor()
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Probe an address range for clocks."""
+        errors = {}
+        if user_input is not None:
+            port = user_input.get(CONF_PORT, DEFAULT_PORT)
+            try:
+                hosts = parse_network(user_input[CONF_NETWORK])
+            except NetworkTooLarge:
+                errors[CONF_NETWORK] = "network_too_large"
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                entries = self._async_current_entries(include_ignore=False)
+                configured = {entry.unique_id for entry in entries} | {
+                    f"{entry.data.get(CONF_HOST)}:{entry.data.get(CONF_PORT, DEFAULT_PORT)}"
+                    for entry in entries
+                }
+                found = await async_scan_network(async_get_clientsession(self.hass), hosts, port)
+                self._found = {
+                    f"{device.host}:{device.port}": device
+                    for device in found
+                    if f"{device.host}:{device.port}" not in configured
+                    and _unique_id(device.host, device.port, device.hardware_id) not in configured
+                }
+                if self._found:
+                    return await self.async_step_scan_select()
+                errors["base"] = "no_devices_found"
+
+        default_network = "192.168.1.0/24"
+        try:
+            source_ip = await async_get_source_ip(self.hass)
+            default_network = str(ipaddress.ip_network(f"{source_ip}/24", strict=False))
+        except (HomeAssistantError, ValueError):
+            pass
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_NETWORK, default=default_network): str,
+                vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+            }
         )
+        return self.async_show_form(step_id="scan", data_schema=schema, errors=errors)
+
+    async def async_step_scan_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add the selected clocks found by the scan."""
+        if user_input is None:
+            options = {
+                key: f"{device.host} (Firmware {device.firmware_version or '?'})"
+                for key, device in self._found.items()
+            }
+            schema = vol.Schema(
+                {vol.Required(CONF_DEVICES, default=list(options)): cv.multi_select(options)}
+            )
+            return self.async_show_form(
+                step_id="scan_select",
+                data_schema=schema,
+                description_placeholders={"count": str(len(options))},
+            )
+
+        selected = [self._found[key] for key in user_input[CONF_DEVICES] if key in self._found]
+        if not selected:
+            return self.async_abort(reason="no_devices_selected")
+
+        # Every further clock gets its own flow, created without questions
+        for device in selected[1:]:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                    data={**_found_device_data(device), CONF_HARDWARE_ID: device.hardware_id},
+                )
+            )
+
+        first = selected[0]
+        await self.async_set_unique_id(_unique_id(first.host, first.port, first.hardware_id))
+        self._abort_if_unique_id_configured()
+        data = _found_device_data(first)
+        return self.async_create_entry(title=data[CONF_NAME], data=data)
+
+    async def async_step_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Combine configured clocks into a group controlled as one."""
+        clocks = {
+            entry.entry_id: entry.title
+            for entry in self._async_current_entries(include_ignore=False)
+            if entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_GROUP
+        }
+        if len(clocks) < GROUP_MIN_MEMBERS:
+            return self.async_abort(reason="not_enough_clocks")
+
+        errors = {}
+        if user_input is not None:
+            members = [entry_id for entry_id in user_input[CONF_MEMBERS] if entry_id in clocks]
+            if len(members) < GROUP_MIN_MEMBERS:
+                errors[CONF_MEMBERS] = "too_few_members"
+            else:
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME],
+                    data={
+                        CONF_ENTRY_TYPE: ENTRY_TYPE_GROUP,
+                        CONF_NAME: user_input[CONF_NAME],
+                        CONF_MEMBERS: members,
+                        CONF_MAX_CONCURRENT: user_input[CONF_MAX_CONCURRENT],
+                    },
+                )
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME, default="Ikea Clock Group"): str,
+                vol.Required(CONF_MEMBERS, default=list(clocks)): cv.multi_select(clocks),
+                vol.Optional(CONF_MAX_CONCURRENT, default=GROUP_DEFAULT_MAX_CONCURRENT): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=GROUP_MAX_CONCURRENT)
+                ),
+            }
+        )
+        return self.async_show_form(step_id="group", data_schema=schema, errors=errors)
+
+    async def async_step_integration_discovery(self, discovery_info: dict[str, Any]) -> FlowResult:
+        """Create an entry for a clock selected in a network scan."""
+        data = dict(discovery_info)
+        hardware_id = data.pop(CONF_HARDWARE_ID, None)
+        await self.async_set_unique_id(_unique_id(data[CONF_HOST], data[CONF_PORT], hardware_id))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=data[CONF_NAME], data=data)
 
     async def async_step_sensor(
         self, user_input: dict[str, Any] | None = None
@@ -187,6 +357,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def async_get_options_flow(config_entry):
         return OptionsFlowHandler()
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: config_entries.ConfigEntry) -> bool:
+        """Groups have no sensors or polling to configure."""
+        return config_entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_GROUP
+
     async def async_step_zeroconf(
         self, discovery_info: zeroconf.ZeroconfServiceInfo
     ) -> FlowResult:
@@ -200,11 +376,26 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.debug("Zeroconf discovery: Hostname '%s' does not contain 'ikea' or 'clock', aborting", hostname)
             return self.async_abort(reason="not_ikea_clock")
 
+        hardware_id = _zeroconf_hardware_id(discovery_info.properties)
+        if hardware_id is None:
+            # Firmware without the id in its TXT record: ask the clock itself,
+            # unless a configured clock already lives at this address
+            self._async_abort_entries_match({CONF_HOST: host, CONF_PORT: port})
+            try:
+                info = await validate_input(self.hass, {CONF_HOST: host, CONF_PORT: port})
+            except CannotConnect:
+                return self.async_abort(reason="cannot_connect")
+            hardware_id = _status_hardware_id(info)
+
         # Check if already configured
-        unique_id = f"{host}:{port}"
+        unique_id = _unique_id(host, port, hardware_id)
         _LOGGER.info("Zeroconf discovery: Found device at %s:%s (hostname: %s). Setting unique_id: %s", host, port, hostname, unique_id)
         await self.async_set_unique_id(unique_id)
-        self._abort_if_unique_id_configured()
+        # A known clock that got a new address is followed live, without a reload
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: host, CONF_PORT: port}, reload_on_update=False
+        )
+        self._async_abort_entries_match({CONF_HOST: host, CONF_PORT: port})
         _LOGGER.debug("Zeroconf: Unique ID %s is not yet configured, proceeding", unique_id)
 
         # Pre-fill the form with discovered data
@@ -218,8 +409,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+def _found_device_data(device: FoundDevice) -> dict[str, Any]:
+    """Return config entry data for a scanned clock."""
+    return {
+        CONF_HOST: device.host,
+        CONF_PORT: device.port,
+        CONF_NAME: f"Ikea Clock {device.host}",
+    }
+
+
 class OptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle options for SensorClock configuration."""
+    """Handle options for SensorClock and polling configuration."""
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -234,6 +434,19 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             {
                 vol.Optional(CONF_TEMP_ENTITY): EntitySelector(EntitySelectorConfig(domain="sensor")),
                 vol.Optional(CONF_HUMI_ENTITY): EntitySelector(EntitySelectorConfig(domain="sensor")),
+                vol.Optional(
+                    CONF_SCAN_INTERVAL,
+                    default=current.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+                vol.Optional(
+                    CONF_SENSOR_DEADBAND,
+                    default=current.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_SENSOR_DEADBAND)),
+                vol.Optional(
+                    CONF_SENSOR_MIN_INTERVAL,
+                    default=current.get(CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_SENSOR_MIN_INTERVAL)),
+                vol.Optional(CONF_TRACE, default=current.get(CONF_TRACE, False)): bool,
             }
         )
 
@@ -8,6 +8,110 @@ DEFAULT_PORT: Final = 80
 DEFAULT_TIMEOUT: Final = 5
 DEFAULT_SCAN_INTERVAL: Final = 30
 
+# HTTP connection pool (per device)
+DEVICE_CONNECTION_LIMIT: Final = 2
+DEVICE_KEEPALIVE_TIMEOUT: Final = 60
+# Long-lived channels (status events, frame WebSocket) get their own pool
+DEVICE_STREAM_LIMIT: Final = 2
+
+# Last known status persisted per config entry
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 60  # seconds
+
+# Upper bound for a device response body (bytes)
+MAX_RESPONSE_BYTES: Final = 64 * 1024
+# Seconds a device may pause in the middle of a response body
+READ_STALL_TIMEOUT: Final = 2
+# Seconds a whole response body may take, however steadily it trickles in
+READ_BODY_TIMEOUT: Final = 3
+# Content types a status response may have (firmware does not always label JSON)
+JSON_CONTENT_TYPES: Final = frozenset({
+    "application/json",
+    "text/json",
+    "text/plain",
+    "application/octet-stream",  # also what a missing Content-Type reads as
+})
+
+# Delay of the poll that confirms optimistically applied commands (seconds)
+CONFIRM_REFRESH_DELAY: Final = 3
+
+# Adaptive polling (seconds unless noted)
+MIN_SCAN_INTERVAL: Final = 5
+MAX_SCAN_INTERVAL: Final = 3600
+FAST_POLL_INTERVAL: Final = 5
+FAST_POLL_WINDOW: Final = 30
+IDLE_AFTER: Final = 600
+IDLE_POLL_FACTOR: Final = 4
+IDLE_MAX_INTERVAL: Final = 300
+BACKOFF_MAX_INTERVAL: Final = 600
+POLL_JITTER: Final = 0.2  # +/- fraction applied to backoff delays
+
+# Fleet-wide poll scheduling
+FLEET_MAX_CONCURRENT: Final = 8
+FLEET_LATENESS_SMOOTHING: Final = 0.2  # EWMA weight of the latest lateness sample
+
+# Push status updates (seconds)
+PUSH_POLL_INTERVAL: Final = 300
+PUSH_HEARTBEAT_TIMEOUT: Final = 60
+PUSH_RECONNECT_MAX: Final = 300
+
+# SensorClock pushes (deadband in sensor units, intervals in seconds)
+DEFAULT_SENSOR_DEADBAND: Final = 0.1
+MAX_SENSOR_DEADBAND: Final = 5.0
+DEFAULT_SENSOR_MIN_INTERVAL: Final = 30
+MAX_SENSOR_MIN_INTERVAL: Final = 600
+SENSOR_MERGE_WINDOW: Final = 2
+SENSOR_PUSH_MAX_CONCURRENT: Final = 16  # pushes in flight across all clocks
+
+# Circuit breaker (seconds unless noted)
+BREAKER_FAILURE_THRESHOLD: Final = 3  # consecutive failures
+BREAKER_RESET_TIMEOUT: Final = 10
+BREAKER_MAX_RESET_TIMEOUT: Final = 300
+BREAKER_PROBE_TIMEOUT: Final = 30  # a probe still unsettled by then is presumed lost
+
+# Network scan in the config flow
+SCAN_MAX_CONCURRENT: Final = 64
+SCAN_MAX_HOSTS: Final = 1024
+SCAN_TIMEOUT: Final = 2  # seconds per address
+SCAN_CONNECT_TIMEOUT: Final = 0.5  # seconds; LAN hosts answer well within this
+
+# Clock groups
+GROUP_DEFAULT_MAX_CONCURRENT: Final = 10  # member commands in flight at once
+GROUP_MAX_CONCURRENT: Final = 32
+GROUP_MIN_MEMBERS: Final = 2
+
+# Raw framebuffer streaming
+MATRIX_SIZE: Final = 16  # pixels per row and column
+FRAME_MAX_LEVEL: Final = 15  # pixel brightness is 4 bits
+FRAME_IDLE_TIMEOUT: Final = 30  # seconds without frames before the clock resumes its effect
+FRAME_HEARTBEAT: Final = 15  # seconds between WebSocket pings
+
+# Scrolling text (speed in columns per second)
+TEXT_MAX_LENGTH: Final = 255
+TEXT_DEFAULT_SPEED: Final = 12
+TEXT_MAX_SPEED: Final = 50
+TEXT_MAX_REPEAT: Final = 100
+
+# Images and animated GIFs
+IMAGE_MAX_BYTES: Final = 10 * 1024 * 1024  # encoded input
+IMAGE_MAX_FRAMES: Final = 500  # frames kept from an animation
+IMAGE_CACHE_SIZE: Final = 32  # converted images kept (at most ~2 MB)
+IMAGE_DEFAULT_FRAME_DURATION: Final = 100  # ms, for animation frames without one
+IMAGE_MIN_FRAME_DURATION: Final = 20  # ms; GIFs often ask for 0
+IMAGE_DEFAULT_DURATION: Final = 10  # seconds a still image is shown
+IMAGE_MAX_DURATION: Final = 3600
+IMAGE_FETCH_TIMEOUT: Final = 10  # seconds for camera and image entities
+
+# Request trace (opt-in)
+TRACE_BUFFER_SIZE: Final = 2000  # records kept in memory
+TRACE_FLUSH_INTERVAL: Final = 10  # seconds between file appends
+TRACE_MAX_FILE_BYTES: Final = 1024 * 1024  # file size before it is rotated
+TRACE_BACKUP_COUNT: Final = 3  # rotated files kept
+
+# Request metrics
+LATENCY_BUCKETS_MS: Final = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+METRICS_ERROR_SMOOTHING: Final = 0.05  # EWMA weight of the latest request outcome
+
 # API endpoints
 API_STATUS: Final = "/api/status"
 API_SET_DISPLAY: Final = "/api/setDisplay"
@@ -17,6 +121,9 @@ API_SET_TIMEZONE: Final = "/api/setTimezone"
 API_EFFECT: Final = "/effect"
 API_SET_SENSOR_DATA:  Final = "/api/setSensorData"
 API_SET_SLIDE_CONFIG: Final = "/api/setSlideConfig"
+API_EVENTS: Final = "/api/events"
+API_SET_STATE: Final = "/api/setState"
+API_FRAME: Final = "/api/frame"
 
 # Effect names
 EFFECTS: Final = [
@@ -50,6 +157,51 @@ KEY_AUTO_BRIGHTNESS_MAX: Final = "autoBrightnessMax"
 KEY_AUTO_BRIGHTNESS_SENSOR_MIN: Final = "autoBrightnessSensorMin"
 KEY_AUTO_BRIGHTNESS_SENSOR_MAX: Final = "autoBrightnessSensorMax"
 KEY_TIMEZONE: Final = "timezone"
+# Advertised by firmware that streams status deltas (path or true)
+KEY_EVENT_STREAM: Final = "eventStream"
+# Advertised by firmware that applies several settings in one request (path or true)
+KEY_STATE_API: Final = "stateApi"
+# Advertised by firmware that takes raw frames over a WebSocket (path or true)
+KEY_FRAME_STREAM: Final = "frameStream"
+KEY_MAC_ADDRESS: Final = "macAddress"
+
+# Alias keys used by different firmware versions
+EFFECT_KEYS: Final = (
+    KEY_CURRENT_EFFECT,
+    "effect",
+    "activeEffect",
+    "current_effect",
+    "active_effect",
+)
+AUTO_BRIGHTNESS_ENABLED_KEYS: Final = (
+    KEY_AUTO_BRIGHTNESS_ENABLED,
+    "autoBrightness",
+    "autoBrightnessOn",
+    "auto_brightness_enabled",
+)
+FIRMWARE_VERSION_KEYS: Final = (
+    "firmwareVersion",
+    "firmware",
+    "version",
+    "sw_version",
+    "fw_version",
+)
+# Stable hardware identity (MAC or ESP chip id), preferred in this order
+HARDWARE_ID_KEYS: Final = (
+    KEY_MAC_ADDRESS,
+    "mac",
+    "chipId",
+    "chipID",
+    "chip_id",
+)
+# The same identity in an mDNS TXT record
+ZEROCONF_HARDWARE_ID_KEYS: Final = ("mac", "macaddress", "chipid", "id")
+
+# hass.data[DOMAIN] keys besides config entry ids
+DATA_FLEET: Final = "fleet"
+DATA_IMAGE_CACHE: Final = "image_cache"
+DATA_TARGETS: Final = "targets"
+DATA_SENSORS: Final = "sensors"
 
 # Configuration keys
 CONF_HOST: Final = "host"
@@ -63,6 +215,20 @@ CONF_HUMI_DUR:    Final = "humi_duration"
 CONF_DISPLAY_ENABLED: Final = "display_enabled"
 CONF_AUTO_BRIGHTNESS: Final = "auto_brightness"
 CONF_TIMEZONE_OPT:    Final = "timezone"
+CONF_SCAN_INTERVAL:   Final = "scan_interval"
+CONF_SENSOR_DEADBAND:     Final = "sensor_deadband"
+CONF_SENSOR_MIN_INTERVAL: Final = "sensor_min_interval"
+CONF_NETWORK:             Final = "network"
+CONF_DEVICES:             Final = "devices"
+CONF_ENTRY_TYPE:          Final = "entry_type"
+CONF_MEMBERS:             Final = "members"
+CONF_MAX_CONCURRENT:      Final = "max_concurrent"
+CONF_TRACE:               Final = "trace"
+# Only passed from a network scan to the import step, not stored
+CONF_HARDWARE_ID:         Final = "hardware_id"
+
+# Config entry types (entries without CONF_ENTRY_TYPE are single clocks)
+ENTRY_TYPE_GROUP: Final = "group"
 
 # Brightness conversion
 BRIGHTNESS_MAX_API: Final = 1023
@@ -1,18 +1,37 @@
 """DataUpdateCoordinator for Ikea Obegraensad."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import time
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, Event
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import HomeAssistant, HassJob, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import aiohttp
 
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker, CircuitOpenError
+from .coalescer import LatestWinsWriter, merge_params
+from .decoder import ResponseRejected, decode_json, read_body
+from .framebuffer import Frame, FrameStream
+from .metrics import DeviceMetrics
+from .model import DeviceStatus, VOLATILE_FIELDS
+from .push import StatusEventStream
+from .scheduler import AdaptivePollScheduler
+from .sensorpush import SensorDispatcher, SensorPushPipeline
+from .ticker import scroll_frames
+from .trace import TraceRecorder
 from .const import (
     API_STATUS,
+    API_EVENTS,
+    API_SET_STATE,
+    API_FRAME,
+    API_SET_DISPLAY,
     API_SET_BRIGHTNESS,
     API_SET_AUTO_BRIGHTNESS,
     API_SET_TIMEZONE,
@@ -24,61 +43,110 @@ from .const import (
     CONF_CLOCK_DUR,
     CONF_TEMP_DUR,
     CONF_HUMI_DUR,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    DOMAIN,
     DEFAULT_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEVICE_CONNECTION_LIMIT,
+    DEVICE_STREAM_LIMIT,
+    DEVICE_KEEPALIVE_TIMEOUT,
+    CONFIRM_REFRESH_DELAY,
+    FRAME_IDLE_TIMEOUT,
+    STORAGE_SAVE_DELAY,
+    KEY_DISPLAY_ENABLED,
+    KEY_BRIGHTNESS,
+    KEY_CURRENT_EFFECT,
+    KEY_TIMEZONE,
+    KEY_AUTO_BRIGHTNESS_ENABLED,
+    KEY_AUTO_BRIGHTNESS_MIN,
+    KEY_AUTO_BRIGHTNESS_MAX,
+    KEY_AUTO_BRIGHTNESS_SENSOR_MIN,
+    KEY_AUTO_BRIGHTNESS_SENSOR_MAX,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def decode_response_text(response: aiohttp.ClientResponse) -> str:
-    """Decode response text with robust encoding handling.
+# Maps setAutoBrightness query parameters to their status keys
+_AUTO_BRIGHTNESS_PARAM_KEYS: dict[str, str] = {
+    "min": KEY_AUTO_BRIGHTNESS_MIN,
+    "max": KEY_AUTO_BRIGHTNESS_MAX,
+    "sensorMin": KEY_AUTO_BRIGHTNESS_SENSOR_MIN,
+    "sensorMax": KEY_AUTO_BRIGHTNESS_SENSOR_MAX,
+}
 
-    Tries multiple encodings to handle devices that may not send UTF-8.
-    """
-    # Read bytes first
-    try:
-        content_bytes = await response.read()
-    except Exception as err:
-        _LOGGER.debug("Error reading response bytes: %s, trying text() with error handling", err)
-        # Fallback to text() with error handling
-        try:
-            return await response.text(encoding='utf-8', errors='replace')
-        except Exception:
-            # Last resort: try latin-1 (can decode any byte)
-            return await response.text(encoding='latin-1')
 
-    # Try different encodings
-    encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+def _auto_brightness_changes(params: dict[str, str]) -> dict[str, Any]:
+    """Translate setAutoBrightness parameters into status changes."""
+    changes: dict[str, Any] = {KEY_AUTO_BRIGHTNESS_ENABLED: params["enabled"] == "true"}
+    for param, key in _AUTO_BRIGHTNESS_PARAM_KEYS.items():
+        if param in params:
+            changes[key] = int(params[param])
+    return changes
 
-    for encoding in encodings:
-        try:
-            text = content_bytes.decode(encoding)
-            if encoding != 'utf-8':
-                _LOGGER.debug("Decoded response using %s encoding", encoding)
-            return text
-        except UnicodeDecodeError:
-            continue
 
-    # If all encodings fail, use replace to handle invalid bytes
-    _LOGGER.warning("Could not decode response with standard encodings, using utf-8 with error replacement")
-    return content_bytes.decode('utf-8', errors='replace')
+def _query(kwargs: dict[str, Any]) -> Any:
+    """Return the query parameters or JSON payload of a request."""
+    return kwargs.get("params") or kwargs.get("json")
+
+
+def _is_activity(changed: frozenset[str] | None) -> bool:
+    """Return True if a change goes beyond the volatile fields."""
+    return bool(changed and changed - VOLATILE_FIELDS)
+
 
+# Coordinator attributes holding the SensorClock slide durations
+SLIDE_DURATION_ATTRS = ("_clock_dur", "_temp_dur", "_humi_dur")
 
-class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
+
+def create_device_session(limit: int = DEVICE_CONNECTION_LIMIT) -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session dedicated to one device.
+
+    The ESP web server only handles a couple of sockets at a time, so the
+    connector is capped and idle connections are kept past one poll interval.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        keepalive_timeout=DEVICE_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+    )
+
+
+class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator[DeviceStatus]):
     """Class to manage fetching data from the Ikea Obegraensad device."""
 
-    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        store: Store | None = None,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name="Ikea Obegraensad",
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=scan_interval),
         )
+        self.scheduler = AdaptivePollScheduler(scan_interval)
+        self._poll_reschedule: Callable[[float], None] | None = None
+        # Status fields changed by the latest update (None: unknown, notify everyone)
+        self.changed_keys: frozenset[str] | None = None
+        self.update_stats: dict[str, int] = {"emitted": 0, "suppressed": 0}
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
+        # Hardware id the device at this address has to report (None: not checked)
+        self.hardware_id: str | None = None
         # SensorClock config (populated from config entry by async_setup_sensor_listeners)
         self._temp_entity: str | None = None
         self._humi_entity: str | None = None
@@ -88,55 +156,395 @@ class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
         self._last_temp: float | None = None
         self._last_humi: float | None = None
         self._unsub_state_listener = None
+        self._sensor_sync_task: asyncio.Task | None = None
+        self.sensor_push = SensorPushPipeline(self._async_write_sensor_data)
+        # Replaced by the shared dispatcher when set up through a config entry
+        self._sensor_dispatcher = SensorDispatcher(hass)
+        self._session = create_device_session()
+        # The event stream and the frame WebSocket hold their connection for
+        # as long as they are open; on the request pool they would starve
+        # polls and commands
+        self._stream_session = create_device_session(DEVICE_STREAM_LIMIT)
+        # Last known status, shown until the first live poll answers
+        self._store = store
+        self.restored = False
+        self.metrics = DeviceMetrics()
+        self.breaker = CircuitBreaker()
+        self.breaker.on_change = self._async_breaker_changed
+        self._unsub_probe: Callable[[], None] | None = None
+        # One confirmation poll for any burst of commands
+        self._confirm_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=CONFIRM_REFRESH_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+        )
+        # Latest-wins writers for slider-driven parameters
+        self._brightness_writer: LatestWinsWriter[int] = LatestWinsWriter(
+            "brightness", self._async_write_brightness
+        )
+        self._auto_brightness_writer: LatestWinsWriter[dict[str, str]] = LatestWinsWriter(
+            "auto-brightness", self._async_write_auto_brightness, merge_params
+        )
+        self._slide_config_writer: LatestWinsWriter[dict[str, str]] = LatestWinsWriter(
+            "slide config", self._async_write_slide_config
+        )
+        # Push channel, started once the firmware advertises it
+        self.event_stream: StatusEventStream | None = None
+        self._event_task: asyncio.Task | None = None
+        # Raw frame channel, opened by the first frame
+        self.frame_stream: FrameStream | None = None
+        self._unsub_frame_idle: Callable[[], None] | None = None
+        self._playback_task: asyncio.Task | None = None
+        # Request recorder, only while tracing is enabled in the options
+        self.trace: TraceRecorder | None = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending work and close the device session."""
+        await super().async_shutdown()
+        if self._unsub_probe is not None:
+            self._unsub_probe()
+            self._unsub_probe = None
+        if self._event_task is not None:
+            self._event_task.cancel()
+            self._event_task = None
+        if self._sensor_sync_task is not None:
+            self._sensor_sync_task.cancel()
+            self._sensor_sync_task = None
+        self._async_stop_playback()
+        self._async_cancel_frame_idle()
+        if self.frame_stream is not None:
+            await self.frame_stream.async_close()
+        await self.async_set_trace(None)
+        await self._confirm_refresh.async_shutdown()
+        for writer in self._writers:
+            writer.async_cancel()
+        self.sensor_push.async_cancel()
+        for session in (self._session, self._stream_session):
+            if not session.closed:
+                await session.close()
+
+    async def _async_apply_optimistic(self, changes: dict[str, Any]) -> None:
+        """Patch the last known status with a command the device accepted.
+
+        Entities are updated right away; a single debounced poll afterwards
+        reconciles anything the device did differently.
+        """
+        self.scheduler.note_activity()
+        self._async_apply_interval()
+        if self.data is not None:
+            # Also reschedules the next poll with the fast-poll interval
+            self._async_set_status(self.data.merge(changes))
+        await self._confirm_refresh.async_call()
+
+    @callback
+    def _async_set_status(self, data: DeviceStatus) -> None:
+        """Publish a locally updated status with its changed fields."""
+        self.changed_keys = data.diff(self.data)
+        self.async_set_updated_data(data)
+        self._async_schedule_save(data)
+
+    async def async_restore_status(self) -> bool:
+        """Load the last known status from storage; return True if there was one."""
+        if self._store is None or not isinstance(raw := await self._store.async_load(), dict):
+            return False
+        self.data = DeviceStatus(raw)
+        self.restored = True
+        return True
+
+    @callback
+    def _async_schedule_save(self, data: DeviceStatus) -> None:
+        """Persist a status (delayed) when more than volatile fields changed."""
+        if self._store is None:
+            return
+        if self.changed_keys is None or _is_activity(self.changed_keys):
+            self._store.async_delay_save(lambda: data.raw, STORAGE_SAVE_DELAY)
+
+    @property
+    def _writers(self) -> tuple[LatestWinsWriter, ...]:
+        """Return all coalescing writers of this device."""
+        return (
+            self._brightness_writer,
+            self._auto_brightness_writer,
+            self._slide_config_writer,
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from the device."""
+    async def _async_request(
+        self, method: str, path: str, *, expect_json: bool = False, **kwargs: Any
+    ) -> tuple[aiohttp.ClientResponse, bytes]:
+        """Send a request to the device, recording it in the metrics.
+
+        Raises CircuitOpenError right away while the device is known to be
+        unreachable. The body is always read so the keep-alive connection can
+        be reused, but through the bounded reader: an oversized, stalling or
+        (with `expect_json`) non-JSON response raises ResponseRejected and
+        counts as a transport failure. A probe that is cancelled reopens the
+        breaker so the next request probes instead.
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(
+                f"{self.host} is unreachable, next attempt in {self.breaker.retry_in:.0f}s"
+            )
+        probe = self.breaker.state == STATE_HALF_OPEN
+        started = time.monotonic()
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-                async with session.get(f"{self.base_url}{API_STATUS}") as response:
-                    if response.status == 200:
-                        text = await decode_response_text(response)
-                        data = json.loads(text)
-                        return data
-                    else:
-                        raise UpdateFailed(f"HTTP {response.status}: {response.reason}")
+            async with self._session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+                body = await read_body(response, expect_json=expect_json)
+        except ResponseRejected as err:
+            self.metrics.record_rejected(path, started, err.reason)
+            if self.trace is not None:
+                self.trace.record(method, path, _query(kwargs), started, response.status, error=err.reason)
+            _LOGGER.debug("Rejected response from %s%s: %s", self.host, path, err)
+            self._async_note_transport_failure()
+            raise
+        except asyncio.TimeoutError:
+            self.metrics.record_timeout(path, started)
+            if self.trace is not None:
+                self.trace.record(method, path, _query(kwargs), started, error="timeout")
+            self._async_note_transport_failure()
+            raise
+        except aiohttp.ClientError as err:
+            self.metrics.record_client_error(path, started, err)
+            if self.trace is not None:
+                self.trace.record(method, path, _query(kwargs), started, error=type(err).__name__)
+            self._async_note_transport_failure()
+            raise
+        except BaseException:
+            if probe:
+                self.breaker.record_abandoned()
+            raise
+        self.metrics.record_response(path, started, response.status, len(body))
+        if self.trace is not None:
+            self.trace.record(method, path, _query(kwargs), started, response.status, body)
+        self.breaker.record_success()
+        return response, body
+
+    async def async_set_trace(self, path: str | None) -> None:
+        """Start recording requests to `path`, or stop with None."""
+        if self.trace is not None:
+            if self.trace.path == path:
+                return
+            await self.trace.async_close()
+            self.trace = None
+        if path is not None:
+            self.trace = TraceRecorder(self.hass, path)
+            _LOGGER.info("Recording requests to %s in %s", self.host, path)
+
+    @callback
+    def _async_note_transport_failure(self) -> None:
+        """Count a failure and schedule a probe if the breaker opened."""
+        if not self.breaker.record_failure():
+            return
+        _LOGGER.warning(
+            "%s is not responding, failing requests fast for %.0fs",
+            self.host,
+            self.breaker.reset_timeout,
+        )
+        if self._unsub_probe is not None:
+            self._unsub_probe()
+        self._unsub_probe = async_call_later(
+            self.hass, self.breaker.reset_timeout, HassJob(self._async_probe, cancel_on_shutdown=True)
+        )
+
+    @callback
+    def _async_breaker_changed(self, _state: str) -> None:
+        """Let the connection state sensor follow the breaker between polls."""
+        # No status field changed; only the sensors that compare their own
+        # value (or availability) write state
+        self.changed_keys = frozenset()
+        self.async_update_listeners()
+
+    async def _async_probe(self, _now: Any) -> None:
+        """Let one status poll through to test whether the device is back."""
+        self._unsub_probe = None
+        if self.breaker.state != STATE_CLOSED:
+            # The breaker decides whether this poll may probe (a half-open
+            # probe that went stale is replaced)
+            await self.async_refresh()
+
+    async def _async_send_command(
+        self, path: str, params: dict[str, str] | None = None
+    ) -> int:
+        """Send a GET command to the device and return the HTTP status."""
+        response, _ = await self._async_request("GET", path, params=params)
+        return response.status
+
+    async def _async_post_command(self, path: str, payload: dict[str, Any]) -> int:
+        """POST a JSON command to the device and return the HTTP status."""
+        response, _ = await self._async_request("POST", path, json=payload)
+        return response.status
+
+    async def _async_update_data(self) -> DeviceStatus:
+        """Fetch data from the device and adapt the next poll interval."""
+        try:
+            data = DeviceStatus(await self._async_fetch_status())
+            if self.hardware_id and data.hardware_id not in (None, self.hardware_id):
+                # The clock moved and another device took over its old address
+                raise UpdateFailed(f"{self.host} now answers as a different device ({data.hardware_id})")
+        except UpdateFailed:
+            # Only availability changes; entities compare that themselves
+            self.changed_keys = frozenset()
+            self.scheduler.note_failure()
+            self._async_apply_interval()
+            raise
+
+        self.changed_keys = data.diff(self.data)
+        self.scheduler.note_success(_is_activity(self.changed_keys))
+        self._async_apply_interval()
+        self._async_start_event_stream(data)
+        self._async_schedule_save(data)
+        return data
+
+    async def _async_fetch_status(self) -> dict[str, Any]:
+        """Fetch the status payload from the device."""
+        try:
+            response, body = await self._async_request("GET", API_STATUS, expect_json=True)
+        except CircuitOpenError as err:
+            raise UpdateFailed(str(err)) from err
+        except ResponseRejected as err:
+            raise UpdateFailed(f"Rejected status response: {err}") from err
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error communicating with device: {err}") from err
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
+        if response.status != 200:
+            raise UpdateFailed(f"HTTP {response.status}: {response.reason}")
+
+        try:
+            data = decode_json(body)
+        except ValueError as err:
+            raise UpdateFailed(f"Invalid status response: {err}") from err
+        if not isinstance(data, dict):
+            raise UpdateFailed("Invalid status response: not a JSON object")
+        return data
+
+    @callback
+    def _async_apply_interval(self) -> None:
+        """Use the scheduler's effective interval for the next poll."""
+        interval = self.scheduler.next_interval()
+        if self._poll_reschedule is not None:
+            self._poll_reschedule(interval)
+        else:
+            self.update_interval = timedelta(seconds=interval)
+
+    @callback
+    def async_attach_poll_manager(self, reschedule: Callable[[float], None]) -> None:
+        """Hand poll timing over to the domain-wide fleet manager."""
+        self._poll_reschedule = reschedule
+        self.update_interval = None
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the current effective poll interval (seconds)."""
+        return self.scheduler.current_interval
+
+    async def async_poll(self) -> None:
+        """Poll the device once; called by the fleet manager."""
+        await self.async_refresh()
+
+    @callback
+    def _async_start_event_stream(self, data: DeviceStatus) -> None:
+        """Subscribe to the device's status event stream if it has one."""
+        if self._event_task is not None or not data.event_stream:
+            return
+        path = data.event_stream
+        if not isinstance(path, str):
+            path = API_EVENTS
+        self.event_stream = StatusEventStream(
+            self._stream_session,
+            f"{self.base_url}{path}",
+            self._async_handle_status_event,
+            self._async_handle_push_connected,
+        )
+        self._event_task = self.hass.async_create_background_task(
+            self.event_stream.async_run(), f"{DOMAIN} event stream {self.host}"
+        )
+
+    @callback
+    def _async_handle_status_event(self, delta: dict[str, Any]) -> None:
+        """Apply a pushed status delta."""
+        if self.data is None:
+            return
+        data = self.data.merge(delta)
+        self.scheduler.note_success(_is_activity(data.diff(self.data)))
+        self._async_apply_interval()
+        self._async_set_status(data)
+
+    @callback
+    def _async_handle_push_connected(self, connected: bool) -> None:
+        """Switch between push and regular polling."""
+        _LOGGER.debug("Status event stream for %s %s", self.host, "connected" if connected else "lost")
+        self.scheduler.push_connected = connected
+        self._async_apply_interval()
+        if not connected:
+            # Catch up on anything missed and resume regular polling
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_set_base_interval(self, scan_interval: int) -> None:
+        """Change the user-configured base poll interval."""
+        self.scheduler.base_interval = float(scan_interval)
+        self._async_apply_interval()
+
+    async def async_set_address(self, host: str, port: int) -> None:
+        """Follow the device to a new address without reloading.
+
+        Push and frame channels still bound to the old address are dropped
+        (they reconnect from the next status), the failure backoff is reset
+        and the device is polled right away.
+        """
+        if (host, port) == (self.host, self.port):
+            return
+        _LOGGER.info("Clock at %s:%s moved to %s:%s", self.host, self.port, host, port)
+        self.host = host
+        self.port = port
+        self.base_url = f"http://{host}:{port}"
+        if self._event_task is not None:
+            self._event_task.cancel()
+            self._event_task = None
+            self.event_stream = None
+            self.scheduler.push_connected = False
+        if self.frame_stream is not None:
+            await self.frame_stream.async_close()
+            self.frame_stream = None
+        if self._unsub_probe is not None:
+            self._unsub_probe()
+            self._unsub_probe = None
+        self.breaker.record_success()
+        self.scheduler.reset_failures()
+        await self.async_refresh()
 
     async def async_set_display(self, enabled: bool) -> bool:
         """Set display on/off."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-                async with session.get(
-                    f"{self.base_url}/api/setDisplay",
-                    params={"enabled": "true" if enabled else "false"}
-                ) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-                    else:
-                        _LOGGER.error(f"Failed to set display: HTTP {response.status}")
-                        return False
+            status = await self._async_send_command(
+                API_SET_DISPLAY, {"enabled": "true" if enabled else "false"}
+            )
+            if status == 200:
+                await self._async_apply_optimistic({KEY_DISPLAY_ENABLED: enabled})
+                return True
+            _LOGGER.error(f"Failed to set display: HTTP {status}")
+            return False
         except Exception as err:
             _LOGGER.error(f"Error setting display: {err}")
             return False
 
     async def async_set_brightness(self, brightness: int) -> bool:
-        """Set brightness (0-1023)."""
+        """Set brightness (0-1023), coalescing rapid slider moves."""
+        return await self._brightness_writer.async_write(brightness)
+
+    async def _async_write_brightness(self, brightness: int) -> bool:
+        """Send a brightness value to the device."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-                async with session.get(
-                    f"{self.base_url}{API_SET_BRIGHTNESS}",
-                    params={"b": str(brightness)}
-                ) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-                    else:
-                        _LOGGER.error(f"Failed to set brightness: HTTP {response.status}")
-                        return False
+            status = await self._async_send_command(
+                API_SET_BRIGHTNESS, {"b": str(brightness)}
+            )
+            if status == 200:
+                await self._async_apply_optimistic({KEY_BRIGHTNESS: brightness})
+                return True
+            _LOGGER.error(f"Failed to set brightness: HTTP {status}")
+            return False
         except Exception as err:
             _LOGGER.error(f"Error setting brightness: {err}")
             return False
@@ -144,16 +552,12 @@ class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
     async def async_set_effect(self, effect_name: str) -> bool:
         """Set effect by name."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-                async with session.get(
-                    f"{self.base_url}{API_EFFECT}/{effect_name}"
-                ) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-                    else:
-                        _LOGGER.error(f"Failed to set effect: HTTP {response.status}")
-                        return False
+            status = await self._async_send_command(f"{API_EFFECT}/{effect_name}")
+            if status == 200:
+                await self._async_apply_optimistic({KEY_CURRENT_EFFECT: effect_name})
+                return True
+            _LOGGER.error(f"Failed to set effect: HTTP {status}")
+            return False
         except Exception as err:
             _LOGGER.error(f"Error setting effect: {err}")
             return False
@@ -167,30 +571,30 @@ class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
         sensor_max: int | None = None,
     ) -> bool:
         """Set auto-brightness on/off with optional configuration."""
+        params: dict[str, str] = {"enabled": "true" if enabled else "false"}
+
+        # Only add parameters that are provided
+        if min_brightness is not None:
+            params["min"] = str(min_brightness)
+        if max_brightness is not None:
+            params["max"] = str(max_brightness)
+        if sensor_min is not None:
+            params["sensorMin"] = str(sensor_min)
+        if sensor_max is not None:
+            params["sensorMax"] = str(sensor_max)
+
+        # Partial updates are merged so a newer call never drops an older field
+        return await self._auto_brightness_writer.async_write(params)
+
+    async def _async_write_auto_brightness(self, params: dict[str, str]) -> bool:
+        """Send auto-brightness parameters to the device."""
         try:
-            params: dict[str, str] = {"enabled": "true" if enabled else "false"}
-
-            # Only add parameters that are provided
-            if min_brightness is not None:
-                params["min"] = str(min_brightness)
-            if max_brightness is not None:
-                params["max"] = str(max_brightness)
-            if sensor_min is not None:
-                params["sensorMin"] = str(sensor_min)
-            if sensor_max is not None:
-                params["sensorMax"] = str(sensor_max)
-
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-                async with session.get(
-                    f"{self.base_url}{API_SET_AUTO_BRIGHTNESS}",
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-                    else:
-                        _LOGGER.error(f"Failed to set auto-brightness: HTTP {response.status}")
-                        return False
+            status = await self._async_send_command(API_SET_AUTO_BRIGHTNESS, params)
+            if status == 200:
+                await self._async_apply_optimistic(_auto_brightness_changes(params))
+                return True
+            _LOGGER.error(f"Failed to set auto-brightness: HTTP {status}")
+            return False
         except Exception as err:
             _LOGGER.error(f"Error setting auto-brightness: {err}")
             return False
@@ -198,21 +602,208 @@ class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
     async def async_set_timezone(self, timezone: str) -> bool:
         """Set timezone."""
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as session:
-                async with session.get(
-                    f"{self.base_url}{API_SET_TIMEZONE}",
-                    params={"tz": timezone}
-                ) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-                    else:
-                        _LOGGER.error(f"Failed to set timezone: HTTP {response.status}")
-                        return False
+            status = await self._async_send_command(API_SET_TIMEZONE, {"tz": timezone})
+            if status == 200:
+                await self._async_apply_optimistic({KEY_TIMEZONE: timezone})
+                return True
+            _LOGGER.error(f"Failed to set timezone: HTTP {status}")
+            return False
         except Exception as err:
             _LOGGER.error(f"Error setting timezone: {err}")
             return False
 
+    async def async_apply_state(
+        self,
+        display: bool | None = None,
+        effect: str | None = None,
+        brightness: int | None = None,
+        auto_brightness: bool | None = None,
+        timezone: str | None = None,
+    ) -> bool:
+        """Apply several settings at once, followed by one confirmation poll.
+
+        Firmware that advertises a state endpoint gets a single request.
+        Otherwise the commands are sent back to back over the keep-alive
+        session, ordered so the device shows as few intermediate states as
+        possible.
+        """
+        changes: dict[str, Any] = {}
+        if display is not None:
+            changes[KEY_DISPLAY_ENABLED] = display
+        if auto_brightness is not None:
+            changes[KEY_AUTO_BRIGHTNESS_ENABLED] = auto_brightness
+        if brightness is not None:
+            changes[KEY_BRIGHTNESS] = brightness
+        if timezone is not None:
+            changes[KEY_TIMEZONE] = timezone
+        if effect is not None:
+            changes[KEY_CURRENT_EFFECT] = effect
+        if not changes:
+            return True
+
+        if self.data is not None and self.data.state_api:
+            path = self.data.state_api if isinstance(self.data.state_api, str) else API_SET_STATE
+            try:
+                status = await self._async_post_command(path, changes)
+            except Exception as err:
+                _LOGGER.error(f"Error applying state: {err}")
+                return False
+            if status == 200:
+                await self._async_apply_optimistic(changes)
+                return True
+            if status not in (404, 405):
+                _LOGGER.error(f"Failed to apply state: HTTP {status}")
+                return False
+            _LOGGER.debug("State endpoint not available on %s, sending commands one by one", self.host)
+
+        applied: dict[str, Any] = {}
+        success = True
+        try:
+            for key, path, params in self._state_commands(changes):
+                status = await self._async_send_command(path, params)
+                if status != 200:
+                    _LOGGER.error(f"Failed to apply {key}: HTTP {status}")
+                    success = False
+                    break
+                applied[key] = changes[key]
+        except Exception as err:
+            _LOGGER.error(f"Error applying state: {err}")
+            success = False
+        if applied:
+            await self._async_apply_optimistic(applied)
+        return success
+
+    @staticmethod
+    def _state_commands(
+        changes: dict[str, Any]
+    ) -> list[tuple[str, str, dict[str, str] | None]]:
+        """Return the single-setting commands for a state change, in send order."""
+        commands: list[tuple[str, str, dict[str, str] | None]] = []
+        if KEY_AUTO_BRIGHTNESS_ENABLED in changes:
+            # Before brightness, so a manual value is not overridden
+            commands.append((
+                KEY_AUTO_BRIGHTNESS_ENABLED,
+                API_SET_AUTO_BRIGHTNESS,
+                {"enabled": "true" if changes[KEY_AUTO_BRIGHTNESS_ENABLED] else "false"},
+            ))
+        if KEY_BRIGHTNESS in changes:
+            commands.append((KEY_BRIGHTNESS, API_SET_BRIGHTNESS, {"b": str(changes[KEY_BRIGHTNESS])}))
+        if KEY_TIMEZONE in changes:
+            commands.append((KEY_TIMEZONE, API_SET_TIMEZONE, {"tz": changes[KEY_TIMEZONE]}))
+        if KEY_CURRENT_EFFECT in changes:
+            commands.append((KEY_CURRENT_EFFECT, f"{API_EFFECT}/{changes[KEY_CURRENT_EFFECT]}", None))
+        if KEY_DISPLAY_ENABLED in changes:
+            display = (
+                KEY_DISPLAY_ENABLED,
+                API_SET_DISPLAY,
+                {"enabled": "true" if changes[KEY_DISPLAY_ENABLED] else "false"},
+            )
+            # Switch off first / on last so the changes are not visible
+            if changes[KEY_DISPLAY_ENABLED]:
+                commands.append(display)
+            else:
+                commands.insert(0, display)
+        return commands
+
+    async def async_draw_frame(self, frame: Frame) -> bool:
+        """Show a raw frame on the matrix, replacing any animation.
+
+        Frames are streamed over a WebSocket that stays open while frames
+        keep coming; FRAME_IDLE_TIMEOUT seconds after the last one it is
+        closed and the clock resumes its effect.
+        """
+        self._async_stop_playback()
+        self._async_arm_frame_idle()
+        return await self._async_draw_frame(frame)
+
+    @callback
+    def _async_arm_frame_idle(self) -> None:
+        """(Re)start the countdown to closing the frame stream."""
+        self._async_cancel_frame_idle()
+        self._unsub_frame_idle = async_call_later(
+            self.hass, FRAME_IDLE_TIMEOUT, HassJob(self._async_end_frames, cancel_on_shutdown=True)
+        )
+
+    @callback
+    def _async_cancel_frame_idle(self) -> None:
+        """Stop the countdown to closing the frame stream."""
+        if self._unsub_frame_idle is not None:
+            self._unsub_frame_idle()
+            self._unsub_frame_idle = None
+
+    @property
+    def supports_frames(self) -> bool:
+        """Return True if the firmware takes raw frames."""
+        return self.data is not None and bool(self.data.frame_stream)
+
+    async def _async_draw_frame(self, frame: Frame) -> bool:
+        """Send one frame over the frame stream."""
+        if not self.supports_frames:
+            _LOGGER.error("%s does not support raw frames (firmware too old)", self.host)
+            return False
+        if self.breaker.state == STATE_OPEN:
+            return False
+        if self.frame_stream is None:
+            path = self.data.frame_stream
+            if not isinstance(path, str):
+                path = API_FRAME
+            self.frame_stream = FrameStream(self._stream_session, f"ws://{self.host}:{self.port}{path}")
+        return await self.frame_stream.async_draw(frame)
+
+    async def _async_end_frames(self, _now: Any) -> None:
+        """Close the frame stream so the clock resumes its effect."""
+        self._async_cancel_frame_idle()
+        if self.frame_stream is not None:
+            await self.frame_stream.async_close()
+
+    @callback
+    def async_show_text(self, text: str, speed: float, repeat: int) -> bool:
+        """Start scrolling text across the matrix; return False if unsupported."""
+        return self.async_play_frames(
+            (frame, 1 / speed) for _ in range(repeat) for frame in scroll_frames(text)
+        )
+
+    @callback
+    def async_play_frames(self, frames: Iterable[tuple[Frame, float]]) -> bool:
+        """Start playing (frame, seconds shown) pairs; return False if unsupported.
+
+        Frames are taken from the iterable as they are due. Playback runs in
+        the background and replaces any animation still playing; when it
+        ends the clock goes back to its effect.
+        """
+        if not self.supports_frames:
+            _LOGGER.error("%s does not support raw frames (firmware too old)", self.host)
+            return False
+        self._async_stop_playback()
+        # A frame drawn earlier must not close the stream mid-animation
+        self._async_cancel_frame_idle()
+        self._playback_task = self.hass.async_create_background_task(
+            self._async_play(frames), f"{DOMAIN} playback {self.host}"
+        )
+        return True
+
+    @callback
+    def _async_stop_playback(self) -> None:
+        """Cancel an animation that is still playing."""
+        if self._playback_task is not None and not self._playback_task.done():
+            self._playback_task.cancel()
+        self._playback_task = None
+
+    async def _async_play(self, frames: Iterable[tuple[Frame, float]]) -> None:
+        """Draw each frame and hold it for its duration."""
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        for frame, duration in frames:
+            # Absolute deadlines, so slow sends do not slow the animation down
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            if not await self._async_draw_frame(frame):
+                _LOGGER.debug("Stopping playback on %s, frame not delivered", self.host)
+                self._async_arm_frame_idle()
+                return
+            due += duration
+        await asyncio.sleep(max(0.0, due - loop.time()))
+        await self._async_end_frames(None)
+
     async def async_setup_sensor_listeners(self, hass, config: dict) -> None:
         """Set up state listeners for temperature and humidity entities.
 
@@ -220,63 +811,81 @@ class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
         config: dict with keys temp_entity, humi_entity, clock_duration,
                 temp_duration, humi_duration.
         """
-        # Unsubscribe previous listener to avoid duplicates
+        # Unsubscribe previous listeners to avoid duplicates
         if self._unsub_state_listener is not None:
             self._unsub_state_listener()
             self._unsub_state_listener = None
 
         self._temp_entity = config.get(CONF_TEMP_ENTITY) or None
         self._humi_entity = config.get(CONF_HUMI_ENTITY) or None
+        durations = {attr: getattr(self, attr) for attr in SLIDE_DURATION_ATTRS}
         self._clock_dur   = int(config.get(CONF_CLOCK_DUR, 10))
         self._temp_dur    = int(config.get(CONF_TEMP_DUR,  5))
         self._humi_dur    = int(config.get(CONF_HUMI_DUR,  5))
-
-        # Sync slide durations to device
-        await self.async_set_slide_config()
+        if changed := frozenset(attr for attr, old in durations.items() if getattr(self, attr) != old):
+            # Durations are not part of the status; name them so the
+            # duration numbers (and nothing else) write their state
+            self.changed_keys = changed
+            self.async_update_listeners()
+        self.sensor_push.deadband = float(config.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND))
+        self.sensor_push.min_interval = float(config.get(CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL))
 
         if not self._temp_entity and not self._humi_entity:
-            return  # no entities configured, nothing to listen to
+            # No entities configured, nothing to listen to; still sync durations
+            self._async_start_sensor_sync()
+            return
 
         entity_ids = [e for e in [self._temp_entity, self._humi_entity] if e]
-        self._unsub_state_listener = async_track_state_change_event(
-            hass, entity_ids, self._on_sensor_state_change
-        )
-        _LOGGER.debug("SensorClock: listening to %s", entity_ids)
+        unsubs = [
+            self._sensor_dispatcher.async_subscribe(entity_id, self._async_sensor_value)
+            for entity_id in entity_ids
+        ]
+
+        def _unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        self._unsub_state_listener = _unsubscribe
 
         # Push current sensor values immediately — don't wait for next state change
         for entity_id in entity_ids:
-            state = hass.states.get(entity_id)
-            if state and state.state not in ("unavailable", "unknown", ""):
-                try:
-                    value = float(state.state)
-                    if entity_id == self._temp_entity:
-                        self._last_temp = value
-                    elif entity_id == self._humi_entity:
-                        self._last_humi = value
-                except (ValueError, TypeError):
-                    _LOGGER.warning("SensorClock: initial state of %s is not a float: %s", entity_id, state.state)
+            if (value := self._sensor_dispatcher.async_value(entity_id)) is None:
+                continue
+            if entity_id == self._temp_entity:
+                self._last_temp = value
+            elif entity_id == self._humi_entity:
+                self._last_humi = value
+
+        self._async_start_sensor_sync()
+
+    @callback
+    def async_attach_sensor_dispatcher(self, dispatcher: SensorDispatcher) -> None:
+        """Share SensorClock source listeners and the push limit with other clocks."""
+        self._sensor_dispatcher = dispatcher
+
+    @callback
+    def _async_start_sensor_sync(self) -> None:
+        """Send slide durations and current sensor values in the background.
+
+        Setup does not wait for the device; an offline clock simply gets the
+        values with the next change.
+        """
+        if self._sensor_sync_task is not None:
+            self._sensor_sync_task.cancel()
+        self._sensor_sync_task = self.hass.async_create_background_task(
+            self._async_sync_sensor_clock(), f"{DOMAIN} SensorClock sync {self.host}"
+        )
 
+    async def _async_sync_sensor_clock(self) -> None:
+        """Sync slide durations and push the initial sensor values."""
+        await self.async_set_slide_config()
         if self._last_temp is not None and self._last_humi is not None:
             _LOGGER.debug("SensorClock: pushing initial values temp=%.1f humi=%.1f", self._last_temp, self._last_humi)
             await self.async_push_sensor_data(self._last_temp, self._last_humi)
 
-    async def _on_sensor_state_change(self, event: Event) -> None:
-        """Handle state changes from temperature or humidity entities."""
-        entity_id = event.data.get("entity_id")
-        new_state  = event.data.get("new_state")
-
-        if new_state is None or new_state.state in ("unavailable", "unknown", ""):
-            _LOGGER.warning("SensorClock: %s is %s, skipping push",
-                            entity_id, new_state.state if new_state else "None")
-            return
-
-        try:
-            value = float(new_state.state)
-        except (ValueError, TypeError):
-            _LOGGER.warning("SensorClock: %s state '%s' is not a float, skipping",
-                            entity_id, new_state.state)
-            return
-
+    @callback
+    def _async_sensor_value(self, entity_id: str, value: float) -> None:
+        """Handle a new temperature or humidity value from the dispatcher."""
         if entity_id == self._temp_entity:
             self._last_temp = value
         elif entity_id == self._humi_entity:
@@ -289,48 +898,43 @@ class IkeaObegraensadDataUpdateCoordinator(DataUpdateCoordinator):
                           self._humi_entity, self._last_humi)
             return
 
-        await self.async_push_sensor_data(self._last_temp, self._last_humi)
+        # Deadband, rate limit and merging are handled by the pipeline
+        self.sensor_push.submit(self._last_temp, self._last_humi)
 
     async def async_push_sensor_data(self, temp: float, humi: float) -> bool:
-        """Push temperature and humidity values to the device."""
+        """Push temperature and humidity values to the device right away."""
+        return await self.sensor_push.async_push_now(temp, humi)
+
+    async def _async_write_sensor_data(self, params: dict[str, str]) -> bool:
+        """Send a sensor payload to the device."""
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-            ) as session:
-                params = {"temp": f"{temp:.1f}", "humi": f"{humi:.1f}"}
-                async with session.get(
-                    f"{self.base_url}{API_SET_SENSOR_DATA}", params=params
-                ) as response:
-                    if response.status == 200:
-                        return True
-                    _LOGGER.warning(
-                        "SensorClock: setSensorData returned HTTP %s", response.status
-                    )
-                    return False
+            async with self._sensor_dispatcher.push_limit:
+                status = await self._async_send_command(API_SET_SENSOR_DATA, params)
+            if status == 200:
+                return True
+            _LOGGER.warning("SensorClock: setSensorData returned HTTP %s", status)
+            return False
         except Exception as err:
             _LOGGER.warning("SensorClock: error pushing sensor data: %s", err)
             return False
 
     async def async_set_slide_config(self) -> bool:
-        """Push slide duration config to the device."""
+        """Push slide duration config to the device, latest durations winning."""
+        params = {
+            "clockDur": str(self._clock_dur),
+            "tempDur":  str(self._temp_dur),
+            "humiDur":  str(self._humi_dur),
+        }
+        return await self._slide_config_writer.async_write(params)
+
+    async def _async_write_slide_config(self, params: dict[str, str]) -> bool:
+        """Send slide durations to the device."""
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-            ) as session:
-                params = {
-                    "clockDur": str(self._clock_dur),
-                    "tempDur":  str(self._temp_dur),
-                    "humiDur":  str(self._humi_dur),
-                }
-                async with session.get(
-                    f"{self.base_url}{API_SET_SLIDE_CONFIG}", params=params
-                ) as response:
-                    if response.status == 200:
-                        return True
-                    _LOGGER.warning(
-                        "SensorClock: setSlideConfig returned HTTP %s", response.status
-                    )
-                    return False
+            status = await self._async_send_command(API_SET_SLIDE_CONFIG, params)
+            if status == 200:
+                return True
+            _LOGGER.warning("SensorClock: setSlideConfig returned HTTP %s", status)
+            return False
         except Exception as err:
             _LOGGER.warning("SensorClock: error setting slide config: %s", err)
             return False
@@ -0,0 +1,138 @@
+"""Response decoding for Ikea Obegraensad devices."""
+from __future__ import annotations
+
+import asyncio
+import codecs
+import json
+import logging
+from typing import Any
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+from .const import JSON_CONTENT_TYPES, MAX_RESPONSE_BYTES, READ_BODY_TIMEOUT, READ_STALL_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class ResponseRejected(Exception):
+    """Error to indicate a response was cut off by the bounded reader."""
+
+    # Diagnostics counter the rejection is counted under
+    reason = "rejected"
+
+
+class PayloadTooLarge(ResponseRejected, ValueError):
+    """Error to indicate a response body exceeds the size limit."""
+
+    reason = "oversized"
+
+
+class UnexpectedContentType(ResponseRejected, ValueError):
+    """Error to indicate a response that cannot be JSON (e.g. a captive portal page)."""
+
+    reason = "content_type"
+
+
+class ResponseStalled(ResponseRejected, asyncio.TimeoutError):
+    """Error to indicate a device stopped sending in the middle of a body."""
+
+    reason = "stalled"
+
+
+class ResponseTooSlow(ResponseRejected, asyncio.TimeoutError):
+    """Error to indicate a body that keeps trickling past the read deadline."""
+
+    reason = "too_slow"
+
+
+async def read_body(
+    response: aiohttp.ClientResponse,
+    max_size: int = MAX_RESPONSE_BYTES,
+    stall_timeout: float = READ_STALL_TIMEOUT,
+    expect_json: bool = False,
+    body_timeout: float = READ_BODY_TIMEOUT,
+) -> bytes:
+    """Read a response body without trusting the device.
+
+    Wrong content types and announced oversized bodies are rejected before
+    reading anything. The body is then read chunk by chunk: more than
+    `max_size` bytes, no data for `stall_timeout` seconds, or a body still
+    incomplete after `body_timeout` seconds aborts the read. Aborted
+    responses close their connection so it is not reused.
+    """
+    if expect_json and response.content_type not in JSON_CONTENT_TYPES:
+        response.close()
+        raise UnexpectedContentType(f"Expected JSON, got {response.content_type}")
+    if response.content_length is not None and response.content_length > max_size:
+        response.close()
+        raise PayloadTooLarge(f"Response of {response.content_length} bytes exceeds {max_size} bytes")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + body_timeout
+    body = bytearray()
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            try:
+                chunk = await asyncio.wait_for(
+                    response.content.readany(), min(stall_timeout, max(remaining, 0))
+                )
+            except asyncio.TimeoutError as err:
+                if remaining <= stall_timeout:
+                    raise ResponseTooSlow(
+                        f"Body incomplete after {body_timeout}s ({len(body)} bytes)"
+                    ) from err
+                raise ResponseStalled(
+                    f"No data for {stall_timeout}s after {len(body)} bytes"
+                ) from err
+            if not chunk:
+                return bytes(body)
+            body += chunk
+            if len(body) > max_size:
+                raise PayloadTooLarge(f"Response exceeds {max_size} bytes")
+    except ResponseRejected:
+        response.close()
+        raise
+
+
+def decode_text(body: bytes) -> str:
+    """Decode a response body for devices that may not send UTF-8."""
+    try:
+        return body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so this cannot fail
+        _LOGGER.debug("Response is not valid UTF-8, decoding as latin-1")
+        return body.decode("latin-1")
+
+
+def decode_json(body: bytes, max_size: int = MAX_RESPONSE_BYTES) -> Any:
+    """Parse a JSON response body.
+
+    The bytes go straight to the fast parser; charset detection only runs
+    when that fails because of the encoding (non-UTF-8 text or a BOM).
+    """
+    if len(body) > max_size:
+        raise PayloadTooLarge(f"Response of {len(body)} bytes exceeds {max_size} bytes")
+    try:
+        return _loads(body)
+    except ValueError:
+        if not body.startswith(codecs.BOM_UTF8) and _is_utf8(body):
+            # Valid UTF-8 that does not parse is simply malformed
+            raise
+    return _loads(decode_text(body))
+
+
+def _is_utf8(body: bytes) -> bool:
+    """Return True if the body is valid UTF-8."""
+    try:
+        body.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
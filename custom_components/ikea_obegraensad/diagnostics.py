@@ -7,22 +7,82 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import (
+    CONF_HARDWARE_ID,
+    DOMAIN,
+    DATA_FLEET,
+    DATA_IMAGE_CACHE,
+    DATA_SENSORS,
+    HARDWARE_ID_KEYS,
+)
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .group import IkeaObegraensadGroupCoordinator
 
 TO_REDACT = {
     "password",
     "token",
     "api_key",
+    # The hardware id is the clock's MAC address (or chip id)
+    "unique_id",
+    CONF_HARDWARE_ID,
+    *HARDWARE_ID_KEYS,
 }
 
 
-async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+def _status_diagnostics(
+    coordinator: IkeaObegraensadDataUpdateCoordinator | IkeaObegraensadGroupCoordinator,
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
-    coordinator: IkeaObegraensadDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    
+    """Return the last raw status without hardware identifiers."""
+    return async_redact_data(coordinator.data.raw, TO_REDACT) if coordinator.data else {}
+
+
+def _fleet_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any] | None:
+    """Return poll manager stats including this device's lateness."""
+    if (fleet := hass.data[DOMAIN].get(DATA_FLEET)) is None:
+        return None
+    return fleet.as_dict(entry.entry_id)
+
+
+def _image_cache_diagnostics(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return stats of the converted image cache shared by all clocks."""
+    if (cache := hass.data[DOMAIN].get(DATA_IMAGE_CACHE)) is None:
+        return None
+    return cache.as_dict()
+
+
+def _sensor_dispatcher_diagnostics(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the SensorClock source subscriptions shared by all clocks."""
+    if (dispatcher := hass.data[DOMAIN].get(DATA_SENSORS)) is None:
+        return None
+    return dispatcher.as_dict()
+
+
+def _coordinator_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: IkeaObegraensadDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return the polling, push and request state of a clock."""
+    last_update_time = getattr(coordinator, "last_update_time", None)
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "last_update_time": last_update_time.isoformat() if last_update_time else None,
+        # The coordinator's own update_interval is None while the fleet polls
+        "update_interval": round(coordinator.scheduler.current_interval, 1),
+        "scheduler": coordinator.scheduler.as_dict(),
+        "event_stream": coordinator.event_stream.as_dict() if coordinator.event_stream else None,
+        "fleet": _fleet_diagnostics(hass, entry),
+        "entity_updates": dict(coordinator.update_stats),
+        "sensor_push": coordinator.sensor_push.as_dict(),
+        "requests": coordinator.metrics.as_dict(),
+        "circuit_breaker": coordinator.breaker.as_dict(),
+        "frame_stream": coordinator.frame_stream.as_dict() if coordinator.frame_stream else None,
+        "trace": coordinator.trace.as_dict() if coordinator.trace else None,
+    }
+
+
+def _group_diagnostics(
+    entry: ConfigEntry, coordinator: IkeaObegraensadGroupCoordinator
+) -> dict[str, Any]:
+    """Return diagnostics for a group of clocks."""
     return {
         "config_entry": {
             "entry_id": entry.entry_id,
@@ -30,16 +90,41 @@ async def async_get_config_entry_diagnostics(
             "domain": entry.domain,
             "title": entry.title,
             "data": async_redact_data(entry.data, TO_REDACT),
-            "options": async_redact_data(entry.options, TO_REDACT),
-            "pref_disable_new_entities": entry.pref_disable_new_entities,
-            "pref_disable_polling": entry.pref_disable_polling,
-            "source": entry.source,
-            "unique_id": entry.unique_id,
         },
+        "group": coordinator.as_dict(),
+        "entity_updates": dict(coordinator.update_stats),
+        "status": _status_diagnostics(coordinator),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: IkeaObegraensadDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if isinstance(coordinator, IkeaObegraensadGroupCoordinator):
+        return _group_diagnostics(entry, coordinator)
+    
+    return {
+        "config_entry": async_redact_data(
+            {
+                "entry_id": entry.entry_id,
+                "version": entry.version,
+                "domain": entry.domain,
+                "title": entry.title,
+                "data": entry.data,
+                "options": entry.options,
+                "pref_disable_new_entities": entry.pref_disable_new_entities,
+                "pref_disable_polling": entry.pref_disable_polling,
+                "source": entry.source,
+                "unique_id": entry.unique_id,
+            },
+            TO_REDACT,
+        ),
         "coordinator": {
-            "last_update_success": coordinator.last_update_success,
-            "last_update_time": coordinator.last_update_time.isoformat() if coordinator.last_update_time else None,
-            "update_interval": str(coordinator.update_interval),
+            **_coordinator_diagnostics(hass, entry, coordinator),
+            "image_cache": _image_cache_diagnostics(hass),
+            "sensor_sources": _sensor_dispatcher_diagnostics(hass),
         },
         "device": {
             "host": coordinator.host,
@@ -54,6 +139,8 @@ async def async_get_device_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a device."""
     coordinator: IkeaObegraensadDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if isinstance(coordinator, IkeaObegraensadGroupCoordinator):
+        return _group_diagnostics(entry, coordinator)
     
     diagnostics_data: dict[str, Any] = {
         "config_entry": {
@@ -63,17 +150,13 @@ async def async_get_device_diagnostics(
             "title": entry.title,
             "data": async_redact_data(entry.data, TO_REDACT),
         },
-        "coordinator": {
-            "last_update_success": coordinator.last_update_success,
-            "last_update_time": coordinator.last_update_time.isoformat() if coordinator.last_update_time else None,
-            "update_interval": str(coordinator.update_interval),
-        },
+        "coordinator": _coordinator_diagnostics(hass, entry, coordinator),
         "device": {
             "host": coordinator.host,
             "port": coordinator.port,
             "base_url": coordinator.base_url,
         },
-        "status": coordinator.data if coordinator.data else {},
+        "status": _status_diagnostics(coordinator),
     }
     
     return diagnostics_data
@@ -0,0 +1,56 @@
+"""Base entity for Ikea Obegraensad integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import IkeaObegraensadDataUpdateCoordinator
+
+
+class IkeaObegraensadEntity(CoordinatorEntity[IkeaObegraensadDataUpdateCoordinator]):
+    """Coordinator entity that only writes state when its fields change.
+
+    Subclasses set `_watched_keys` to the DeviceStatus fields they render. A
+    coordinator update that changed none of them (e.g. only `time`) and did
+    not change availability is skipped.
+    """
+
+    _watched_keys: frozenset[str] = frozenset()
+    _last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if a watched field or availability changed."""
+        changed = self.coordinator.changed_keys
+        available = self.available
+        stats = self.coordinator.update_stats
+        if (
+            changed is not None
+            and available == self._last_available
+            and changed.isdisjoint(self._watched_keys)
+        ):
+            stats["suppressed"] += 1
+            return
+        self._last_available = available
+        stats["emitted"] += 1
+        super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the availability the entity was added with."""
+        await super().async_added_to_hass()
+        self._last_available = self.available
+
+
+class IkeaObegraensadGroupEntity(IkeaObegraensadEntity):
+    """Entity of a clock group; reports which members it covers.
+
+    Listed before the platform entity class so its attributes replace the
+    single-device ones.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the members and the ones that failed the last command."""
+        return self.coordinator.member_attributes()
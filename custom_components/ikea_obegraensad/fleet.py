@@ -0,0 +1,193 @@
+"""Domain-wide poll scheduling for all Ikea Obegraensad devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import heapq
+import logging
+import time
+from typing import Any, Protocol
+
+from .const import FLEET_LATENESS_SMOOTHING, FLEET_MAX_CONCURRENT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Golden-ratio offsets keep any number of devices evenly spread over an interval
+_GOLDEN_RATIO_FRACTION = 0.6180339887498949
+
+
+class Poller(Protocol):
+    """What the manager needs from a device."""
+
+    poll_interval: float
+
+    def async_poll(self) -> Awaitable[Any]:
+        """Poll the device once."""
+
+
+@dataclass
+class _Entry:
+    """Scheduling state of one device."""
+
+    poller: Poller
+    due: float
+    seq: int = 0
+    running: bool = False
+    polls: int = 0
+    last_lateness: float = 0.0
+    max_lateness: float = 0.0
+    avg_lateness: float = 0.0
+
+
+class FleetPollManager:
+    """Schedule polls for every device from one loop.
+
+    Devices are staggered over their interval instead of polling in
+    lock-step, at most `max_concurrent` polls run at once, and the delay
+    between a poll's due time and its actual start is tracked per device.
+    """
+
+    def __init__(self, max_concurrent: int = FLEET_MAX_CONCURRENT) -> None:
+        """Initialize the manager."""
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._entries: dict[str, _Entry] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = 0
+        self._slot = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._poll_tasks: set[asyncio.Task] = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.polls_total = 0
+
+    def async_start(self) -> None:
+        """Start the scheduling loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_run())
+
+    async def async_stop(self) -> None:
+        """Stop the loop and cancel running polls."""
+        tasks = list(self._poll_tasks)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def async_register(self, key: str, poller: Poller) -> Callable[[float], None]:
+        """Add a device and return its reschedule callback.
+
+        The first poll is placed at a staggered offset within the device's
+        interval.
+        """
+        self._slot += 1
+        offset = (self._slot * _GOLDEN_RATIO_FRACTION) % 1.0
+        entry = _Entry(poller, due=time.monotonic() + offset * poller.poll_interval)
+        self._entries[key] = entry
+        self._push(key, entry)
+        return lambda delay: self.async_reschedule(key, delay)
+
+    def async_unregister(self, key: str) -> None:
+        """Remove a device; stale heap items are skipped lazily."""
+        self._entries.pop(key, None)
+
+    def async_reschedule(self, key: str, delay: float) -> None:
+        """Poll a device `delay` seconds from now."""
+        if (entry := self._entries.get(key)) is None:
+            return
+        if entry.running:
+            # The running poll schedules the next one from poll_interval
+            return
+        entry.due = time.monotonic() + delay
+        self._push(key, entry)
+
+    def __len__(self) -> int:
+        """Return the number of registered devices."""
+        return len(self._entries)
+
+    def _push(self, key: str, entry: _Entry) -> None:
+        """Queue the entry's current due time, invalidating older items."""
+        self._seq += 1
+        entry.seq = self._seq
+        heapq.heappush(self._heap, (entry.due, entry.seq, key))
+        if len(self._heap) > 4 * len(self._entries) + 64:
+            self._heap = [
+                (item.due, item.seq, item_key)
+                for item_key, item in self._entries.items()
+                if not item.running
+            ]
+            heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    async def _async_run(self) -> None:
+        """Start polls as they become due."""
+        # Checked as well as cancelled: wait_for can swallow a cancellation
+        # that races with a wakeup
+        while self._task is not None:
+            self._wakeup.clear()
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, key = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                if entry is None or entry.seq != seq or entry.running:
+                    continue
+                entry.running = True
+                task = asyncio.create_task(self._async_poll(key, entry))
+                self._poll_tasks.add(task)
+                task.add_done_callback(self._poll_tasks.discard)
+
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _async_poll(self, key: str, entry: _Entry) -> None:
+        """Run one poll within the concurrency cap and schedule the next."""
+        try:
+            async with self._semaphore:
+                lateness = max(0.0, time.monotonic() - entry.due)
+                entry.last_lateness = lateness
+                entry.max_lateness = max(entry.max_lateness, lateness)
+                entry.avg_lateness += FLEET_LATENESS_SMOOTHING * (lateness - entry.avg_lateness)
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    await entry.poller.async_poll()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Unexpected error polling %s", key)
+                finally:
+                    self.in_flight -= 1
+                    entry.polls += 1
+                    self.polls_total += 1
+        finally:
+            entry.running = False
+
+        if self._entries.get(key) is not entry:
+            return
+        # Anchor on the due time so the stagger does not drift
+        entry.due = max(time.monotonic(), entry.due + entry.poller.poll_interval)
+        self._push(key, entry)
+
+    def as_dict(self, key: str | None = None) -> dict[str, Any]:
+        """Return fleet-wide stats, plus one device's if `key` is given."""
+        data: dict[str, Any] = {
+            "devices": len(self._entries),
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "polls_total": self.polls_total,
+        }
+        if key is not None and (entry := self._entries.get(key)) is not None:
+            data["device"] = {
+                "next_poll_in": round(max(0.0, entry.due - time.monotonic()), 1),
+                "polls": entry.polls,
+                "last_lateness": round(entry.last_lateness, 3),
+                "avg_lateness": round(entry.avg_lateness, 3),
+                "max_lateness": round(entry.max_lateness, 3),
+            }
+        return data
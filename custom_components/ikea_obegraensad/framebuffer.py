@@ -0,0 +1,191 @@
+"""Raw framebuffer streaming for the 16x16 matrix.
+
+Frames go to the device as binary WebSocket messages:
+
+    uint16  sequence number (big endian, wraps around)
+    uint16  row mask, bit n set = row n is included
+    8 bytes per included row, two 4-bit pixels per byte (left pixel in the
+            high nibble)
+
+The first frame after (re)connecting carries all rows, later frames only the
+rows that changed. Frames without changes are not sent at all.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+import logging
+import re
+import struct
+from typing import Any
+
+import aiohttp
+import voluptuous as vol
+
+from .coalescer import LatestWinsWriter
+from .const import FRAME_HEARTBEAT, FRAME_MAX_LEVEL, MATRIX_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+ROW_BYTES = MATRIX_SIZE // 2
+FULL_MASK = (1 << MATRIX_SIZE) - 1
+_HEADER = struct.Struct(">HH")
+_HEX_ROW = re.compile(rf"[0-9a-fA-F]{{{MATRIX_SIZE}}}")
+
+# A frame is its 16 packed rows
+Frame = tuple[bytes, ...]
+
+
+def pack_frame(levels: Sequence[Sequence[int]]) -> Frame:
+    """Pack 16 rows of 16 brightness levels (0-15) without validation."""
+    return tuple(
+        bytes((row[x] << 4) | row[x + 1] for x in range(0, MATRIX_SIZE, 2))
+        for row in levels
+    )
+
+
+def parse_frame(value: Any) -> Frame:
+    """Validate a 16x16 brightness bitmap and pack it.
+
+    Rows are strings of 16 hex digits ("0" off to "f" full brightness) or
+    lists of 16 integers 0-15. A single string with one row per line works
+    too.
+    """
+    if isinstance(value, str):
+        value = value.split()
+    if not isinstance(value, (list, tuple)) or len(value) != MATRIX_SIZE:
+        raise vol.Invalid(f"A frame needs {MATRIX_SIZE} rows")
+    rows: list[bytes] = []
+    for index, row in enumerate(value):
+        if isinstance(row, str):
+            if not _HEX_ROW.fullmatch(row):
+                raise vol.Invalid(f"Row {index} must be {MATRIX_SIZE} hex digits")
+            rows.append(bytes.fromhex(row))
+        elif (
+            isinstance(row, (list, tuple))
+            and len(row) == MATRIX_SIZE
+            and all(isinstance(level, int) and 0 <= level <= FRAME_MAX_LEVEL for level in row)
+        ):
+            rows.extend(pack_frame([row]))
+        else:
+            raise vol.Invalid(
+                f"Row {index} must be {MATRIX_SIZE} levels between 0 and {FRAME_MAX_LEVEL}"
+            )
+    return tuple(rows)
+
+
+def encode_frame(sequence: int, frame: Frame, shown: Frame | None) -> bytes | None:
+    """Return the message for a frame, or None if the device already shows it."""
+    if shown is None:
+        return _HEADER.pack(sequence, FULL_MASK) + b"".join(frame)
+    mask = 0
+    changed: list[bytes] = []
+    for index, (row, old) in enumerate(zip(frame, shown)):
+        if row != old:
+            mask |= 1 << index
+            changed.append(row)
+    if not mask:
+        return None
+    return _HEADER.pack(sequence, mask) + b"".join(changed)
+
+
+class FrameStream:
+    """Send frames to a device over one persistent WebSocket.
+
+    Frames are written latest-wins: while one is on the wire, newer frames
+    replace the pending one, so a producer faster than the link skips
+    intermediate frames instead of building up a queue.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, url: str) -> None:
+        """Initialize the stream (connected on the first frame)."""
+        self._session = session
+        self.url = url
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader: asyncio.Task | None = None
+        # Frame the device currently shows (None: send all rows)
+        self._shown: Frame | None = None
+        self._sequence = 0
+        self._writer: LatestWinsWriter[Frame] = LatestWinsWriter("frame", self._async_send)
+        self.connects = 0
+        self.frames_sent = 0
+        self.frames_unchanged = 0
+        self.bytes_sent = 0
+        self.last_error: str | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the WebSocket is open."""
+        return self._ws is not None and not self._ws.closed
+
+    async def async_draw(self, frame: Frame) -> bool:
+        """Show a frame; return False if it could not be delivered."""
+        return await self._writer.async_write(frame)
+
+    async def _async_send(self, frame: Frame) -> bool:
+        """Write the rows of a frame that the device does not show yet."""
+        try:
+            ws = await self._async_connect()
+            message = encode_frame(self._sequence, frame, self._shown)
+            if message is None:
+                self.frames_unchanged += 1
+                return True
+            await ws.send_bytes(message)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as err:
+            self.last_error = str(err) or type(err).__name__
+            _LOGGER.debug("Frame stream %s failed: %s", self.url, self.last_error)
+            await self._async_close_socket()
+            return False
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        self._shown = frame
+        self.frames_sent += 1
+        self.bytes_sent += len(message)
+        return True
+
+    async def _async_connect(self) -> aiohttp.ClientWebSocketResponse:
+        """Return the open WebSocket, connecting if needed."""
+        if self._ws is not None and not self._ws.closed:
+            return self._ws
+        ws = await self._session.ws_connect(self.url, heartbeat=FRAME_HEARTBEAT)
+        self._ws = ws
+        self._shown = None
+        self.connects += 1
+        self._reader = asyncio.create_task(self._async_read(ws))
+        return ws
+
+    async def _async_read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Drain incoming messages so pings are answered and a close is noticed."""
+        async for _message in ws:
+            pass
+
+    async def async_close(self) -> None:
+        """Drop pending frames and close the WebSocket.
+
+        The device goes back to its effect; the next frame reconnects.
+        """
+        self._writer.async_cancel()
+        await self._async_close_socket()
+
+    async def _async_close_socket(self) -> None:
+        """Close the WebSocket, if open."""
+        ws, self._ws = self._ws, None
+        self._shown = None
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if ws is not None and not ws.closed:
+            await ws.close()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stream state for diagnostics."""
+        return {
+            "url": self.url,
+            "connected": self.connected,
+            "connects": self.connects,
+            "frames_requested": self._writer.requested,
+            "frames_skipped": self._writer.requested - self._writer.sent,
+            "frames_sent": self.frames_sent,
+            "frames_unchanged": self.frames_unchanged,
+            "bytes_sent": self.bytes_sent,
+            "last_error": self.last_error,
+        }
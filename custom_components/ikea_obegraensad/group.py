@@ -0,0 +1,230 @@
+"""Several Ikea Obegraensad clocks controlled as one."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    GROUP_DEFAULT_MAX_CONCURRENT,
+    KEY_AUTO_BRIGHTNESS_ENABLED,
+    KEY_BRIGHTNESS,
+    KEY_CURRENT_EFFECT,
+    KEY_DISPLAY_ENABLED,
+    KEY_TIMEZONE,
+)
+from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .model import DeviceStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _common(values: list[Any]) -> Any:
+    """Return the value all members share, None if they differ."""
+    if values and all(value == values[0] for value in values):
+        return values[0]
+    return None
+
+
+def aggregate_status(statuses: list[DeviceStatus]) -> DeviceStatus:
+    """Combine member statuses into the status shown by the group.
+
+    The display counts as on if any member is on; brightness is the mean;
+    effect, timezone and auto-brightness only show when all members agree.
+    """
+    brightness = [status.brightness for status in statuses if status.brightness is not None]
+    raw: dict[str, Any] = {
+        KEY_DISPLAY_ENABLED: any(status.display_enabled for status in statuses),
+        KEY_BRIGHTNESS: round(sum(brightness) / len(brightness)) if brightness else None,
+        KEY_CURRENT_EFFECT: _common([status.current_effect for status in statuses]),
+        KEY_TIMEZONE: _common([status.timezone for status in statuses]),
+        KEY_AUTO_BRIGHTNESS_ENABLED: _common([status.auto_brightness_enabled for status in statuses]),
+    }
+    return DeviceStatus(raw)
+
+
+class IkeaObegraensadGroupCoordinator(DataUpdateCoordinator[DeviceStatus]):
+    """Send commands to all member clocks at once and mirror their state.
+
+    The group never polls: its status is aggregated whenever a member
+    coordinator updates. Commands run concurrently on all members, at most
+    `max_concurrent` at a time, so a group command takes about as long as
+    the slowest member.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        member_ids: list[str],
+        max_concurrent: int = GROUP_DEFAULT_MAX_CONCURRENT,
+    ) -> None:
+        """Initialize the group coordinator."""
+        super().__init__(hass, _LOGGER, name=f"Ikea Obegraensad group {name}")
+        self.member_ids = list(member_ids)
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._unsub_members: dict[str, Callable[[], None]] = {}
+        # Member updates are folded into one aggregate while a command runs
+        self._commands_running = 0
+        self.changed_keys: frozenset[str] | None = None
+        self.update_stats: dict[str, int] = {"emitted": 0, "suppressed": 0}
+        self.failed_members: list[str] = []
+        self._last_attributes: dict[str, Any] | None = None
+
+    @property
+    def members(self) -> list[IkeaObegraensadDataUpdateCoordinator]:
+        """Return the coordinators of the loaded member clocks."""
+        entries = self.hass.data.get(DOMAIN, {})
+        return [
+            member
+            for entry_id in self.member_ids
+            if isinstance(member := entries.get(entry_id), IkeaObegraensadDataUpdateCoordinator)
+        ]
+
+    @callback
+    def async_attach_members(self) -> None:
+        """Follow the updates of members that are loaded."""
+        entries = self.hass.data.get(DOMAIN, {})
+        for entry_id in self.member_ids:
+            member = entries.get(entry_id)
+            if entry_id in self._unsub_members or not isinstance(
+                member, IkeaObegraensadDataUpdateCoordinator
+            ):
+                continue
+            self._unsub_members[entry_id] = member.async_add_listener(self._async_member_updated)
+        self._async_aggregate()
+
+    @callback
+    def async_detach_member(self, entry_id: str) -> None:
+        """Stop following a member that is being unloaded."""
+        if (unsub := self._unsub_members.pop(entry_id, None)) is not None:
+            unsub()
+            self._async_aggregate()
+
+    async def async_shutdown(self) -> None:
+        """Stop following all members."""
+        await super().async_shutdown()
+        for unsub in self._unsub_members.values():
+            unsub()
+        self._unsub_members.clear()
+
+    @callback
+    def _async_member_updated(self) -> None:
+        """Re-aggregate after a member update (unless a command is running)."""
+        if not self._commands_running:
+            self._async_aggregate()
+
+    @callback
+    def _async_aggregate(self) -> None:
+        """Publish the combined status of the available members."""
+        statuses = [
+            member.data
+            for member in self.members
+            if member.data is not None and member.last_update_success
+        ]
+        attributes = self.member_attributes()
+        members_changed = attributes != self._last_attributes
+        self._last_attributes = attributes
+        if not statuses:
+            # Every member is unreachable or unloaded
+            self.changed_keys = None if members_changed else frozenset()
+            if self.last_update_success or members_changed:
+                self.last_update_success = False
+                self.async_update_listeners()
+            return
+        data = aggregate_status(statuses)
+        # None makes every entity write, which also refreshes the member attributes
+        self.changed_keys = None if members_changed else data.diff(self.data)
+        if members_changed or self.changed_keys or not self.last_update_success:
+            self.async_set_updated_data(data)
+
+    async def _async_update_data(self) -> DeviceStatus:
+        """Aggregate the members' last status; the group itself never polls."""
+        statuses = [member.data for member in self.members if member.data is not None]
+        self.changed_keys = None
+        return aggregate_status(statuses)
+
+    async def _async_fan_out(
+        self,
+        action: str,
+        command: Callable[[IkeaObegraensadDataUpdateCoordinator], Awaitable[bool]],
+    ) -> bool:
+        """Run a command on all members; return True if every member succeeded."""
+        members = self.members
+
+        async def _async_run(member: IkeaObegraensadDataUpdateCoordinator) -> bool:
+            async with self._semaphore:
+                try:
+                    return await command(member)
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.error("Error sending %s to %s: %s", action, member.host, err)
+                    return False
+
+        self._commands_running += 1
+        try:
+            results = await asyncio.gather(*(_async_run(member) for member in members))
+        finally:
+            self._commands_running -= 1
+
+        failed = [member.host for member, ok in zip(members, results) if not ok]
+        if failed:
+            _LOGGER.warning(
+                "%s: %s failed on %d of %d clocks (%s)",
+                self.name,
+                action,
+                len(failed),
+                len(members),
+                ", ".join(failed),
+            )
+        self.failed_members = failed
+        if not self._commands_running:
+            self._async_aggregate()
+        return bool(members) and not failed
+
+    async def async_set_display(self, enabled: bool) -> bool:
+        """Switch all displays on or off."""
+        return await self._async_fan_out("display", lambda member: member.async_set_display(enabled))
+
+    async def async_set_brightness(self, brightness: int) -> bool:
+        """Set the brightness (0-1023) of all clocks."""
+        return await self._async_fan_out(
+            "brightness", lambda member: member.async_set_brightness(brightness)
+        )
+
+    async def async_set_effect(self, effect_name: str) -> bool:
+        """Switch all clocks to an effect."""
+        return await self._async_fan_out("effect", lambda member: member.async_set_effect(effect_name))
+
+    async def async_set_timezone(self, timezone: str) -> bool:
+        """Set the timezone of all clocks."""
+        return await self._async_fan_out("timezone", lambda member: member.async_set_timezone(timezone))
+
+    async def async_set_auto_brightness(self, enabled: bool, **kwargs: Any) -> bool:
+        """Switch auto-brightness of all clocks."""
+        return await self._async_fan_out(
+            "auto-brightness",
+            lambda member: member.async_set_auto_brightness(enabled, **kwargs),
+        )
+
+    def member_attributes(self) -> dict[str, Any]:
+        """Return the state attributes describing the members."""
+        members = self.members
+        return {
+            "members": [member.host for member in members],
+            "available_members": sum(member.last_update_success for member in members),
+            "failed_members": list(self.failed_members),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the group state for diagnostics."""
+        return {
+            "member_entry_ids": self.member_ids,
+            "max_concurrent": self.max_concurrent,
+            **self.member_attributes(),
+        }
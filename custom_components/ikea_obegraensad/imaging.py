@@ -0,0 +1,203 @@
+"""Image and animated GIF conversion for the 16x16 matrix."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import io
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+try:
+    from PIL import Image, ImageOps, ImageSequence
+except ImportError:  # pragma: no cover - installed from the manifest requirements
+    Image = None
+
+from .const import (
+    FRAME_MAX_LEVEL,
+    IMAGE_CACHE_SIZE,
+    IMAGE_DEFAULT_FRAME_DURATION,
+    IMAGE_FETCH_TIMEOUT,
+    IMAGE_MAX_BYTES,
+    IMAGE_MAX_FRAMES,
+    IMAGE_MIN_FRAME_DURATION,
+    MATRIX_SIZE,
+)
+from .framebuffer import Frame
+
+# (frame, seconds shown) for every frame of an image
+FrameSequence = tuple[tuple[Frame, float], ...]
+
+# Palette indexes past the 16 gray levels only ever match white
+_CLAMP_LEVELS = bytes(min(index, FRAME_MAX_LEVEL) for index in range(256))
+
+
+class ImageError(ValueError):
+    """Error to indicate an image cannot be shown."""
+
+
+def content_key(data: bytes, dither: bool) -> str:
+    """Return the cache key of an image and its conversion options."""
+    return f"{hashlib.sha256(data).hexdigest()}:{int(dither)}"
+
+
+def _gray_palette() -> Any:
+    """Return a palette image with the panel's 16 brightness levels."""
+    palette = Image.new("P", (1, 1))
+    levels = [round(level * 255 / FRAME_MAX_LEVEL) for level in range(FRAME_MAX_LEVEL + 1)]
+    levels += [255] * (256 - len(levels))
+    palette.putpalette([value for level in levels for value in (level, level, level)])
+    return palette
+
+
+def _to_frame(image: Any, palette: Any, dither: bool) -> Frame:
+    """Scale one image to the matrix and reduce it to 16 levels."""
+    # Transparent areas are off
+    rgba = image.convert("RGBA")
+    background = Image.new("RGBA", rgba.size, (0, 0, 0, 255))
+    background.alpha_composite(rgba)
+    gray = ImageOps.pad(
+        background.convert("L"),
+        (MATRIX_SIZE, MATRIX_SIZE),
+        method=Image.Resampling.BOX,
+        color=0,
+    )
+    indexed = gray.convert("RGB").quantize(
+        palette=palette,
+        dither=Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE,
+    )
+    levels = indexed.tobytes().translate(_CLAMP_LEVELS)
+    return tuple(
+        bytes(
+            (levels[offset] << 4) | levels[offset + 1]
+            for offset in range(row, row + MATRIX_SIZE, 2)
+        )
+        for row in range(0, MATRIX_SIZE * MATRIX_SIZE, MATRIX_SIZE)
+    )
+
+
+def convert_image(data: bytes, dither: bool = True) -> FrameSequence:
+    """Decode an image or animation into matrix frames.
+
+    Blocking; runs in the executor. Animation frames are decoded one at a
+    time and only their 128-byte result is kept, so long GIFs stay small.
+    Frames past IMAGE_MAX_FRAMES are dropped.
+    """
+    if Image is None:
+        raise ImageError("Pillow is not installed")
+    try:
+        image = Image.open(io.BytesIO(data))
+        palette = _gray_palette()
+        frames: list[tuple[Frame, float]] = []
+        for frame in ImageSequence.Iterator(image):
+            duration = frame.info.get("duration") or IMAGE_DEFAULT_FRAME_DURATION
+            frames.append(
+                (_to_frame(frame, palette, dither), max(duration, IMAGE_MIN_FRAME_DURATION) / 1000)
+            )
+            if len(frames) >= IMAGE_MAX_FRAMES:
+                break
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError) as err:
+        raise ImageError(f"Cannot read image: {err}") from err
+    return tuple(frames)
+
+
+def _read_file(hass: HomeAssistant, path: str) -> bytes:
+    """Read an image file, refusing oversized ones and paths not allowed.
+
+    Runs in the executor: the allowlist check resolves the path on disk.
+    """
+    if not hass.config.is_allowed_path(path):
+        raise ImageError(f"{path} is not in allowlist_external_dirs")
+    try:
+        if os.path.getsize(path) > IMAGE_MAX_BYTES:
+            raise ImageError(f"{path} is larger than {IMAGE_MAX_BYTES} bytes")
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError as err:
+        raise ImageError(f"Cannot read {path}: {err}") from err
+
+
+async def async_load_image(
+    hass: HomeAssistant, path: str | None = None, entity_id: str | None = None
+) -> bytes:
+    """Return the encoded image of a local file or a camera/image entity."""
+    if path is not None:
+        return await hass.async_add_executor_job(_read_file, hass, path)
+
+    if entity_id is None:
+        raise ImageError("No image given")
+    domain = entity_id.split(".", 1)[0]
+    if domain == "camera":
+        # Only loaded when a camera is used
+        from homeassistant.components.camera import async_get_image
+
+        try:
+            data = (await async_get_image(hass, entity_id, timeout=IMAGE_FETCH_TIMEOUT)).content
+        except HomeAssistantError as err:
+            raise ImageError(f"Cannot get image from {entity_id}: {err}") from err
+    elif domain == "image":
+        component = hass.data.get("image")
+        entity = component.get_entity(entity_id) if component is not None else None
+        if entity is None:
+            raise ImageError(f"{entity_id} not found")
+        try:
+            data = await asyncio.wait_for(entity.async_image(), IMAGE_FETCH_TIMEOUT)
+        except asyncio.TimeoutError as err:
+            raise ImageError(f"Timed out getting image from {entity_id}") from err
+    else:
+        raise ImageError(f"{entity_id} is not a camera or image entity")
+    if not data:
+        raise ImageError(f"{entity_id} has no image")
+    if len(data) > IMAGE_MAX_BYTES:
+        raise ImageError(f"Image of {entity_id} is larger than {IMAGE_MAX_BYTES} bytes")
+    return data
+
+
+async def async_get_frames(
+    hass: HomeAssistant, cache: FrameCache, data: bytes, dither: bool
+) -> FrameSequence:
+    """Return the frames of an image, converting it in the executor on a cache miss."""
+    key = await hass.async_add_executor_job(content_key, data, dither)
+    if (frames := cache.get(key)) is None:
+        frames = await hass.async_add_executor_job(convert_image, data, dither)
+        cache.put(key, frames)
+    return frames
+
+
+class FrameCache:
+    """LRU of converted images, keyed by content hash and options."""
+
+    def __init__(self, max_entries: int = IMAGE_CACHE_SIZE) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, FrameSequence] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> FrameSequence | None:
+        """Return a cached conversion and mark it recently used."""
+        if (frames := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return frames
+
+    def put(self, key: str, frames: FrameSequence) -> None:
+        """Store a conversion, evicting the least recently used."""
+        self._entries[key] = frames
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache stats for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "frames": sum(len(frames) for frames in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
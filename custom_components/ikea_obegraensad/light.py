@@ -12,16 +12,16 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     KEY_DISPLAY_ENABLED,
-    KEY_BRIGHTNESS,
     BRIGHTNESS_MAX_API,
     BRIGHTNESS_MAX_HA,
 )
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .entity import IkeaObegraensadEntity, IkeaObegraensadGroupEntity
+from .group import IkeaObegraensadGroupCoordinator
 from . import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,12 +35,17 @@ async def async_setup_entry(
     """Set up the light platform."""
     coordinator: IkeaObegraensadDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     
+    if isinstance(coordinator, IkeaObegraensadGroupCoordinator):
+        async_add_entities([IkeaObegraensadGroupLight(coordinator, entry)])
+        return
+
     async_add_entities([IkeaObegraensadLight(coordinator, entry)])
 
 
-class IkeaObegraensadLight(CoordinatorEntity, LightEntity):
+class IkeaObegraensadLight(IkeaObegraensadEntity, LightEntity):
     """Representation of a Light (Brightness Control)."""
 
+    _watched_keys = frozenset({"brightness"})
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
@@ -69,7 +74,7 @@ class IkeaObegraensadLight(CoordinatorEntity, LightEntity):
         """Return the brightness of the light (0-255)."""
         if self.coordinator.data is None:
             return None
-        api_brightness = self.coordinator.data.get(KEY_BRIGHTNESS, 0)
+        api_brightness = self.coordinator.data.brightness
         # Convert from API range (0-1023) to HA range (0-255)
         if api_brightness is None:
             return None
@@ -99,3 +104,6 @@ class IkeaObegraensadLight(CoordinatorEntity, LightEntity):
         if not success:
             _LOGGER.error("Failed to set brightness to 0")
 
+
+class IkeaObegraensadGroupLight(IkeaObegraensadGroupEntity, IkeaObegraensadLight):
+    """Brightness light controlling every clock of a group."""
@@ -0,0 +1,181 @@
+"""Per-endpoint request metrics for Ikea Obegraensad devices."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime, timezone
+import time
+from typing import Any
+
+from .const import API_EFFECT, LATENCY_BUCKETS_MS, METRICS_ERROR_SMOOTHING
+
+
+def endpoint_name(path: str) -> str:
+    """Return the metrics key for a request path (effect names folded)."""
+    if path.startswith(f"{API_EFFECT}/"):
+        return API_EFFECT
+    return path
+
+
+def _iso(timestamp: float | None) -> str | None:
+    """Format a wall-clock timestamp for diagnostics."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class EndpointStats:
+    """Fixed-size counters for one endpoint.
+
+    Latencies go into the buckets of LATENCY_BUCKETS_MS (plus one overflow
+    bucket), so memory stays constant however long the device runs.
+    """
+
+    __slots__ = (
+        "requests",
+        "timeouts",
+        "client_errors",
+        "http_errors",
+        "rejected",
+        "bytes_received",
+        "buckets",
+        "total_ms",
+        "max_ms",
+        "last_success",
+        "last_error",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.requests = 0
+        self.timeouts = 0
+        self.client_errors = 0
+        self.http_errors: dict[int, int] = {}
+        # Responses cut off by the bounded reader, by reason
+        self.rejected: dict[str, int] = {}
+        self.bytes_received = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_success: float | None = None
+        self.last_error: str | None = None
+
+    def record_latency(self, elapsed_ms: float) -> None:
+        """Count one completed or failed request."""
+        self.requests += 1
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, pct: float) -> float | None:
+        """Estimate a latency percentile (ms) by interpolating within a bucket."""
+        if not self.requests:
+            return None
+        rank = self.requests * pct / 100
+        seen = 0
+        lower = 0.0
+        for index, count in enumerate(self.buckets):
+            upper = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+            if count and seen + count >= rank:
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return round(min(estimate, self.max_ms), 1)
+            seen += count
+            lower = upper
+        return round(self.max_ms, 1)
+
+    @property
+    def errors(self) -> int:
+        """Return all failed requests."""
+        return (
+            self.timeouts
+            + self.client_errors
+            + sum(self.http_errors.values())
+            + sum(self.rejected.values())
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        bounds = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "client_errors": self.client_errors,
+            "http_errors": dict(self.http_errors),
+            "rejected": dict(self.rejected),
+            "bytes_received": self.bytes_received,
+            "latency_ms": {
+                "p50": self.percentile(50),
+                "p95": self.percentile(95),
+                "mean": round(self.total_ms / self.requests, 1) if self.requests else None,
+                "max": round(self.max_ms, 1),
+                "histogram": dict(zip(bounds, self.buckets)),
+            },
+            "last_success": _iso(self.last_success),
+            "last_error": self.last_error,
+        }
+
+
+class DeviceMetrics:
+    """Request metrics of one device, keyed by endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        # Smoothed share of failed requests (all endpoints)
+        self.error_rate = 0.0
+
+    def _stats(self, path: str) -> EndpointStats:
+        """Return the counters of an endpoint, creating them on first use."""
+        name = endpoint_name(path)
+        if (stats := self.endpoints.get(name)) is None:
+            stats = self.endpoints[name] = EndpointStats()
+        return stats
+
+    def _note_outcome(self, failed: bool) -> None:
+        """Update the smoothed error rate."""
+        self.error_rate += METRICS_ERROR_SMOOTHING * (float(failed) - self.error_rate)
+
+    def record_response(self, path: str, started: float, status: int, size: int) -> None:
+        """Record a request that got an HTTP response."""
+        stats = self._stats(path)
+        stats.record_latency((time.monotonic() - started) * 1000)
+        stats.bytes_received += size
+        if 200 <= status < 300:
+            stats.last_success = time.time()
+            self._note_outcome(False)
+        else:
+            stats.http_errors[status] = stats.http_errors.get(status, 0) + 1
+            stats.last_error = f"HTTP {status}"
+            self._note_outcome(True)
+
+    def record_timeout(self, path: str, started: float) -> None:
+        """Record a request that timed out."""
+        stats = self._stats(path)
+        stats.record_latency((time.monotonic() - started) * 1000)
+        stats.timeouts += 1
+        stats.last_error = "timeout"
+        self._note_outcome(True)
+
+    def record_client_error(self, path: str, started: float, err: Exception) -> None:
+        """Record a request that failed below HTTP (connection refused, reset, ...)."""
+        stats = self._stats(path)
+        stats.record_latency((time.monotonic() - started) * 1000)
+        stats.client_errors += 1
+        stats.last_error = type(err).__name__
+        self._note_outcome(True)
+
+    def record_rejected(self, path: str, started: float, reason: str) -> None:
+        """Record a response the bounded reader refused (oversized, stalled, not JSON)."""
+        stats = self._stats(path)
+        stats.record_latency((time.monotonic() - started) * 1000)
+        stats.rejected[reason] = stats.rejected.get(reason, 0) + 1
+        stats.last_error = reason
+        self._note_outcome(True)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all endpoint counters for diagnostics."""
+        return {
+            "error_rate": round(self.error_rate, 4),
+            "endpoints": {name: stats.as_dict() for name, stats in self.endpoints.items()},
+        }
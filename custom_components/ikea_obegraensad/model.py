@@ -0,0 +1,160 @@
+"""Normalized device status for Ikea Obegraensad integration."""
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from .const import (
+    AUTO_BRIGHTNESS_ENABLED_KEYS,
+    EFFECT_KEYS,
+    FIRMWARE_VERSION_KEYS,
+    HARDWARE_ID_KEYS,
+    KEY_AUTO_BRIGHTNESS_MAX,
+    KEY_AUTO_BRIGHTNESS_MIN,
+    KEY_AUTO_BRIGHTNESS_SENSOR_MAX,
+    KEY_AUTO_BRIGHTNESS_SENSOR_MIN,
+    KEY_BRIGHTNESS,
+    KEY_CURRENT_EFFECT,
+    KEY_DISPLAY_ENABLED,
+    KEY_EVENT_STREAM,
+    KEY_FRAME_STREAM,
+    KEY_IP_ADDRESS,
+    KEY_PRESENCE,
+    KEY_SENSOR_VALUE,
+    KEY_STATE_API,
+    KEY_TIME,
+    KEY_TIMEZONE,
+)
+
+# Status field rendered for each API key (used by key-based entity descriptions)
+FIELD_BY_KEY: dict[str, str] = {
+    KEY_DISPLAY_ENABLED: "display_enabled",
+    KEY_BRIGHTNESS: "brightness",
+    KEY_CURRENT_EFFECT: "current_effect",
+    KEY_TIME: "time",
+    KEY_PRESENCE: "presence",
+    KEY_SENSOR_VALUE: "sensor_value",
+    KEY_IP_ADDRESS: "ip_address",
+    KEY_TIMEZONE: "timezone",
+}
+
+# Fields that change on their own and do not count as device-side activity
+VOLATILE_FIELDS = frozenset({"time", "sensor_value"})
+
+
+def _to_bool(value: Any) -> bool | None:
+    """Coerce bool, int or string flags."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "on", "enabled")
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return None
+
+
+def _to_int(value: Any) -> int | None:
+    """Coerce numbers and numeric strings."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_str(value: Any) -> str | None:
+    """Return non-empty strings, None otherwise."""
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+def normalize_hardware_id(value: Any) -> str | None:
+    """Return a MAC or chip id as lowercase hex without separators."""
+    if value is None or isinstance(value, bool):
+        return None
+    normalized = re.sub(r"[^0-9a-f]", "", str(value).lower())
+    # All zeros is what an unconfigured interface reports
+    if not normalized.strip("0"):
+        return None
+    return normalized
+
+
+def _first_present(raw: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Return the value of the first alias key that is set."""
+    for key in keys:
+        if (value := raw.get(key)) is not None and value != "":
+            return value
+    return None
+
+
+class DeviceStatus:
+    """One `/api/status` payload, parsed once.
+
+    Aliases used by different firmware versions are resolved and values are
+    coerced here, so entities only read plain attributes.
+    """
+
+    __slots__ = (
+        "raw",
+        "display_enabled",
+        "brightness",
+        "current_effect",
+        "time",
+        "presence",
+        "sensor_value",
+        "ip_address",
+        "auto_brightness_enabled",
+        "auto_brightness_min",
+        "auto_brightness_max",
+        "auto_brightness_sensor_min",
+        "auto_brightness_sensor_max",
+        "timezone",
+        "firmware_version",
+        "event_stream",
+        "state_api",
+        "frame_stream",
+        "hardware_id",
+    )
+
+    FIELDS: tuple[str, ...] = __slots__[1:]
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        """Parse a raw status payload."""
+        self.raw = raw
+        self.display_enabled = _to_bool(raw.get(KEY_DISPLAY_ENABLED))
+        self.brightness = _to_int(raw.get(KEY_BRIGHTNESS))
+        self.current_effect = _to_str(_first_present(raw, EFFECT_KEYS))
+        self.time = _to_str(raw.get(KEY_TIME))
+        self.presence = _to_bool(raw.get(KEY_PRESENCE))
+        self.sensor_value = _to_int(raw.get(KEY_SENSOR_VALUE))
+        self.ip_address = _to_str(raw.get(KEY_IP_ADDRESS))
+        self.auto_brightness_enabled = _to_bool(_first_present(raw, AUTO_BRIGHTNESS_ENABLED_KEYS))
+        self.auto_brightness_min = _to_int(raw.get(KEY_AUTO_BRIGHTNESS_MIN))
+        self.auto_brightness_max = _to_int(raw.get(KEY_AUTO_BRIGHTNESS_MAX))
+        self.auto_brightness_sensor_min = _to_int(raw.get(KEY_AUTO_BRIGHTNESS_SENSOR_MIN))
+        self.auto_brightness_sensor_max = _to_int(raw.get(KEY_AUTO_BRIGHTNESS_SENSOR_MAX))
+        self.timezone = _to_str(raw.get(KEY_TIMEZONE))
+        self.firmware_version = _to_str(_first_present(raw, FIRMWARE_VERSION_KEYS))
+        self.event_stream = raw.get(KEY_EVENT_STREAM)
+        self.state_api = raw.get(KEY_STATE_API)
+        self.frame_stream = raw.get(KEY_FRAME_STREAM)
+        self.hardware_id = normalize_hardware_id(_first_present(raw, HARDWARE_ID_KEYS))
+
+    def merge(self, changes: dict[str, Any]) -> DeviceStatus:
+        """Return a new status with raw keys replaced."""
+        return DeviceStatus({**self.raw, **changes})
+
+    def diff(self, other: DeviceStatus | None) -> frozenset[str] | None:
+        """Return the fields that differ from `other` (None if unknown)."""
+        if other is None:
+            return None
+        return frozenset(
+            field for field in self.FIELDS if getattr(self, field) != getattr(other, field)
+        )
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"DeviceStatus({fields})"
@@ -9,10 +9,10 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, CONF_CLOCK_DUR, CONF_TEMP_DUR, CONF_HUMI_DUR
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .entity import IkeaObegraensadEntity
 from . import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -77,7 +77,7 @@ async def async_setup_entry(
     )
 
 
-class IkeaObegraensadDurationNumber(CoordinatorEntity, NumberEntity):
+class IkeaObegraensadDurationNumber(IkeaObegraensadEntity, NumberEntity):
     """Number entity for a SensorClock slide duration."""
 
     entity_description: IkeaDurationDescription
@@ -93,6 +93,9 @@ class IkeaObegraensadDurationNumber(CoordinatorEntity, NumberEntity):
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_name = f"{entry.data.get('name', 'Ikea Clock')} {description.name}"
         self._attr_device_info = get_device_info(entry, coordinator)
+        # Durations live on the coordinator, not in the status payload; the
+        # coordinator reports option changes under the attribute name
+        self._watched_keys = frozenset({description.coordinator_attr})
 
     @property
     def native_value(self) -> float:
@@ -0,0 +1,107 @@
+"""Server-sent status events for Ikea Obegraensad devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import Any
+
+import aiohttp
+
+from .const import PUSH_HEARTBEAT_TIMEOUT, PUSH_RECONNECT_MAX
+from .decoder import decode_json
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StatusEventStream:
+    """Follow a device's SSE stream of status deltas.
+
+    Each `data:` event carries a JSON object with the status keys that
+    changed. The stream reconnects with exponential backoff; `on_connected`
+    tells the coordinator when to rely on push and when to fall back to
+    polling.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        on_delta: Callable[[dict[str, Any]], None],
+        on_connected: Callable[[bool], None],
+    ) -> None:
+        """Initialize the stream."""
+        self._session = session
+        self.url = url
+        self._on_delta = on_delta
+        self._on_connected = on_connected
+        self.connected = False
+        self.events_received = 0
+        self.reconnects = 0
+
+    async def async_run(self) -> None:
+        """Keep the stream open until cancelled."""
+        delay = 1.0
+        while True:
+            try:
+                await self._async_consume()
+                delay = 1.0
+            except asyncio.CancelledError:
+                self.connected = False
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                _LOGGER.debug("Status event stream %s dropped: %s", self.url, err)
+            self._set_connected(False)
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PUSH_RECONNECT_MAX)
+
+    async def _async_consume(self) -> None:
+        """Read events until the device closes the stream."""
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=PUSH_HEARTBEAT_TIMEOUT)
+        async with self._session.get(
+            self.url, headers={"Accept": "text/event-stream"}, timeout=timeout
+        ) as response:
+            if response.status != 200:
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message="event stream not available",
+                )
+            self._set_connected(True)
+            data_lines: list[bytes] = []
+            async for raw_line in response.content:
+                line = raw_line.rstrip(b"\r\n")
+                if line.startswith(b"data:"):
+                    data_lines.append(line[5:].lstrip())
+                elif not line and data_lines:
+                    self._dispatch(b"\n".join(data_lines))
+                    data_lines = []
+                # Comments (": ping") and other fields only keep the stream alive
+
+    def _dispatch(self, payload: bytes) -> None:
+        """Decode one event and hand it to the coordinator."""
+        try:
+            delta = decode_json(payload)
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed status event: %s", payload[:200])
+            return
+        if isinstance(delta, dict) and delta:
+            self.events_received += 1
+            self._on_delta(delta)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Report connection changes once."""
+        if connected != self.connected:
+            self.connected = connected
+            self._on_connected(connected)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stream state for diagnostics."""
+        return {
+            "url": self.url,
+            "connected": self.connected,
+            "events_received": self.events_received,
+            "reconnects": self.reconnects,
+        }
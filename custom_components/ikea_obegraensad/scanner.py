@@ -0,0 +1,97 @@
+"""Network scan for Ikea Obegraensad devices."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import logging
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    API_STATUS,
+    SCAN_CONNECT_TIMEOUT,
+    SCAN_MAX_CONCURRENT,
+    SCAN_MAX_HOSTS,
+    SCAN_TIMEOUT,
+)
+from .decoder import ResponseRejected, decode_json, read_body
+from .model import DeviceStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NetworkTooLarge(ValueError):
+    """Error to indicate a scan range has too many hosts."""
+
+
+@dataclass
+class FoundDevice:
+    """A clock that answered the scan."""
+
+    host: str
+    port: int
+    firmware_version: str | None
+    hardware_id: str | None = None
+
+
+def parse_network(value: str) -> list[str]:
+    """Return the host addresses of a CIDR range (or a single address)."""
+    network = ipaddress.ip_network(value.strip(), strict=False)
+    if network.num_addresses > SCAN_MAX_HOSTS + 2:
+        raise NetworkTooLarge(f"{network} has more than {SCAN_MAX_HOSTS} hosts")
+    hosts = list(network.hosts()) or [network.network_address]
+    return [str(host) for host in hosts]
+
+
+def looks_like_clock(payload: Any) -> DeviceStatus | None:
+    """Return the parsed status if a response has the clock's status schema."""
+    if not isinstance(payload, dict):
+        return None
+    status = DeviceStatus(payload)
+    if status.display_enabled is None or status.brightness is None or status.current_effect is None:
+        return None
+    return status
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession,
+    host: str,
+    port: int,
+    semaphore: asyncio.Semaphore,
+) -> FoundDevice | None:
+    """Fetch `/api/status` from one address and fingerprint it."""
+    timeout = aiohttp.ClientTimeout(total=SCAN_TIMEOUT, sock_connect=SCAN_CONNECT_TIMEOUT)
+    async with semaphore:
+        try:
+            async with session.get(f"http://{host}:{port}{API_STATUS}", timeout=timeout) as response:
+                if response.status != 200:
+                    return None
+                # Routers and printers answer too; their pages are cut off early
+                body = await read_body(response, expect_json=True)
+        except (asyncio.TimeoutError, aiohttp.ClientError, ResponseRejected):
+            return None
+    try:
+        status = looks_like_clock(decode_json(body))
+    except ValueError:
+        return None
+    if status is None:
+        return None
+    return FoundDevice(host, port, status.firmware_version, status.hardware_id)
+
+
+async def async_scan_network(
+    session: aiohttp.ClientSession,
+    hosts: list[str],
+    port: int,
+    max_concurrent: int = SCAN_MAX_CONCURRENT,
+) -> list[FoundDevice]:
+    """Probe all hosts concurrently and return the clocks found."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results = await asyncio.gather(
+        *(_async_probe(session, host, port, semaphore) for host in hosts)
+    )
+    found = [device for device in results if device is not None]
+    _LOGGER.debug("Scanned %d addresses on port %s, found %d clocks", len(hosts), port, len(found))
+    return found
@@ -0,0 +1,96 @@
+"""Adaptive poll scheduling for Ikea Obegraensad devices."""
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+from .const import (
+    BACKOFF_MAX_INTERVAL,
+    PUSH_POLL_INTERVAL,
+    FAST_POLL_INTERVAL,
+    FAST_POLL_WINDOW,
+    IDLE_AFTER,
+    IDLE_POLL_FACTOR,
+    IDLE_MAX_INTERVAL,
+    POLL_JITTER,
+)
+
+
+class AdaptivePollScheduler:
+    """Decide how long to wait until the next status poll.
+
+    - a slow keep-alive poll is enough while a push channel is connected
+    - a short fast-poll window follows commands and device-side changes
+    - the base interval applies while the device is reachable and active
+    - polling slows down when nothing changed for a long time
+    - failures back off exponentially (with jitter) up to a ceiling
+    """
+
+    def __init__(self, base_interval: float) -> None:
+        """Initialize the scheduler."""
+        self.base_interval = float(base_interval)
+        self.consecutive_failures = 0
+        self.push_connected = False
+        self.current_interval = self.base_interval
+        self.mode = "base"
+        now = time.monotonic()
+        self._fast_until = 0.0
+        self._last_change = now
+
+    def note_activity(self) -> None:
+        """Open the fast-poll window after a command or device-side change."""
+        now = time.monotonic()
+        self._fast_until = now + FAST_POLL_WINDOW
+        self._last_change = now
+
+    def note_success(self, changed: bool) -> None:
+        """Record a successful poll."""
+        self.consecutive_failures = 0
+        if changed:
+            self.note_activity()
+
+    def note_failure(self) -> None:
+        """Record a failed poll."""
+        self.consecutive_failures += 1
+
+    def reset_failures(self) -> None:
+        """Forget past failures, e.g. after the device moved to a new address."""
+        self.consecutive_failures = 0
+
+    def next_interval(self) -> float:
+        """Compute and remember the delay until the next poll (seconds)."""
+        now = time.monotonic()
+        if self.consecutive_failures:
+            # First failure retries at the base interval, then doubles
+            exponent = min(self.consecutive_failures - 1, 16)
+            interval = min(BACKOFF_MAX_INTERVAL, self.base_interval * 2**exponent)
+            interval *= random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+            self.mode = "backoff"
+        elif self.push_connected:
+            interval = max(self.base_interval, PUSH_POLL_INTERVAL)
+            self.mode = "push"
+        elif now < self._fast_until:
+            interval = min(FAST_POLL_INTERVAL, self.base_interval)
+            self.mode = "fast"
+        elif now - self._last_change > IDLE_AFTER:
+            interval = max(
+                self.base_interval,
+                min(IDLE_MAX_INTERVAL, self.base_interval * IDLE_POLL_FACTOR),
+            )
+            self.mode = "idle"
+        else:
+            interval = self.base_interval
+            self.mode = "base"
+        self.current_interval = float(interval)
+        return self.current_interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "mode": self.mode,
+            "effective_interval": round(self.current_interval, 1),
+            "base_interval": self.base_interval,
+            "consecutive_failures": self.consecutive_failures,
+            "seconds_since_change": round(time.monotonic() - self._last_change, 1),
+        }
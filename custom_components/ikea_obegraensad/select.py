@@ -8,10 +8,11 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, EFFECTS, KEY_CURRENT_EFFECT, TIMEZONES, KEY_TIMEZONE
+from .const import DOMAIN, EFFECTS, TIMEZONES
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .entity import IkeaObegraensadEntity, IkeaObegraensadGroupEntity
+from .group import IkeaObegraensadGroupCoordinator
 from . import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,15 +26,24 @@ async def async_setup_entry(
     """Set up the select platform."""
     coordinator: IkeaObegraensadDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     
+    if isinstance(coordinator, IkeaObegraensadGroupCoordinator):
+        async_add_entities([
+            IkeaObegraensadGroupEffectSelect(coordinator, entry),
+            IkeaObegraensadGroupTimezoneSelect(coordinator, entry),
+        ])
+        return
+
     async_add_entities([
         IkeaObegraensadEffectSelect(coordinator, entry),
         IkeaObegraensadTimezoneSelect(coordinator, entry),
     ])
 
 
-class IkeaObegraensadEffectSelect(CoordinatorEntity, SelectEntity):
+class IkeaObegraensadEffectSelect(IkeaObegraensadEntity, SelectEntity):
     """Representation of an Effect Select."""
 
+    _watched_keys = frozenset({"current_effect"})
+
     def __init__(
         self,
         coordinator: IkeaObegraensadDataUpdateCoordinator,
@@ -52,25 +62,16 @@ class IkeaObegraensadEffectSelect(CoordinatorEntity, SelectEntity):
         """Return the current selected option."""
         if self.coordinator.data is None:
             return None
-        # Try multiple possible field names
-        data = self.coordinator.data
-        effect = (
-            data.get(KEY_CURRENT_EFFECT) or
-            data.get("effect") or
-            data.get("activeEffect") or
-            data.get("current_effect") or
-            data.get("active_effect")
-        )
+        effect = self.coordinator.data.current_effect
         # If effect is found and is in the options list, return it
-        if effect and isinstance(effect, str) and effect in self._attr_options:
+        if effect and effect in self._attr_options:
             return effect
         # Log for debugging if effect not found or not in options
         if effect and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                "Effect '%s' not found in options. Available effects: %s. Available data keys: %s",
+                "Effect '%s' not found in options. Available effects: %s",
                 effect,
                 self._attr_options,
-                list(data.keys())
             )
         return None
 
@@ -81,9 +82,11 @@ class IkeaObegraensadEffectSelect(CoordinatorEntity, SelectEntity):
             _LOGGER.error(f"Failed to set effect to {option}")
 
 
-class IkeaObegraensadTimezoneSelect(CoordinatorEntity, SelectEntity):
+class IkeaObegraensadTimezoneSelect(IkeaObegraensadEntity, SelectEntity):
     """Representation of a Timezone Select."""
 
+    _watched_keys = frozenset({"timezone"})
+
     def __init__(
         self,
         coordinator: IkeaObegraensadDataUpdateCoordinator,
@@ -102,7 +105,7 @@ class IkeaObegraensadTimezoneSelect(CoordinatorEntity, SelectEntity):
         """Return the current selected option."""
         if self.coordinator.data is None:
             return None
-        timezone = self.coordinator.data.get(KEY_TIMEZONE)
+        timezone = self.coordinator.data.timezone
         # If timezone is not in options, return first option (UTC) as default
         if timezone and timezone in self._attr_options:
             return timezone
@@ -114,3 +117,10 @@ class IkeaObegraensadTimezoneSelect(CoordinatorEntity, SelectEntity):
         if not success:
             _LOGGER.error(f"Failed to set timezone to {option}")
 
+
+class IkeaObegraensadGroupEffectSelect(IkeaObegraensadGroupEntity, IkeaObegraensadEffectSelect):
+    """Effect select controlling every clock of a group."""
+
+
+class IkeaObegraensadGroupTimezoneSelect(IkeaObegraensadGroupEntity, IkeaObegraensadTimezoneSelect):
+    """Timezone select controlling every clock of a group."""
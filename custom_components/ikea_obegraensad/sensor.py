@@ -2,15 +2,24 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    API_STATUS,
     DOMAIN,
     KEY_TIME,
     KEY_CURRENT_EFFECT,
@@ -18,7 +27,10 @@ from .const import (
     KEY_SENSOR_VALUE,
     KEY_IP_ADDRESS,
 )
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .entity import IkeaObegraensadEntity
+from .model import FIELD_BY_KEY
 from . import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,6 +66,66 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+@dataclass
+class IkeaMetricDescription(SensorEntityDescription):
+    value_fn: Callable[[IkeaObegraensadDataUpdateCoordinator], float | str | None] = lambda coordinator: None
+
+
+def _poll_latency(pct: float) -> Callable[[IkeaObegraensadDataUpdateCoordinator], float | None]:
+    """Return a reader for a status poll latency percentile."""
+
+    def value(coordinator: IkeaObegraensadDataUpdateCoordinator) -> float | None:
+        stats = coordinator.metrics.endpoints.get(API_STATUS)
+        return stats.percentile(pct) if stats is not None else None
+
+    return value
+
+
+METRIC_DESCRIPTIONS: tuple[IkeaMetricDescription, ...] = (
+    IkeaMetricDescription(
+        key="poll_latency_p50",
+        name="Poll Latency p50",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_poll_latency(50),
+    ),
+    IkeaMetricDescription(
+        key="poll_latency_p95",
+        name="Poll Latency p95",
+        icon="mdi:timer-alert-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_poll_latency(95),
+    ),
+    IkeaMetricDescription(
+        key="request_error_rate",
+        name="Request Error Rate",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: round(coordinator.metrics.error_rate * 100, 1),
+    ),
+    IkeaMetricDescription(
+        key="connection_state",
+        name="Connection State",
+        icon="mdi:lan-connect",
+        device_class=SensorDeviceClass.ENUM,
+        options=[STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.breaker.state,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -66,11 +138,15 @@ async def async_setup_entry(
         IkeaObegraensadSensor(coordinator, entry, description)
         for description in SENSOR_DESCRIPTIONS
     ]
+    entities.extend(
+        IkeaObegraensadMetricSensor(coordinator, entry, description)
+        for description in METRIC_DESCRIPTIONS
+    )
     
     async_add_entities(entities)
 
 
-class IkeaObegraensadSensor(CoordinatorEntity, SensorEntity):
+class IkeaObegraensadSensor(IkeaObegraensadEntity, SensorEntity):
     """Representation of a Sensor."""
 
     def __init__(
@@ -86,25 +162,54 @@ class IkeaObegraensadSensor(CoordinatorEntity, SensorEntity):
         base_name = entry.data.get("name", "Ikea Clock")
         self._attr_name = f"{base_name} {description.name}"
         self._attr_device_info = get_device_info(entry, coordinator)
+        self._field = FIELD_BY_KEY[description.key]
+        self._watched_keys = frozenset({self._field})
 
     @property
     def native_value(self) -> str | int | None:
         """Return the native value of the sensor."""
         if self.coordinator.data is None:
             return None
-        
-        # Special handling for current effect sensor
-        if self.entity_description.key == KEY_CURRENT_EFFECT:
-            data = self.coordinator.data
-            # Try multiple possible field names
-            effect = (
-                data.get(KEY_CURRENT_EFFECT) or
-                data.get("effect") or
-                data.get("activeEffect") or
-                data.get("current_effect") or
-                data.get("active_effect")
-            )
-            return effect if effect else None
-        
-        return self.coordinator.data.get(self.entity_description.key)
+        return getattr(self.coordinator.data, self._field)
+
+
+
+class IkeaObegraensadMetricSensor(IkeaObegraensadEntity, SensorEntity):
+    """Diagnostic sensor reporting request metrics of the device."""
+
+    entity_description: IkeaMetricDescription
+
+    def __init__(
+        self,
+        coordinator: IkeaObegraensadDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: IkeaMetricDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_name = f"{entry.data.get('name', 'Ikea Clock')} {description.name}"
+        self._attr_device_info = get_device_info(entry, coordinator)
+        self._last_value: float | str | None = None
+
+    @property
+    def available(self) -> bool:
+        """Metrics stay meaningful while the device is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> float | str | None:
+        """Return the current metric value."""
+        return self.entity_description.value_fn(self.coordinator)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the metric value changed."""
+        value = self.native_value
+        if value == self._last_value:
+            self.coordinator.update_stats["suppressed"] += 1
+            return
+        self._last_value = value
+        self.coordinator.update_stats["emitted"] += 1
+        self.async_write_ha_state()
@@ -0,0 +1,236 @@
+"""SensorClock push pipeline for Ikea Obegraensad devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    SENSOR_MERGE_WINDOW,
+    SENSOR_PUSH_MAX_CONCURRENT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_state(state: State | None) -> float | None:
+    """Return a sensor state as float, None if it is missing or not numeric."""
+    if state is None or state.state in ("unavailable", "unknown", ""):
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+def sensor_payload(temp: float, humi: float) -> dict[str, str]:
+    """Return the setSensorData parameters (one decimal, as the device shows)."""
+    return {"temp": f"{temp:.1f}", "humi": f"{humi:.1f}"}
+
+
+class SensorPushPipeline:
+    """Decide which temperature/humidity readings reach the device.
+
+    Readings are compared after rounding to the wire format. A reading within
+    the deadband of the last acknowledged payload is dropped. Others wait a
+    short merge window, so temperature and humidity updates arriving together
+    go out as one request. Requests are also spaced at least `min_interval`
+    apart, and only the latest pending reading is sent.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict[str, str]], Awaitable[bool]],
+        deadband: float = DEFAULT_SENSOR_DEADBAND,
+        min_interval: float = DEFAULT_SENSOR_MIN_INTERVAL,
+        merge_window: float = SENSOR_MERGE_WINDOW,
+    ) -> None:
+        """Initialize the pipeline."""
+        self._send = send
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self.merge_window = merge_window
+        self._pending: dict[str, str] | None = None
+        self._acked: dict[str, str] | None = None
+        self._last_sent = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self.sent = 0
+        self.failed = 0
+        self.suppressed_deadband = 0
+        self.suppressed_duplicate = 0
+        self.merged = 0
+
+    def submit(self, temp: float, humi: float) -> None:
+        """Queue a reading; it is sent later unless it is filtered out."""
+        payload = sensor_payload(temp, humi)
+        if self._pending is not None:
+            # A push is already scheduled, it will carry the newest reading
+            self.merged += 1
+            self._pending = payload
+            return
+        if self._within_deadband(payload):
+            self.suppressed_deadband += 1
+            return
+        self._pending = payload
+        delay = max(self.merge_window, self._last_sent + self.min_interval - time.monotonic())
+        self._task = asyncio.create_task(self._async_flush_later(delay))
+
+    async def async_push_now(self, temp: float, humi: float) -> bool:
+        """Send a reading right away, bypassing all filters."""
+        self.async_cancel()
+        return await self._async_send(sensor_payload(temp, humi))
+
+    def async_cancel(self) -> None:
+        """Drop the pending reading and stop the scheduled push."""
+        self._pending = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _within_deadband(self, payload: dict[str, str]) -> bool:
+        """Return True if no value moved by at least the deadband."""
+        if self._acked is None:
+            return False
+        # Small epsilon so a 0.1 step still counts against a 0.1 deadband
+        return all(
+            abs(float(payload[key]) - float(self._acked[key])) < self.deadband - 1e-9
+            for key in payload
+        )
+
+    async def _async_flush_later(self, delay: float) -> None:
+        """Send the pending reading once the delay has passed."""
+        await asyncio.sleep(delay)
+        payload, self._pending = self._pending, None
+        if payload is None:
+            return
+        if payload == self._acked:
+            self.suppressed_duplicate += 1
+            return
+        if self._within_deadband(payload):
+            self.suppressed_deadband += 1
+            return
+        await self._async_send(payload)
+
+    async def _async_send(self, payload: dict[str, str]) -> bool:
+        """Send a payload and remember it if the device accepted it."""
+        self._last_sent = time.monotonic()
+        try:
+            success = await self._send(payload)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("SensorClock: error pushing sensor data: %s", err)
+            success = False
+        if success:
+            self.sent += 1
+            self._acked = payload
+        else:
+            self.failed += 1
+        return success
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        return {
+            "deadband": self.deadband,
+            "min_interval": self.min_interval,
+            "last_acknowledged": self._acked,
+            "pending": self._pending,
+            "sent": self.sent,
+            "failed": self.failed,
+            "suppressed": self.suppressed_deadband + self.suppressed_duplicate,
+            "suppressed_deadband": self.suppressed_deadband,
+            "suppressed_duplicate": self.suppressed_duplicate,
+            "merged": self.merged,
+        }
+
+
+class SensorDispatcher:
+    """Share state listeners on SensorClock source entities between clocks.
+
+    Each source entity gets one state listener, however many clocks show it.
+    A state change is parsed once and handed to every subscribed clock, whose
+    push pipeline decides what to send. Subscriptions are reference counted,
+    so the listener goes away with the last subscriber. Pushes of all clocks
+    share `push_limit`, which caps the requests in flight when one change
+    fans out to many clocks.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = SENSOR_PUSH_MAX_CONCURRENT) -> None:
+        """Initialize without any subscriptions."""
+        self.hass = hass
+        self.max_concurrent = max_concurrent
+        self.push_limit = asyncio.Semaphore(max_concurrent)
+        self._handlers: dict[str, list[Callable[[str, float], None]]] = {}
+        self._values: dict[str, float | None] = {}
+        self._unsubs: dict[str, Callable[[], None]] = {}
+        self.state_changes = 0
+        self.deliveries = 0
+
+    @callback
+    def async_subscribe(self, entity_id: str, handler: Callable[[str, float], None]) -> Callable[[], None]:
+        """Call `handler(entity_id, value)` with every numeric state of an entity.
+
+        Returns a callback that ends the subscription; calling it again does
+        nothing.
+        """
+        handlers = self._handlers.setdefault(entity_id, [])
+        if not handlers:
+            state = self.hass.states.get(entity_id)
+            self._values[entity_id] = value = _parse_state(state)
+            if value is None and state is not None and state.state not in ("unavailable", "unknown", ""):
+                _LOGGER.warning("SensorClock: initial state of %s is not a float: %s", entity_id, state.state)
+            self._unsubs[entity_id] = async_track_state_change_event(
+                self.hass, entity_id, self._async_state_changed
+            )
+            _LOGGER.debug("SensorClock: listening to %s", entity_id)
+        handlers.append(handler)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            if handler not in handlers:
+                return
+            handlers.remove(handler)
+            if not handlers:
+                self._unsubs.pop(entity_id)()
+                del self._handlers[entity_id]
+                self._values.pop(entity_id, None)
+
+        return _async_unsubscribe
+
+    @callback
+    def async_value(self, entity_id: str) -> float | None:
+        """Return the last numeric state of a subscribed entity."""
+        return self._values.get(entity_id)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Parse a new state once and hand it to all subscribers."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        self.state_changes += 1
+        if (value := _parse_state(new_state)) is None:
+            _LOGGER.warning(
+                "SensorClock: %s is %s, skipping push", entity_id, new_state.state if new_state else "None"
+            )
+            return
+        self._values[entity_id] = value
+        for handler in list(self._handlers.get(entity_id, ())):
+            handler(entity_id, value)
+            self.deliveries += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return subscriptions and counters for diagnostics."""
+        return {
+            "sources": {
+                entity_id: {"subscribers": len(handlers), "value": self._values.get(entity_id)}
+                for entity_id, handlers in self._handlers.items()
+            },
+            "max_concurrent_pushes": self.max_concurrent,
+            "state_changes": self.state_changes,
+            "deliveries": self.deliveries,
+        }
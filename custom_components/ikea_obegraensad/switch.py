@@ -8,10 +8,11 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, KEY_AUTO_BRIGHTNESS_ENABLED
+from .const import DOMAIN
 from .coordinator import IkeaObegraensadDataUpdateCoordinator
+from .entity import IkeaObegraensadEntity, IkeaObegraensadGroupEntity
+from .group import IkeaObegraensadGroupCoordinator
 from . import get_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,15 +26,24 @@ async def async_setup_entry(
     """Set up the switch platform."""
     coordinator: IkeaObegraensadDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     
+    if isinstance(coordinator, IkeaObegraensadGroupCoordinator):
+        async_add_entities([
+            IkeaObegraensadGroupDisplaySwitch(coordinator, entry),
+            IkeaObegraensadGroupAutoBrightnessSwitch(coordinator, entry),
+        ])
+        return
+
     async_add_entities([
         IkeaObegraensadDisplaySwitch(coordinator, entry),
         IkeaObegraensadAutoBrightnessSwitch(coordinator, entry),
     ])
 
 
-class IkeaObegraensadDisplaySwitch(CoordinatorEntity, SwitchEntity):
+class IkeaObegraensadDisplaySwitch(IkeaObegraensadEntity, SwitchEntity):
     """Representation of a Display Switch."""
 
+    _watched_keys = frozenset({"display_enabled"})
+
     def __init__(
         self,
         coordinator: IkeaObegraensadDataUpdateCoordinator,
@@ -51,7 +61,7 @@ class IkeaObegraensadDisplaySwitch(CoordinatorEntity, SwitchEntity):
         """Return true if the display is on."""
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("displayEnabled", False)
+        return bool(self.coordinator.data.display_enabled)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the display."""
@@ -66,9 +76,11 @@ class IkeaObegraensadDisplaySwitch(CoordinatorEntity, SwitchEntity):
             _LOGGER.error("Failed to turn off display")
 
 
-class IkeaObegraensadAutoBrightnessSwitch(CoordinatorEntity, SwitchEntity):
+class IkeaObegraensadAutoBrightnessSwitch(IkeaObegraensadEntity, SwitchEntity):
     """Representation of an Auto-Brightness Switch."""
 
+    _watched_keys = frozenset({"auto_brightness_enabled"})
+
     def __init__(
         self,
         coordinator: IkeaObegraensadDataUpdateCoordinator,
@@ -86,24 +98,7 @@ class IkeaObegraensadAutoBrightnessSwitch(CoordinatorEntity, SwitchEntity):
         """Return true if auto-brightness is enabled."""
         if self.coordinator.data is None:
             return None
-        # Try multiple possible field names
-        data = self.coordinator.data
-        enabled = (
-            data.get(KEY_AUTO_BRIGHTNESS_ENABLED) or
-            data.get("autoBrightness") or
-            data.get("autoBrightnessOn") or
-            data.get("auto_brightness_enabled")
-        )
-        # Handle boolean, string, or int values
-        if enabled is None:
-            return False
-        if isinstance(enabled, bool):
-            return enabled
-        if isinstance(enabled, str):
-            return enabled.lower() in ("true", "1", "on", "enabled")
-        if isinstance(enabled, (int, float)):
-            return bool(enabled)
-        return False
+        return bool(self.coordinator.data.auto_brightness_enabled)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on auto-brightness."""
@@ -117,3 +112,10 @@ class IkeaObegraensadAutoBrightnessSwitch(CoordinatorEntity, SwitchEntity):
         if not success:
             _LOGGER.error("Failed to turn off auto-brightness")
 
+
+class IkeaObegraensadGroupDisplaySwitch(IkeaObegraensadGroupEntity, IkeaObegraensadDisplaySwitch):
+    """Display switch controlling every clock of a group."""
+
+
+class IkeaObegraensadGroupAutoBrightnessSwitch(IkeaObegraensadGroupEntity, IkeaObegraensadAutoBrightnessSwitch):
+    """Auto-brightness switch controlling every clock of a group."""
@@ -0,0 +1,77 @@
+"""Resolve service targets to the config entries of loaded clocks."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import SelectedEntities
+
+
+class TargetIndex:
+    """Map entity ids and device ids to the config entry they belong to.
+
+    Filled from the registries when an entry is set up and pruned when it is
+    unloaded, so a service call resolves its targets with dict lookups
+    instead of scanning the registries and `hass.data`. Entity id renames are
+    followed through registry update events.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty index."""
+        self.hass = hass
+        self._entities: dict[str, str] = {}
+        self._devices: dict[str, str] = {}
+        self._unsub_registry: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Follow entity id renames and removals."""
+        self._unsub_registry = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the entity registry."""
+        if self._unsub_registry is not None:
+            self._unsub_registry()
+            self._unsub_registry = None
+
+    @callback
+    def async_add_entry(self, entry_id: str) -> None:
+        """Index the entities and devices of a set up entry."""
+        for entity in er.async_entries_for_config_entry(er.async_get(self.hass), entry_id):
+            self._entities[entity.entity_id] = entry_id
+        for device in dr.async_entries_for_config_entry(dr.async_get(self.hass), entry_id):
+            self._devices[device.id] = entry_id
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop the entities and devices of an unloaded entry."""
+        self._entities = {key: value for key, value in self._entities.items() if value != entry_id}
+        self._devices = {key: value for key, value in self._devices.items() if value != entry_id}
+
+    @callback
+    def async_entry_id(self, entity_id: str) -> str | None:
+        """Return the entry of one entity."""
+        return self._entities.get(entity_id)
+
+    @callback
+    def async_entry_ids(self, selected: SelectedEntities) -> list[str]:
+        """Return the entries of all targeted entities and devices, in order, once each."""
+        entity_ids: Iterable[str] = (*selected.referenced, *selected.indirectly_referenced)
+        found = [self._entities.get(entity_id) for entity_id in entity_ids]
+        found += [self._devices.get(device_id) for device_id in selected.referenced_devices]
+        return [entry_id for entry_id in dict.fromkeys(found) if entry_id is not None]
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Keep renamed entity ids resolvable."""
+        data = event.data
+        if data["action"] == "remove":
+            self._entities.pop(data["entity_id"], None)
+        elif data["action"] == "update" and "old_entity_id" in data:
+            if (entry_id := self._entities.pop(data["old_entity_id"], None)) is not None:
+                self._entities[data["entity_id"]] = entry_id
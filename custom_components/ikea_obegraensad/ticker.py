@@ -0,0 +1,191 @@
+"""Scrolling text for the 16x16 matrix.
+
+Glyphs come from a classic 5x7 font, drawn at twice the size (10x14 with a
+blank row above and below). Text is rasterized once into 16 row bitmasks
+(Python ints, bit x = column x), so every scroll frame is a shift and mask
+per row plus two table lookups to pack it into 4-bit pixels.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import lru_cache
+
+from .const import FRAME_MAX_LEVEL, MATRIX_SIZE
+from .framebuffer import Frame
+
+# 5x7 font: five columns per glyph, bit 0 = top row
+_FONT: dict[str, bytes] = {
+    " ": bytes((0x00, 0x00, 0x00)),
+    "!": bytes((0x00, 0x00, 0x5F, 0x00, 0x00)),
+    '"': bytes((0x00, 0x07, 0x00, 0x07, 0x00)),
+    "#": bytes((0x14, 0x7F, 0x14, 0x7F, 0x14)),
+    "$": bytes((0x24, 0x2A, 0x7F, 0x2A, 0x12)),
+    "%": bytes((0x23, 0x13, 0x08, 0x64, 0x62)),
+    "&": bytes((0x36, 0x49, 0x55, 0x22, 0x50)),
+    "'": bytes((0x00, 0x05, 0x03, 0x00, 0x00)),
+    "(": bytes((0x00, 0x1C, 0x22, 0x41, 0x00)),
+    ")": bytes((0x00, 0x41, 0x22, 0x1C, 0x00)),
+    "*": bytes((0x14, 0x08, 0x3E, 0x08, 0x14)),
+    "+": bytes((0x08, 0x08, 0x3E, 0x08, 0x08)),
+    ",": bytes((0x00, 0x50, 0x30, 0x00, 0x00)),
+    "-": bytes((0x08, 0x08, 0x08, 0x08, 0x08)),
+    ".": bytes((0x00, 0x60, 0x60, 0x00, 0x00)),
+    "/": bytes((0x20, 0x10, 0x08, 0x04, 0x02)),
+    "0": bytes((0x3E, 0x51, 0x49, 0x45, 0x3E)),
+    "1": bytes((0x00, 0x42, 0x7F, 0x40, 0x00)),
+    "2": bytes((0x42, 0x61, 0x51, 0x49, 0x46)),
+    "3": bytes((0x21, 0x41, 0x45, 0x4B, 0x31)),
+    "4": bytes((0x18, 0x14, 0x12, 0x7F, 0x10)),
+    "5": bytes((0x27, 0x45, 0x45, 0x45, 0x39)),
+    "6": bytes((0x3C, 0x4A, 0x49, 0x49, 0x30)),
+    "7": bytes((0x01, 0x71, 0x09, 0x05, 0x03)),
+    "8": bytes((0x36, 0x49, 0x49, 0x49, 0x36)),
+    "9": bytes((0x06, 0x49, 0x49, 0x29, 0x1E)),
+    ":": bytes((0x00, 0x36, 0x36, 0x00, 0x00)),
+    ";": bytes((0x00, 0x56, 0x36, 0x00, 0x00)),
+    "<": bytes((0x08, 0x14, 0x22, 0x41, 0x00)),
+    "=": bytes((0x14, 0x14, 0x14, 0x14, 0x14)),
+    ">": bytes((0x00, 0x41, 0x22, 0x14, 0x08)),
+    "?": bytes((0x02, 0x01, 0x51, 0x09, 0x06)),
+    "@": bytes((0x32, 0x49, 0x79, 0x41, 0x3E)),
+    "A": bytes((0x7E, 0x11, 0x11, 0x11, 0x7E)),
+    "B": bytes((0x7F, 0x49, 0x49, 0x49, 0x36)),
+    "C": bytes((0x3E, 0x41, 0x41, 0x41, 0x22)),
+    "D": bytes((0x7F, 0x41, 0x41, 0x22, 0x1C)),
+    "E": bytes((0x7F, 0x49, 0x49, 0x49, 0x41)),
+    "F": bytes((0x7F, 0x09, 0x09, 0x09, 0x01)),
+    "G": bytes((0x3E, 0x41, 0x49, 0x49, 0x7A)),
+    "H": bytes((0x7F, 0x08, 0x08, 0x08, 0x7F)),
+    "I": bytes((0x00, 0x41, 0x7F, 0x41, 0x00)),
+    "J": bytes((0x20, 0x40, 0x41, 0x3F, 0x01)),
+    "K": bytes((0x7F, 0x08, 0x14, 0x22, 0x41)),
+    "L": bytes((0x7F, 0x40, 0x40, 0x40, 0x40)),
+    "M": bytes((0x7F, 0x02, 0x0C, 0x02, 0x7F)),
+    "N": bytes((0x7F, 0x04, 0x08, 0x10, 0x7F)),
+    "O": bytes((0x3E, 0x41, 0x41, 0x41, 0x3E)),
+    "P": bytes((0x7F, 0x09, 0x09, 0x09, 0x06)),
+    "Q": bytes((0x3E, 0x41, 0x51, 0x21, 0x5E)),
+    "R": bytes((0x7F, 0x09, 0x19, 0x29, 0x46)),
+    "S": bytes((0x46, 0x49, 0x49, 0x49, 0x31)),
+    "T": bytes((0x01, 0x01, 0x7F, 0x01, 0x01)),
+    "U": bytes((0x3F, 0x40, 0x40, 0x40, 0x3F)),
+    "V": bytes((0x1F, 0x20, 0x40, 0x20, 0x1F)),
+    "W": bytes((0x3F, 0x40, 0x38, 0x40, 0x3F)),
+    "X": bytes((0x63, 0x14, 0x08, 0x14, 0x63)),
+    "Y": bytes((0x07, 0x08, 0x70, 0x08, 0x07)),
+    "Z": bytes((0x61, 0x51, 0x49, 0x45, 0x43)),
+    "[": bytes((0x00, 0x7F, 0x41, 0x41, 0x00)),
+    "\\": bytes((0x02, 0x04, 0x08, 0x10, 0x20)),
+    "]": bytes((0x00, 0x41, 0x41, 0x7F, 0x00)),
+    "^": bytes((0x04, 0x02, 0x01, 0x02, 0x04)),
+    "_": bytes((0x40, 0x40, 0x40, 0x40, 0x40)),
+    "`": bytes((0x00, 0x01, 0x02, 0x04, 0x00)),
+    "a": bytes((0x20, 0x54, 0x54, 0x54, 0x78)),
+    "b": bytes((0x7F, 0x48, 0x44, 0x44, 0x38)),
+    "c": bytes((0x38, 0x44, 0x44, 0x44, 0x20)),
+    "d": bytes((0x38, 0x44, 0x44, 0x48, 0x7F)),
+    "e": bytes((0x38, 0x54, 0x54, 0x54, 0x18)),
+    "f": bytes((0x08, 0x7E, 0x09, 0x01, 0x02)),
+    "g": bytes((0x0C, 0x52, 0x52, 0x52, 0x3E)),
+    "h": bytes((0x7F, 0x08, 0x04, 0x04, 0x78)),
+    "i": bytes((0x00, 0x44, 0x7D, 0x40, 0x00)),
+    "j": bytes((0x20, 0x40, 0x44, 0x3D, 0x00)),
+    "k": bytes((0x7F, 0x10, 0x28, 0x44, 0x00)),
+    "l": bytes((0x00, 0x41, 0x7F, 0x40, 0x00)),
+    "m": bytes((0x7C, 0x04, 0x18, 0x04, 0x78)),
+    "n": bytes((0x7C, 0x08, 0x04, 0x04, 0x78)),
+    "o": bytes((0x38, 0x44, 0x44, 0x44, 0x38)),
+    "p": bytes((0x7C, 0x14, 0x14, 0x14, 0x08)),
+    "q": bytes((0x08, 0x14, 0x14, 0x18, 0x7C)),
+    "r": bytes((0x7C, 0x08, 0x04, 0x04, 0x08)),
+    "s": bytes((0x48, 0x54, 0x54, 0x54, 0x20)),
+    "t": bytes((0x04, 0x3F, 0x44, 0x40, 0x20)),
+    "u": bytes((0x3C, 0x40, 0x40, 0x20, 0x7C)),
+    "v": bytes((0x1C, 0x20, 0x40, 0x20, 0x1C)),
+    "w": bytes((0x3C, 0x40, 0x30, 0x40, 0x3C)),
+    "x": bytes((0x44, 0x28, 0x10, 0x28, 0x44)),
+    "y": bytes((0x0C, 0x50, 0x50, 0x50, 0x3C)),
+    "z": bytes((0x44, 0x64, 0x54, 0x4C, 0x44)),
+    "{": bytes((0x00, 0x08, 0x36, 0x41, 0x00)),
+    "|": bytes((0x00, 0x00, 0x7F, 0x00, 0x00)),
+    "}": bytes((0x00, 0x41, 0x36, 0x08, 0x00)),
+    "~": bytes((0x08, 0x04, 0x08, 0x10, 0x08)),
+    "Ä": bytes((0x7D, 0x12, 0x11, 0x12, 0x7D)),
+    "Ö": bytes((0x3D, 0x42, 0x42, 0x42, 0x3D)),
+    "Ü": bytes((0x3D, 0x40, 0x40, 0x40, 0x3D)),
+    "ä": bytes((0x20, 0x55, 0x54, 0x55, 0x78)),
+    "ö": bytes((0x38, 0x45, 0x44, 0x45, 0x38)),
+    "ü": bytes((0x3C, 0x41, 0x40, 0x21, 0x7C)),
+    "ß": bytes((0x7E, 0x01, 0x49, 0x4E, 0x30)),
+    "°": bytes((0x00, 0x06, 0x09, 0x09, 0x06)),
+    "€": bytes((0x14, 0x3E, 0x55, 0x41, 0x22)),
+}
+
+_SCALE = 2
+_TOP = 1  # blank rows above the glyphs
+_SPACING = 1 * _SCALE  # blank columns between glyphs
+_ROW_MASK = (1 << MATRIX_SIZE) - 1
+
+
+@lru_cache(maxsize=None)
+def glyph(char: str) -> tuple[tuple[int, ...], int]:
+    """Return the row bitmasks and width of a glyph, scaled to matrix size.
+
+    Blank columns on both sides are trimmed so text is proportional; unknown
+    characters are drawn as "?".
+    """
+    columns = _FONT.get(char)
+    if columns is None:
+        columns = _FONT["?"]
+    if char != " ":
+        columns = columns.strip(b"\x00")
+    rows = [0] * MATRIX_SIZE
+    for x, column in enumerate(columns):
+        for y in range(7):
+            if column & (1 << y):
+                pixels = ((1 << _SCALE) - 1) << (x * _SCALE)
+                for dy in range(_SCALE):
+                    rows[_TOP + y * _SCALE + dy] |= pixels
+    return tuple(rows), len(columns) * _SCALE
+
+
+@lru_cache(maxsize=64)
+def render_text(text: str) -> tuple[tuple[int, ...], int]:
+    """Rasterize a string into 16 row bitmasks and its width in columns."""
+    rows = [0] * MATRIX_SIZE
+    x = 0
+    for char in text:
+        glyph_rows, width = glyph(char)
+        for y, mask in enumerate(glyph_rows):
+            if mask:
+                rows[y] |= mask << x
+        x += width + _SPACING
+    return tuple(rows), max(x - _SPACING, 0)
+
+
+@lru_cache(maxsize=FRAME_MAX_LEVEL + 1)
+def _byte_table(level: int) -> tuple[bytes, ...]:
+    """Return the packed 4-byte pixels for every 8-pixel bitmask."""
+    table = []
+    for mask in range(256):
+        pixels = [level if mask & (1 << x) else 0 for x in range(8)]
+        table.append(bytes((pixels[x] << 4) | pixels[x + 1] for x in range(0, 8, 2)))
+    return tuple(table)
+
+
+def scroll_frames(text: str, level: int = FRAME_MAX_LEVEL) -> Iterator[Frame]:
+    """Yield the frames of one pass of text scrolling right to left.
+
+    The text enters at the right edge and leaves at the left, one column per
+    frame. Frames are produced on demand.
+    """
+    rows, width = render_text(text)
+    table = _byte_table(level)
+    # Start with a blank matrix, the text just past the right edge
+    padded = [mask << MATRIX_SIZE for mask in rows]
+    for offset in range(width + MATRIX_SIZE + 1):
+        frame = []
+        for mask in padded:
+            window = (mask >> offset) & _ROW_MASK
+            frame.append(table[window & 0xFF] + table[window >> 8])
+        yield tuple(frame)
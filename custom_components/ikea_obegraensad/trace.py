@@ -0,0 +1,179 @@
+"""Opt-in recording of device requests for offline replay."""
+from __future__ import annotations
+
+import base64
+from collections import deque
+from collections.abc import Callable
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    TRACE_BACKUP_COUNT,
+    TRACE_BUFFER_SIZE,
+    TRACE_FLUSH_INTERVAL,
+    TRACE_MAX_FILE_BYTES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _encode_record(record: dict[str, Any]) -> str:
+    """Return one record as a compact JSON line; bodies that are not UTF-8 go base64."""
+    body: bytes = record.pop("body")
+    try:
+        record["b"] = body.decode("utf-8")
+    except UnicodeDecodeError:
+        record["b64"] = base64.b64encode(body).decode("ascii")
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+
+def record_body(record: dict[str, Any]) -> bytes:
+    """Return the response body of a record read from a trace file."""
+    if "b64" in record:
+        return base64.b64decode(record["b64"])
+    return record.get("b", "").encode("utf-8")
+
+
+def trace_files(path: str) -> list[str]:
+    """Return a trace file and its rotated predecessors, oldest first."""
+    files = [f"{path}.{index}" for index in range(TRACE_BACKUP_COUNT, 0, -1)]
+    return [file for file in (*files, path) if os.path.exists(file)]
+
+
+def load_trace(path: str) -> list[dict[str, Any]]:
+    """Read all records of a trace, oldest first (blocking)."""
+    records = []
+    for file in trace_files(path):
+        with open(file, encoding="utf-8") as handle:
+            records.extend(json.loads(line) for line in handle if line.strip())
+    return records
+
+
+def _write_lines(path: str, data: bytes) -> None:
+    """Append to a trace file, rotating it once it reaches the size limit."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        size = 0
+    if size and size + len(data) > TRACE_MAX_FILE_BYTES:
+        for index in range(TRACE_BACKUP_COUNT - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        if TRACE_BACKUP_COUNT:
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+    with open(path, "ab") as handle:
+        handle.write(data)
+
+
+class TraceRecorder:
+    """Keep the latest device requests in a ring buffer and append them to a file.
+
+    Recording only builds a small dict on the event loop. Every
+    TRACE_FLUSH_INTERVAL seconds the records not yet written are encoded and
+    appended in the executor; the file rotates at TRACE_MAX_FILE_BYTES. If
+    more than TRACE_BUFFER_SIZE records arrive between two flushes, the
+    oldest are dropped and counted.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, max_records: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialize an empty recorder."""
+        self.hass = hass
+        self.path = path
+        self.records: deque[dict[str, Any]] = deque(maxlen=max_records)
+        self._unflushed = 0
+        self._unsub_flush: Callable[[], None] | None = None
+        self.recorded = 0
+        self.dropped = 0
+        self.written = 0
+        self.bytes_written = 0
+        self.last_error: str | None = None
+
+    @callback
+    def record(
+        self,
+        method: str,
+        path: str,
+        query: Any,
+        started: float,
+        status: int | None = None,
+        body: bytes = b"",
+        error: str | None = None,
+    ) -> None:
+        """Add one request; `started` is its time.monotonic() start."""
+        now = time.monotonic()
+        record: dict[str, Any] = {
+            "t": round(time.time() - (now - started), 3),
+            "m": method,
+            "p": path,
+            "s": status,
+            "l": round((now - started) * 1000, 1),
+            "body": body,
+        }
+        if query:
+            record["q"] = query
+        if error is not None:
+            record["e"] = error
+        self.records.append(record)
+        self.recorded += 1
+        if self._unflushed == self.records.maxlen:
+            self.dropped += 1
+        else:
+            self._unflushed += 1
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, TRACE_FLUSH_INTERVAL, HassJob(self._async_scheduled_flush, cancel_on_shutdown=True)
+            )
+
+    async def _async_scheduled_flush(self, _now: Any) -> None:
+        """Write the pending records when the flush timer fires."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Append the records recorded since the last flush to the file."""
+        if not self._unflushed:
+            return
+        pending = list(self.records)[-self._unflushed:]
+        self._unflushed = 0
+        try:
+            count, size = await self.hass.async_add_executor_job(self._write, pending)
+        except OSError as err:
+            self.last_error = str(err)
+            _LOGGER.warning("Cannot write request trace %s: %s", self.path, err)
+            return
+        self.written += count
+        self.bytes_written += size
+
+    def _write(self, pending: list[dict[str, Any]]) -> tuple[int, int]:
+        """Encode and append records (runs in the executor)."""
+        data = "".join(_encode_record(dict(record)) for record in pending).encode("utf-8")
+        _write_lines(self.path, data)
+        return len(pending), len(data)
+
+    async def async_close(self) -> None:
+        """Stop the flush timer and write what is left."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self.async_flush()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return recorder stats for diagnostics."""
+        return {
+            "path": self.path,
+            "buffered": len(self.records),
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "bytes_written": self.bytes_written,
+            "last_error": self.last_error,
+        }
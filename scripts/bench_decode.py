@@ -0,0 +1,91 @@
+"""Micro-benchmark for decoding `/api/status` responses.
+
+Compares the previous path (try four charsets, then json.loads on str) with
+decoder.decode_json for typical and malformed payloads.
+
+Usage (from the repository root):
+    python scripts/bench_decode.py [--number 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.ikea_obegraensad import decoder  # noqa: E402
+
+TYPICAL = json.dumps(
+    {
+        "displayEnabled": True,
+        "brightness": 512,
+        "currentEffect": "sensorclock",
+        "time": "12:34:56",
+        "presence": False,
+        "sensorValue": 417,
+        "ipAddress": "192.168.1.100",
+        "autoBrightnessEnabled": True,
+        "autoBrightnessMin": 50,
+        "autoBrightnessMax": 800,
+        "autoBrightnessSensorMin": 100,
+        "autoBrightnessSensorMax": 900,
+        "timezone": "Europe/Berlin",
+        "firmwareVersion": "1.2.13",
+    }
+).encode()
+
+PAYLOADS = {
+    "typical utf-8": TYPICAL,
+    "utf-8 with BOM": b"\xef\xbb\xbf" + TYPICAL,
+    "latin-1 text": TYPICAL.replace(b'"Europe/Berlin"', b'"Z\xfcrich"'),
+    "malformed": TYPICAL[:-20],
+    "html error page": b"<html><body>" + b"x" * 2000 + b"</body></html>",
+}
+
+
+def legacy_decode(body: bytes) -> object:
+    """The decoding path used before the shared decoder module."""
+    for encoding in ("utf-8", "latin-1", "cp1252", "iso-8859-1"):
+        try:
+            text = body.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        text = body.decode("utf-8", errors="replace")
+    return json.loads(text)
+
+
+def _time(func, body: bytes, number: int) -> tuple[float, str]:
+    def call() -> None:
+        try:
+            func(body)
+        except ValueError:
+            pass
+
+    try:
+        func(body)
+        outcome = "ok"
+    except ValueError as err:
+        outcome = type(err).__name__
+    return timeit.timeit(call, number=number) / number * 1e6, outcome
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"fast parser: {'orjson' if decoder.orjson is not None else 'stdlib json'}")
+    print(f"{'payload':<18} {'legacy µs':>10} {'decoder µs':>11} {'speedup':>8}  outcome (legacy / decoder)")
+    for label, body in PAYLOADS.items():
+        legacy, legacy_outcome = _time(legacy_decode, body, args.number)
+        new, new_outcome = _time(decoder.decode_json, body, args.number)
+        print(f"{label:<18} {legacy:>10.2f} {new:>11.2f} {legacy / new:>7.1f}x  {legacy_outcome} / {new_outcome}")
+
+
+if __name__ == "__main__":
+    main()
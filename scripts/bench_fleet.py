@@ -0,0 +1,149 @@
+"""Load test: lock-step per-device polling vs. the fleet poll manager.
+
+Simulates many clocks against one local device simulator and compares the
+old behaviour (every device polls on its own timer, all starting together)
+with FleetPollManager (staggered schedule, capped concurrency).
+
+Usage (from the repository root):
+    python scripts/bench_fleet.py [--devices 200] [--interval 5] [--duration 20]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import os
+import statistics
+import sys
+import time
+
+import aiohttp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.ikea_obegraensad.fleet import FleetPollManager  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+BUCKET = 0.1  # seconds per burst bucket
+
+
+class Recorder:
+    """Collect request start times, concurrency and event-loop lag."""
+
+    def __init__(self) -> None:
+        self.starts: list[float] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.loop_lag: list[float] = []
+
+    async def track_loop_lag(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(0.05)
+            self.loop_lag.append(time.monotonic() - start - 0.05)
+
+
+class SimulatedClock:
+    """Minimal poller with the coordinator's fleet interface."""
+
+    def __init__(self, session: aiohttp.ClientSession, url: str, interval: float, recorder: Recorder) -> None:
+        self._session = session
+        self._url = url
+        self.poll_interval = interval
+        self._recorder = recorder
+
+    async def async_poll(self) -> None:
+        recorder = self._recorder
+        recorder.starts.append(time.monotonic())
+        recorder.in_flight += 1
+        recorder.peak_in_flight = max(recorder.peak_in_flight, recorder.in_flight)
+        try:
+            async with self._session.get(self._url) as response:
+                await response.read()
+        finally:
+            recorder.in_flight -= 1
+
+
+async def _lockstep(clocks: list[SimulatedClock], duration: float) -> None:
+    """Old behaviour: one timer per device, all started at the same moment."""
+
+    async def loop(clock: SimulatedClock) -> None:
+        while True:
+            await clock.async_poll()
+            await asyncio.sleep(clock.poll_interval)
+
+    tasks = [asyncio.create_task(loop(clock)) for clock in clocks]
+    await asyncio.sleep(duration)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _fleet(clocks: list[SimulatedClock], duration: float, concurrency: int) -> FleetPollManager:
+    """New behaviour: one manager schedules every device."""
+    manager = FleetPollManager(max_concurrent=concurrency)
+    for index, clock in enumerate(clocks):
+        manager.async_register(str(index), clock)
+    manager.async_start()
+    await asyncio.sleep(duration)
+    await manager.async_stop()
+    return manager
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _report(label: str, recorder: Recorder, duration: float) -> None:
+    buckets = Counter(int(start / BUCKET) for start in recorder.starts)
+    print(f"{label}")
+    print(f"  requests           {len(recorder.starts):>8}  ({len(recorder.starts) / duration * 60:.0f}/min)")
+    print(f"  peak in flight     {recorder.peak_in_flight:>8}")
+    print(f"  max burst / {BUCKET:.1f}s   {max(buckets.values(), default=0):>8}")
+    print(f"  mean burst / {BUCKET:.1f}s  {statistics.fmean(buckets.values()) if buckets else 0:>8.1f}")
+    print(f"  loop lag p95 (ms)  {_percentile(recorder.loop_lag, 95) * 1000:>8.1f}")
+    print(f"  loop lag max (ms)  {max(recorder.loop_lag, default=0) * 1000:>8.1f}")
+
+
+async def _run(label: str, args: argparse.Namespace, url: str, fleet: bool) -> None:
+    recorder = Recorder()
+    lag_task = asyncio.create_task(recorder.track_loop_lag())
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        clocks = [SimulatedClock(session, url, args.interval, recorder) for _ in range(args.devices)]
+        if fleet:
+            manager = await _fleet(clocks, args.duration, args.concurrency)
+        else:
+            await _lockstep(clocks, args.duration)
+    lag_task.cancel()
+    _report(label, recorder, args.duration)
+    if fleet:
+        lateness = [manager._entries[str(i)].max_lateness for i in range(args.devices)]
+        print(f"  lateness p50/p95/max (ms)  {_percentile(lateness, 50) * 1000:.1f} / "
+              f"{_percentile(lateness, 95) * 1000:.1f} / {max(lateness) * 1000:.1f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=5.0, help="poll interval (seconds)")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="fleet manager concurrency cap")
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated device response time (seconds)")
+    args = parser.parse_args()
+
+    simulator = DeviceSimulator(push=False, latency=args.latency)
+    port = await simulator.start()
+    url = f"http://127.0.0.1:{port}/api/status"
+    try:
+        await _run("lock-step timers", args, url, fleet=False)
+        await _run("fleet manager", args, url, fleet=True)
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
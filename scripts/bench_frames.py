@@ -0,0 +1,109 @@
+"""Raw frame streaming benchmark against a simulated device.
+
+Draws an animation through the coordinator's `async_draw_frame` at a target
+frame rate and reports the frame rate the device received, bytes per frame
+against the 132-byte full frame, draw call latency and event-loop lag.
+
+Animations:
+- progress: a bar that fills up plus a moving dot (one or two rows change)
+- noise: random pixels (every row changes; the worst case for row deltas)
+
+Usage (from the repository root):
+    python scripts/bench_frames.py [--fps 30] [--duration 10] [--animation progress|noise]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.framebuffer import Frame, pack_frame  # noqa: E402
+from bench_integration import LoopLag, _percentile  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+FULL_FRAME_BYTES = 4 + 16 * 8
+
+
+def progress_frame(step: int) -> Frame:
+    """A bar along the bottom rows filling up, plus a dot bouncing above it."""
+    levels = [[0] * 16 for _ in range(16)]
+    filled = step // 4 % 17
+    for y in (14, 15):
+        for x in range(filled):
+            levels[y][x] = 15
+    position = step % 30
+    x = position if position < 16 else 30 - position
+    levels[6][min(x, 15)] = 10
+    return pack_frame(levels)
+
+
+def noise_frame(step: int) -> Frame:
+    """Random pixels in every row."""
+    return tuple(random.randbytes(8) for _ in range(16))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fps", type=float, default=30.0, help="target frame rate")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to draw")
+    parser.add_argument("--animation", choices=("progress", "noise"), default="progress")
+    args = parser.parse_args()
+
+    simulator = DeviceSimulator(push=False)
+    port = await simulator.start()
+    hass = HomeAssistant(tempfile.mkdtemp())
+    coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port)
+    await coordinator.async_refresh()
+    make_frame = progress_frame if args.animation == "progress" else noise_frame
+
+    lag = LoopLag()
+    lag_task = asyncio.create_task(lag.track())
+    draw_samples: list[float] = []
+    frames = int(args.fps * args.duration)
+    failed = 0
+    try:
+        start = time.monotonic()
+        for step in range(frames):
+            # Absolute deadlines, so a slow draw does not lower the rate
+            await asyncio.sleep(max(0.0, start + step / args.fps - time.monotonic()))
+            began = time.monotonic()
+            if not await coordinator.async_draw_frame(make_frame(step)):
+                failed += 1
+            draw_samples.append(time.monotonic() - began)
+        # Let the device read the last message
+        await asyncio.sleep(0.1)
+    finally:
+        lag_task.cancel()
+        stream = coordinator.frame_stream.as_dict() if coordinator.frame_stream else {}
+        await coordinator.async_shutdown()
+        await simulator.stop()
+        await hass.async_stop(force=True)
+
+    received = simulator.frame_count
+    span = (simulator.frame_last or 0) - (simulator.frame_first or 0)
+    print(f"animation {args.animation}, target {args.fps:.0f} fps for {args.duration:.0f}s")
+    print(f"  frames drawn / failed     {frames:>8} / {failed}")
+    print(f"  sent/unchanged/skipped    {stream.get('frames_sent', 0):>8} / "
+          f"{stream.get('frames_unchanged', 0)} / {stream.get('frames_skipped', 0)}")
+    print(f"  received by device        {received:>8}  ({simulator.frame_errors} rejected)")
+    print(f"  device frame rate         {(received - 1) / span if span else 0:>8.1f} fps")
+    print(f"  bytes per frame           {simulator.frame_bytes / max(received, 1):>8.1f}  (full frame {FULL_FRAME_BYTES})")
+    print(f"  draw call p50 / p95       {_percentile(draw_samples, 50) * 1000:.2f} / "
+          f"{_percentile(draw_samples, 95) * 1000:.2f} ms")
+    print(f"  loop lag p95 / max        {_percentile(lag.samples, 95) * 1000:.1f} / "
+          f"{max(lag.samples, default=0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""Group benchmark: one command to many clocks, one by one vs fanned out.
+
+Starts N simulated clocks with request latency, then switches the effect on
+all of them twice: once member after member, once through a group
+coordinator. Reports wall time per command, the group updates its
+listeners saw (one aggregate per command) and the status polls the group
+caused (none; its state comes from the members).
+
+Usage (from the repository root):
+    python scripts/bench_group.py [--clocks 10] [--latency 0.05] [--jitter 0.01] [--max-concurrent 10]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.const import DOMAIN  # noqa: E402
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.group import (  # noqa: E402
+    IkeaObegraensadGroupCoordinator,
+)
+from device_simulator import DeviceSimulator  # noqa: E402
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--max-concurrent", type=int, default=10)
+    args = parser.parse_args()
+
+    simulators = [
+        DeviceSimulator(push=False, latency=args.latency, jitter=args.jitter)
+        for _ in range(args.clocks)
+    ]
+    ports = [await simulator.start() for simulator in simulators]
+    hass = HomeAssistant(tempfile.mkdtemp())
+    coordinators = [IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port) for port in ports]
+    hass.data[DOMAIN] = {f"clock{index}": coordinator for index, coordinator in enumerate(coordinators)}
+    for coordinator in coordinators:
+        await coordinator.async_refresh()
+
+    group = IkeaObegraensadGroupCoordinator(hass, "bench", list(hass.data[DOMAIN]), args.max_concurrent)
+    group.async_attach_members()
+    group_updates = 0
+
+    def _count_update() -> None:
+        nonlocal group_updates
+        group_updates += 1
+
+    unsub = group.async_add_listener(_count_update)
+    try:
+        start = time.monotonic()
+        for coordinator in coordinators:
+            await coordinator.async_set_effect("rain")
+        sequential = time.monotonic() - start
+
+        polls_before = sum(simulator.request_count for simulator in simulators)
+        group_updates = 0
+        start = time.monotonic()
+        ok = await group.async_set_effect("snake")
+        fanned_out = time.monotonic() - start
+        requests = sum(simulator.request_count for simulator in simulators) - polls_before
+    finally:
+        unsub()
+        await group.async_shutdown()
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        for simulator in simulators:
+            await simulator.stop()
+        await hass.async_stop(force=True)
+
+    print(f"{args.clocks} clocks, {args.latency * 1000:.0f} ms latency, at most {args.max_concurrent} at once")
+    print(f"  one by one                {sequential * 1000:>8.0f} ms")
+    print(f"  group fan-out             {fanned_out * 1000:>8.0f} ms  ({sequential / fanned_out:.1f}x)")
+    print(f"  all members succeeded     {str(ok):>8}")
+    print(f"  requests sent             {requests:>8}  (one per clock, no extra polls)")
+    print(f"  group state updates       {group_updates:>8}  (effect now {group.data.current_effect})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
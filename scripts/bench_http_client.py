@@ -0,0 +1,97 @@
+"""Benchmark: new ClientSession per request vs. one persistent device session.
+
+Starts a small local HTTP server that answers like `/api/status` and measures
+round-trips per second for both client strategies.
+
+Usage:
+    python scripts/bench_http_client.py [--requests 500] [--devices 1]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import aiohttp
+from aiohttp import web
+
+STATUS = {
+    "displayEnabled": True,
+    "brightness": 512,
+    "currentEffect": "clock",
+    "time": "12:00:00",
+    "presence": False,
+    "sensorValue": 300,
+    "ipAddress": "127.0.0.1",
+    "autoBrightnessEnabled": False,
+    "timezone": "Europe/Berlin",
+}
+
+# Mirrors DEVICE_CONNECTION_LIMIT / DEVICE_KEEPALIVE_TIMEOUT in const.py
+CONNECTION_LIMIT = 2
+KEEPALIVE_TIMEOUT = 60
+TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+
+async def _handle_status(request: web.Request) -> web.Response:
+    return web.Response(text=json.dumps(STATUS), content_type="application/json")
+
+
+async def _start_server() -> tuple[web.AppRunner, int]:
+    app = web.Application()
+    app.router.add_get("/api/status", _handle_status)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port
+
+
+async def _per_call_session(url: str, count: int) -> None:
+    """Old behaviour: a fresh session (connector, DNS, TCP) for every call."""
+    for _ in range(count):
+        async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
+            async with session.get(url) as response:
+                await response.read()
+
+
+async def _persistent_session(url: str, count: int) -> None:
+    """New behaviour: one keep-alive session reused for every call."""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    async with aiohttp.ClientSession(connector=connector, timeout=TIMEOUT) as session:
+        for _ in range(count):
+            async with session.get(url) as response:
+                await response.read()
+
+
+async def _run(label: str, strategy, url: str, requests: int, devices: int) -> None:
+    start = time.perf_counter()
+    await asyncio.gather(*(strategy(url, requests) for _ in range(devices)))
+    elapsed = time.perf_counter() - start
+    total = requests * devices
+    print(f"{label:<22} {total:>6} requests  {elapsed:7.3f}s  {total / elapsed:9.1f} req/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="requests per device")
+    parser.add_argument("--devices", type=int, default=1, help="concurrent devices")
+    args = parser.parse_args()
+
+    runner, port = await _start_server()
+    url = f"http://127.0.0.1:{port}/api/status"
+    try:
+        await _run("session per request", _per_call_session, url, args.requests, args.devices)
+        await _run("persistent session", _persistent_session, url, args.requests, args.devices)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
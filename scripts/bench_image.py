@@ -0,0 +1,75 @@
+"""Image conversion benchmark: executor conversion and the frame cache.
+
+Generates an animated GIF, converts it through `async_get_frames` (cache miss,
+in the executor) and again (cache hit), and samples event-loop lag during the
+miss to show conversion stays off the loop. Requires Pillow.
+
+Usage (from the repository root):
+    python scripts/bench_image.py [--frames 300] [--size 128]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PIL import Image, ImageDraw  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.imaging import FrameCache, async_get_frames  # noqa: E402
+from bench_integration import LoopLag, _percentile  # noqa: E402
+
+
+def make_gif(frames: int, size: int) -> bytes:
+    """Return an animated GIF of a ball moving across a gradient."""
+    background = Image.linear_gradient("L").resize((size, size)).convert("RGB")
+    images = []
+    for index in range(frames):
+        image = background.copy()
+        x = index * 3 % size
+        ImageDraw.Draw(image).ellipse((x, size // 3, x + size // 4, size // 3 + size // 4), fill=(255, 120, 0))
+        images.append(image)
+    buffer = io.BytesIO()
+    images[0].save(buffer, "GIF", save_all=True, append_images=images[1:], duration=40, loop=0)
+    return buffer.getvalue()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--size", type=int, default=128, help="GIF width and height (pixels)")
+    args = parser.parse_args()
+
+    data = make_gif(args.frames, args.size)
+    hass = HomeAssistant(tempfile.mkdtemp())
+    cache = FrameCache()
+    lag = LoopLag()
+    lag_task = asyncio.create_task(lag.track())
+    try:
+        start = time.monotonic()
+        frames = await async_get_frames(hass, cache, data, True)
+        miss = time.monotonic() - start
+        miss_lag = list(lag.samples)
+        start = time.monotonic()
+        await async_get_frames(hass, cache, data, True)
+        hit = time.monotonic() - start
+    finally:
+        lag_task.cancel()
+        await hass.async_stop(force=True)
+
+    print(f"GIF {args.size}x{args.size}, {args.frames} frames, {len(data) / 1024:.0f} KiB")
+    print(f"  cache miss (executor)     {miss * 1000:>8.1f} ms  ({miss / len(frames) * 1e6:.0f} µs per frame)")
+    print(f"  cache hit                 {hit * 1000:>8.2f} ms")
+    print(f"  frames kept               {len(frames):>8}  ({len(frames) * 128 / 1024:.0f} KiB packed)")
+    print(f"  loop lag p95 / max        {_percentile(miss_lag, 95) * 1000:.1f} / "
+          f"{max(miss_lag, default=0) * 1000:.1f} ms during the miss")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,239 @@
+"""End-to-end benchmark: real coordinators and entities against simulated devices.
+
+Starts one device simulator per clock, a Home Assistant core, one coordinator
+per device on the fleet poll manager and every entity of the integration's
+platforms. A polling phase is followed by a command phase; the report is the
+baseline to compare optimizations against.
+
+Usage (from the repository root):
+    python scripts/bench_integration.py [--devices 20] [--duration 30] [--scan-interval 5]
+        [--latency 0.02] [--jitter 0.01] [--error-rate 0] [--serial] [--push] [--commands 200]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad import (  # noqa: E402
+    binary_sensor,
+    light,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.ikea_obegraensad.const import DOMAIN, EFFECTS  # noqa: E402
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.fleet import FleetPollManager  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+PLATFORM_MODULES = (binary_sensor, light, number, select, sensor, switch)
+
+
+class LoopLag:
+    """Sample how late the event loop wakes up a 50 ms sleeper."""
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+
+    async def track(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(0.05)
+            self.samples.append(time.monotonic() - start - 0.05)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _timed(func, samples: list[float]):
+    """Wrap a coroutine function and record its duration."""
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.monotonic()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            samples.append(time.monotonic() - start)
+
+    return wrapper
+
+
+async def _setup_device(
+    hass: HomeAssistant,
+    index: int,
+    port: int,
+    args: argparse.Namespace,
+    fleet: FleetPollManager,
+    poll_samples: list[float],
+) -> tuple[IkeaObegraensadDataUpdateCoordinator, list[Any]]:
+    """Create a coordinator and all platform entities for one simulated clock."""
+    entry = ConfigEntry(
+        version=2,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"Clock {index}",
+        data={"host": "127.0.0.1", "port": port, "name": f"Clock {index}"},
+        source="user",
+        options={},
+    )
+    coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port, args.scan_interval)
+    coordinator._async_fetch_status = _timed(coordinator._async_fetch_status, poll_samples)
+    await coordinator.async_refresh()
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    entities: list[Any] = []
+    for module in PLATFORM_MODULES:
+        await module.async_setup_entry(hass, entry, entities.extend)
+    for position, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"{entity.__module__.rsplit('.', 1)[-1]}.clock_{index}_{position}"
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state()
+
+    coordinator.async_attach_poll_manager(fleet.async_register(entry.entry_id, coordinator))
+    return coordinator, entities
+
+
+async def _command(coordinator: IkeaObegraensadDataUpdateCoordinator, samples: list[float]) -> bool:
+    """Send one random command the way the entities would."""
+    start = time.monotonic()
+    kind = random.randrange(3)
+    if kind == 0:
+        result = await coordinator.async_set_brightness(random.randint(0, 1023))
+    elif kind == 1:
+        result = await coordinator.async_set_effect(random.choice(EFFECTS))
+    else:
+        result = await coordinator.async_set_display(random.random() < 0.5)
+    samples.append(time.monotonic() - start)
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of the polling phase")
+    parser.add_argument("--scan-interval", type=int, default=5, help="base poll interval (seconds)")
+    parser.add_argument("--commands", type=int, default=200, help="commands sent in the command phase")
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated response time (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra response time (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with HTTP 500")
+    parser.add_argument("--serial", action="store_true", help="simulate one request at a time per device")
+    parser.add_argument("--push", action="store_true", help="advertise the status event stream")
+    args = parser.parse_args()
+
+    # Entities are added without an entity platform; skip the per-entity report
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+
+    simulators = [
+        DeviceSimulator(
+            push=args.push,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            serial=args.serial,
+        )
+        for _ in range(args.devices)
+    ]
+    ports = [await simulator.start() for simulator in simulators]
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    hass.data[DOMAIN] = {}
+    state_writes = 0
+
+    def _count_write(event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+
+    fleet = FleetPollManager()
+    poll_samples: list[float] = []
+    devices = [
+        await _setup_device(hass, index, port, args, fleet, poll_samples)
+        for index, port in enumerate(ports)
+    ]
+    coordinators = [coordinator for coordinator, _ in devices]
+    entity_count = sum(len(entities) for _, entities in devices)
+
+    lag = LoopLag()
+    lag_task = asyncio.create_task(lag.track())
+    try:
+        # Polling phase
+        poll_samples.clear()
+        state_writes = 0
+        requests_before = sum(simulator.request_count for simulator in simulators)
+        fleet.async_start()
+        await asyncio.sleep(args.duration)
+        poll_requests = sum(simulator.request_count for simulator in simulators) - requests_before
+        poll_writes = state_writes
+        poll_lag = list(lag.samples)
+        polls = list(poll_samples)
+
+        # Command phase
+        lag.samples.clear()
+        command_samples: list[float] = []
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(_command(coordinators[i % len(coordinators)], command_samples) for i in range(args.commands))
+        )
+        command_elapsed = time.monotonic() - start
+        command_lag = list(lag.samples)
+    finally:
+        lag_task.cancel()
+        await fleet.async_stop()
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        for simulator in simulators:
+            await simulator.stop()
+        await hass.async_stop(force=True)
+
+    writers = [writer for coordinator in coordinators for writer in coordinator._writers]
+    suppressed = sum(c.update_stats["suppressed"] for c in coordinators)
+    emitted = sum(c.update_stats["emitted"] for c in coordinators)
+    print(f"devices {args.devices}, entities {entity_count}, scan interval {args.scan_interval}s, "
+          f"latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms, error rate {args.error_rate:.0%}"
+          f"{', serial' if args.serial else ''}{', push' if args.push else ''}")
+    print("polling phase")
+    print(f"  polls                     {len(polls):>8}")
+    print(f"  poll latency p50/p95/p99  {_percentile(polls, 50) * 1000:.1f} / "
+          f"{_percentile(polls, 95) * 1000:.1f} / {_percentile(polls, 99) * 1000:.1f} ms")
+    print(f"  requests / min            {poll_requests / args.duration * 60:>8.0f}")
+    print(f"  state writes / min        {poll_writes / args.duration * 60:>8.0f}")
+    print(f"  entity updates emitted    {emitted:>8}  (suppressed {suppressed})")
+    print(f"  loop lag p95 / max        {_percentile(poll_lag, 95) * 1000:.1f} / "
+          f"{max(poll_lag, default=0) * 1000:.1f} ms")
+    print("command phase")
+    print(f"  commands                  {args.commands:>8}  ({sum(results)} succeeded)")
+    print(f"  throughput                {args.commands / command_elapsed:>8.0f} commands/s")
+    print(f"  command latency p50/p95   {_percentile(command_samples, 50) * 1000:.1f} / "
+          f"{_percentile(command_samples, 95) * 1000:.1f} ms")
+    print(f"  writes requested / sent   {sum(w.requested for w in writers)} / {sum(w.sent for w in writers)}")
+    print(f"  loop lag p95 / max        {_percentile(command_lag, 95) * 1000:.1f} / "
+          f"{max(command_lag, default=0) * 1000:.1f} ms")
+    if args.error_rate:
+        errors = sum(simulator.error_count for simulator in simulators)
+        print(f"simulated errors            {errors:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
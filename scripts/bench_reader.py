@@ -0,0 +1,171 @@
+"""Misbehaving device benchmark: unbounded reads vs. the bounded reader.
+
+Serves four kinds of broken `/api/status` responses (a huge chunked body, a
+huge body with Content-Length, a body trickling one byte at a time and a
+captive portal HTML page) next to a healthy simulated clock. For each, a
+sick clock is polled a few times, first the way responses used to be read
+(`response.read()` and decode) and then through the coordinator's bounded
+reader, while the healthy clock is polled alongside. Reports time per sick
+poll, peak memory allocated during the sick polls and the healthy clock's
+poll latency.
+
+Usage (from the repository root):
+    python scripts/bench_reader.py [--polls 3] [--size-mb 20]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.breaker import CircuitBreaker  # noqa: E402
+from custom_components.ikea_obegraensad.const import API_STATUS, DEFAULT_TIMEOUT  # noqa: E402
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.decoder import decode_json  # noqa: E402
+from bench_integration import _percentile  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+CHUNK = b" " * 65536
+
+
+class SickDevice:
+    """Serve one kind of broken status response."""
+
+    def __init__(self, mode: str, size: int) -> None:
+        self.mode = mode
+        self.size = size
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> int:
+        app = web.Application()
+        app.router.add_get(API_STATUS, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if self.mode == "portal":
+            page = b"<html><body>" + b"Please log in. " * 15000 + b"</body></html>"
+            return web.Response(body=page, content_type="text/html")
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        if self.mode == "announced":
+            response.content_length = self.size + 2
+        await response.prepare(request)
+        try:
+            if self.mode == "trickle":
+                await response.write(b"{")
+                for _ in range(100):
+                    await asyncio.sleep(0.3)
+                    await response.write(b" ")
+            else:
+                await response.write(b"{")
+                for _ in range(self.size // len(CHUNK)):
+                    await response.write(CHUNK)
+                await response.write(b"}")
+        except (ConnectionResetError, RuntimeError):
+            pass
+        return response
+
+
+async def _unbounded_poll(session: aiohttp.ClientSession, url: str) -> None:
+    """Read a status response the way it was read before the bounded reader."""
+    try:
+        async with session.get(url) as response:
+            body = await response.read()
+        decode_json(body)
+    except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
+        pass
+
+
+async def _bounded_poll(coordinator: IkeaObegraensadDataUpdateCoordinator) -> None:
+    await coordinator.async_refresh()
+
+
+async def _watch_healthy(healthy: IkeaObegraensadDataUpdateCoordinator, samples: list[float]) -> None:
+    while True:
+        start = time.monotonic()
+        await healthy.async_refresh()
+        samples.append(time.monotonic() - start)
+        await asyncio.sleep(0.05)
+
+
+async def _run(poll, polls: int, healthy: IkeaObegraensadDataUpdateCoordinator) -> tuple[float, float, list[float]]:
+    """Poll the sick device; return seconds per poll, peak MB and healthy latencies."""
+    samples: list[float] = []
+    watcher = asyncio.create_task(_watch_healthy(healthy, samples))
+    tracemalloc.start()
+    start = time.monotonic()
+    for _ in range(polls):
+        await poll()
+    elapsed = (time.monotonic() - start) / polls
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    watcher.cancel()
+    return elapsed, peak, samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=3, help="polls of the sick clock per mode")
+    parser.add_argument("--size-mb", type=int, default=20, help="size of the huge responses")
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.ikea_obegraensad").setLevel(logging.CRITICAL)
+    logging.getLogger("homeassistant").setLevel(logging.CRITICAL)
+
+    simulator = DeviceSimulator(push=False)
+    hass = HomeAssistant(tempfile.mkdtemp())
+    healthy = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", await simulator.start())
+    session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT))
+    print(f"sick clock polled {args.polls}x per mode, healthy clock polled alongside")
+    print(f"  {'mode':<10} {'reader':<10} {'per poll':>9} {'peak MB':>8} {'healthy p95':>12}")
+    try:
+        for mode in ("chunked", "announced", "trickle", "portal"):
+            sick = SickDevice(mode, args.size_mb * 1024 * 1024)
+            port = await sick.start()
+            coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port)
+            # Measure every poll instead of failing fast after the breaker opens
+            coordinator.breaker = CircuitBreaker(failure_threshold=args.polls + 1)
+            url = f"http://127.0.0.1:{port}{API_STATUS}"
+            runs = (
+                ("unbounded", lambda: _unbounded_poll(session, url)),
+                ("bounded", lambda: _bounded_poll(coordinator)),
+            )
+            for label, poll in runs:
+                elapsed, peak, samples = await _run(poll, args.polls, healthy)
+                print(f"  {mode:<10} {label:<10} {elapsed * 1000:>7.0f}ms {peak:>8.1f} "
+                      f"{_percentile(samples, 95) * 1000:>10.1f}ms")
+            rejected = {
+                name: stats.rejected for name, stats in coordinator.metrics.endpoints.items() if stats.rejected
+            }
+            print(f"  {'':<10} rejected   {rejected}")
+            await coordinator.async_shutdown()
+            await sick.stop()
+    finally:
+        await session.close()
+        await healthy.async_shutdown()
+        await simulator.stop()
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
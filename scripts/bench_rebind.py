@@ -0,0 +1,150 @@
+"""IP change benchmark: a clock gets a new DHCP lease.
+
+N simulated clocks (each reporting a MAC address) are polled by the fleet
+poll manager, as in Home Assistant. Then every clock moves to a new address;
+its old address stops answering (connections hang like a vanished host).
+
+- without rebind: the coordinators keep polling the old address for the
+  observation window, as they did when entries were keyed by `host:port`
+- with rebind: a zeroconf announcement arrives `--announce-delay` seconds
+  after the move and the new address is applied the way the config flow's
+  entry update does it (`async_set_address`, no reload)
+
+Reports failed polls, time spent in failing polls and the time from the
+move until each clock answers again.
+
+Usage (from the repository root):
+    python scripts/bench_rebind.py [--clocks 10] [--window 30] [--announce-delay 1]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.fleet import FleetPollManager  # noqa: E402
+from bench_integration import _percentile  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+
+class PollLog:
+    """Count the polls of one clock after it moved."""
+
+    def __init__(self, coordinator: IkeaObegraensadDataUpdateCoordinator) -> None:
+        self.coordinator = coordinator
+        self.moved_at: float | None = None
+        self.failed = 0
+        self.failed_seconds = 0.0
+        self.recovered_after: float | None = None
+        self._poll = coordinator.async_poll
+        coordinator.async_poll = self.async_poll
+
+    async def async_poll(self) -> None:
+        start = time.monotonic()
+        await self._poll()
+        if self.moved_at is None or self.recovered_after is not None:
+            return
+        if self.coordinator.last_update_success:
+            self.recovered_after = time.monotonic() - self.moved_at
+        else:
+            self.failed += 1
+            self.failed_seconds += time.monotonic() - start
+
+
+async def _hang(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Accept and never answer, like an address nobody holds any more."""
+    await reader.read()
+    writer.close()
+
+
+async def _run(clocks: int, window: float, announce_delay: float | None) -> list[PollLog]:
+    """Move all clocks once and observe recovery for `window` seconds."""
+    simulators = [
+        DeviceSimulator(push=False, mac=f"aa:bb:cc:00:00:{index:02x}") for index in range(clocks)
+    ]
+    ports = [await simulator.start() for simulator in simulators]
+    hass = HomeAssistant(tempfile.mkdtemp())
+    fleet = FleetPollManager()
+    fleet.async_start()
+    logs: list[PollLog] = []
+    for index, port in enumerate(ports):
+        coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port, scan_interval=5)
+        coordinator.hardware_id = f"aabbcc0000{index:02x}"
+        await coordinator.async_refresh()
+        coordinator.async_attach_poll_manager(fleet.async_register(str(index), coordinator))
+        logs.append(PollLog(coordinator))
+    await asyncio.sleep(1)
+
+    # New leases: each clock answers on a new port, the old one hangs
+    hang_servers = []
+    new_ports = []
+    moved_at = time.monotonic()
+    for simulator, port, log in zip(simulators, ports, logs):
+        await simulator.stop()
+        hang_servers.append(await asyncio.start_server(_hang, "127.0.0.1", port))
+        new_ports.append(await simulator.start())
+        log.moved_at = moved_at
+
+    try:
+        if announce_delay is not None:
+            await asyncio.sleep(announce_delay)
+            await asyncio.gather(
+                *(log.coordinator.async_set_address("127.0.0.1", port) for log, port in zip(logs, new_ports))
+            )
+            # The rebind polls right away; later polls are not part of the recovery
+            for log in logs:
+                if log.recovered_after is None and log.coordinator.last_update_success:
+                    log.recovered_after = time.monotonic() - moved_at
+        deadline = moved_at + window
+        while time.monotonic() < deadline and any(log.recovered_after is None for log in logs):
+            await asyncio.sleep(0.1)
+    finally:
+        await fleet.async_stop()
+        for log in logs:
+            await log.coordinator.async_shutdown()
+        for server in hang_servers:
+            server.close()
+        for simulator in simulators:
+            await simulator.stop()
+        await hass.async_stop(force=True)
+    return logs
+
+
+def _report(label: str, logs: list[PollLog], window: float) -> None:
+    recovered = [log.recovered_after for log in logs if log.recovered_after is not None]
+    failed = sum(log.failed for log in logs)
+    waited = sum(log.failed_seconds for log in logs)
+    print(f"  {label}")
+    print(f"    failed polls              {failed:>8}  ({waited:.0f} s spent in them)")
+    print(f"    clocks back               {len(recovered):>8} of {len(logs)} within {window:.0f} s")
+    if recovered:
+        print(f"    back after p50 / max      {_percentile(recovered, 50):>8.2f} / {max(recovered):.2f} s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", type=int, default=10)
+    parser.add_argument("--window", type=float, default=30.0, help="seconds observed after the move")
+    parser.add_argument("--announce-delay", type=float, default=1.0, help="seconds until the mDNS announcement")
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.ikea_obegraensad").setLevel(logging.CRITICAL)
+
+    print(f"{args.clocks} clocks move to a new address, 5 s poll interval")
+    _report("without rebind", await _run(args.clocks, args.window, None), args.window)
+    _report("with rebind", await _run(args.clocks, args.window, args.announce_delay), args.window)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""SensorClock fan-out benchmark: many clocks showing the same sensors.
+
+N simulated clocks all show one temperature and one humidity sensor. The
+sensors change a few times and each change has to reach every clock. Two
+set-ups are compared for several N:
+
+- per clock: every coordinator listens to the sensors on its own (one
+  listener, one parse and an unbounded push per clock and change)
+- shared: all coordinators subscribe through one dispatcher (one listener
+  and one parse per change, pushes capped by the shared limit)
+
+The push pipelines' merge window, deadband and rate limit are turned off so
+only the fan-out is measured. Reports listener calls per change, the time
+until the last clock has the new values and the most pushes in flight.
+
+Usage (from the repository root):
+    python scripts/bench_sensor_fanout.py [--clocks 1,5,15,30] [--changes 5] [--latency 0.05]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.const import (  # noqa: E402
+    CONF_HUMI_ENTITY,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_TEMP_ENTITY,
+)
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.sensorpush import SensorDispatcher  # noqa: E402
+from bench_integration import _percentile  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+TEMP = "sensor.outdoor_temperature"
+HUMI = "sensor.outdoor_humidity"
+CONFIG = {
+    CONF_TEMP_ENTITY: TEMP,
+    CONF_HUMI_ENTITY: HUMI,
+    CONF_SENSOR_DEADBAND: 0,
+    CONF_SENSOR_MIN_INTERVAL: 0,
+}
+
+
+class InFlight:
+    """Track sensor pushes in flight across all clocks."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    def wrap(self, coordinator: IkeaObegraensadDataUpdateCoordinator) -> None:
+        send = coordinator._async_send_command
+
+        async def _send(path, params=None):
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            try:
+                return await send(path, params)
+            finally:
+                self.current -= 1
+
+        coordinator._async_send_command = _send
+
+
+async def _run(clocks: int, changes: int, latency: float, shared: bool) -> tuple[float, list[float], int]:
+    """Return listener calls per change, fan-out latencies and peak pushes in flight."""
+    simulators = [DeviceSimulator(push=False, latency=latency, serial=True) for _ in range(clocks)]
+    ports = [await simulator.start() for simulator in simulators]
+    hass = HomeAssistant(tempfile.mkdtemp())
+    hass.states.async_set(TEMP, "20.0")
+    hass.states.async_set(HUMI, "50.0")
+    dispatcher = SensorDispatcher(hass)
+    in_flight = InFlight()
+    coordinators = []
+    for port in ports:
+        coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port)
+        coordinator.sensor_push.merge_window = 0
+        if shared:
+            coordinator.async_attach_sensor_dispatcher(dispatcher)
+        in_flight.wrap(coordinator)
+        await coordinator.async_setup_sensor_listeners(hass, CONFIG)
+        coordinators.append(coordinator)
+    # Let the initial sync (slide config and current values) settle
+    await asyncio.sleep(1 + latency * 4)
+    in_flight.peak = 0
+    dispatchers = {id(coordinator._sensor_dispatcher): coordinator._sensor_dispatcher for coordinator in coordinators}
+    calls_before = sum(item.state_changes for item in dispatchers.values())
+
+    latencies = []
+    try:
+        for change in range(changes):
+            humi = f"{51 + change:.1f}"
+            start = time.monotonic()
+            hass.states.async_set(HUMI, humi)
+            while any(simulator.sensor_data.get("humi") != humi for simulator in simulators):
+                await asyncio.sleep(0.002)
+            latencies.append(time.monotonic() - start)
+            # The device stores the values before its (delayed) answer arrives
+            while in_flight.current:
+                await asyncio.sleep(0.002)
+    finally:
+        for coordinator in coordinators:
+            coordinator._unsub_state_listener()
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+        for simulator in simulators:
+            await simulator.stop()
+    calls = sum(item.state_changes for item in dispatchers.values()) - calls_before
+    return calls / changes, latencies, in_flight.peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", default="1,5,15,30", help="comma-separated clock counts")
+    parser.add_argument("--changes", type=int, default=5, help="sensor changes per run")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    args = parser.parse_args()
+
+    logging.getLogger("custom_components.ikea_obegraensad").setLevel(logging.ERROR)
+
+    print(f"{args.changes} humidity changes, {args.latency * 1000:.0f} ms per request")
+    print(f"  {'clocks':>6} {'set-up':<10} {'listener calls':>15} {'fan-out p50':>12} {'max':>9} {'in flight':>10}")
+    for clocks in (int(value) for value in args.clocks.split(",")):
+        for label, shared in (("per clock", False), ("shared", True)):
+            calls, latencies, peak = await _run(clocks, args.changes, args.latency, shared)
+            print(f"  {clocks:>6} {label:<10} {calls:>15.0f} {_percentile(latencies, 50) * 1000:>10.0f}ms "
+                  f"{max(latencies) * 1000:>7.0f}ms {peak:>10}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""Startup benchmark: time to set up N config entries, cold and warm.
+
+Runs the integration's real `async_setup_entry` for N clocks against local
+device simulators, twice:
+
+- cold: no stored status yet, every entry waits for its first poll
+- warm: a restart with the last known status stored; some clocks are made
+  unresponsive (they hang past the request timeout) to show they no longer
+  hold up startup or fail with ConfigEntryNotReady
+
+Platforms are set up directly (without the entity platform machinery), the
+same way bench_integration.py does it.
+
+Usage (from the repository root):
+    python scripts/bench_startup.py [--entries 20] [--latency 0.3] [--offline 2]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.exceptions import ConfigEntryNotReady  # noqa: E402
+from homeassistant.helpers import area_registry as ar  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+import custom_components.ikea_obegraensad as integration  # noqa: E402
+from custom_components.ikea_obegraensad import (  # noqa: E402
+    binary_sensor,
+    light,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.ikea_obegraensad.const import DEFAULT_TIMEOUT, DOMAIN  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+PLATFORM_MODULES = (binary_sensor, light, number, select, sensor, switch)
+
+
+class PlatformSetup:
+    """Stand-in for hass.config_entries that only forwards to the platforms."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.entities: list[Any] = []
+
+    async def async_forward_entry_setups(self, entry: ConfigEntry, platforms: Any) -> None:
+        for module in PLATFORM_MODULES:
+            await module.async_setup_entry(self.hass, entry, self.entities.extend)
+
+    async def async_unload_platforms(self, entry: ConfigEntry, platforms: Any) -> bool:
+        return True
+
+
+async def load_registries(hass: HomeAssistant) -> None:
+    """Load the (empty) registries the integration indexes its targets from."""
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+
+
+def _entries(ports: list[int]) -> list[ConfigEntry]:
+    return [
+        ConfigEntry(
+            version=2,
+            minor_version=1,
+            domain=DOMAIN,
+            title=f"Clock {index}",
+            data={"host": "127.0.0.1", "port": port, "name": f"Clock {index}"},
+            source="user",
+            options={},
+            entry_id=f"bench{index:04d}",
+        )
+        for index, port in enumerate(ports)
+    ]
+
+
+async def _timed_setup(hass: HomeAssistant, entry: ConfigEntry) -> tuple[float, str]:
+    start = time.monotonic()
+    try:
+        await integration.async_setup_entry(hass, entry)
+        outcome = "ok"
+    except ConfigEntryNotReady:
+        outcome = "not ready"
+    return time.monotonic() - start, outcome
+
+
+async def _start(config_dir: str, entries: list[ConfigEntry]) -> tuple[HomeAssistant, list[tuple[float, str]], float, int]:
+    """Set up all entries concurrently (as Home Assistant does)."""
+    hass = HomeAssistant(config_dir)
+    await load_registries(hass)
+    platforms = PlatformSetup(hass)
+    hass.config_entries = platforms
+    start = time.monotonic()
+    results = await asyncio.gather(*(_timed_setup(hass, entry) for entry in entries))
+    return hass, results, time.monotonic() - start, len(platforms.entities)
+
+
+async def _stop(hass: HomeAssistant, entries: list[ConfigEntry], results: list[tuple[float, str]]) -> None:
+    for entry, (_, outcome) in zip(entries, results):
+        # Home Assistant cancels these on unload; the first refresh of a hung clock is still running
+        for task in list(entry._background_tasks):
+            task.cancel()
+        if outcome == "ok":
+            await integration.async_unload_entry(hass, entry)
+    # Flushes the delayed status saves
+    await hass.async_stop(force=True)
+
+
+def _report(label: str, results: list[tuple[float, str]], total: float, entities: int) -> None:
+    durations = sorted(duration for duration, _ in results)
+    not_ready = sum(outcome == "not ready" for _, outcome in results)
+    print(label)
+    print(f"  all entries set up        {total * 1000:>8.0f} ms")
+    print(f"  per entry p50 / max       {durations[len(durations) // 2] * 1000:.0f} / {durations[-1] * 1000:.0f} ms")
+    print(f"  ConfigEntryNotReady       {not_ready:>8}")
+    print(f"  entities created          {entities:>8}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.3, help="simulated response time (seconds)")
+    parser.add_argument("--offline", type=int, default=2, help="clocks that hang on the warm start")
+    args = parser.parse_args()
+
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+
+    simulators = [DeviceSimulator(push=False, latency=args.latency) for _ in range(args.entries)]
+    ports = [await simulator.start() for simulator in simulators]
+    config_dir = tempfile.mkdtemp()
+    try:
+        entries = _entries(ports)
+        hass, results, total, entities = await _start(config_dir, entries)
+        _report("cold start (no stored status)", results, total, entities)
+        await _stop(hass, entries, results)
+
+        for simulator in simulators[: args.offline]:
+            simulator.latency = DEFAULT_TIMEOUT * 2
+        entries = _entries(ports)
+        hass, results, total, entities = await _start(config_dir, entries)
+        _report(f"warm start (stored status, {args.offline} clocks unresponsive)", results, total, entities)
+        await _stop(hass, entries, results)
+    finally:
+        for simulator in simulators:
+            await simulator.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
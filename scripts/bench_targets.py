@@ -0,0 +1,125 @@
+"""Service target benchmark: configure_auto_brightness on a whole floor.
+
+Sets up N clocks through the integration's real `async_setup_entry`, with
+their devices and entities in the registries and all devices in one area.
+Then changes the auto-brightness range of every clock twice: with one
+service call per clock entity (one after the other, as a script would have
+to before area targets) and with a single call targeting the area, which
+the integration applies to all clocks at once.
+
+Usage (from the repository root):
+    python scripts/bench_targets.py [--clocks 24] [--latency 0.05] [--jitter 0.01]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant import loader  # noqa: E402
+from homeassistant.helpers import area_registry as ar  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+import custom_components.ikea_obegraensad as integration  # noqa: E402
+from custom_components.ikea_obegraensad.const import DOMAIN  # noqa: E402
+from bench_startup import PlatformSetup, _entries, load_registries  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+
+class RegisteringPlatformSetup(PlatformSetup):
+    """Platform stand-in that also registers each entry's device and entities."""
+
+    def __init__(self, hass: HomeAssistant, entries: list[ConfigEntry], area_id: str) -> None:
+        super().__init__(hass)
+        self._entries = {entry.entry_id: entry for entry in entries}
+        self.area_id = area_id
+        self.entity_ids: dict[str, str] = {}
+
+    def async_get_entry(self, entry_id: str) -> ConfigEntry | None:
+        return self._entries.get(entry_id)
+
+    async def async_forward_entry_setups(self, entry: ConfigEntry, platforms: Any) -> None:
+        start = len(self.entities)
+        await super().async_forward_entry_setups(entry, platforms)
+        device = dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=entry.entry_id, identifiers={(DOMAIN, entry.entry_id)}, name=entry.title
+        )
+        dr.async_get(self.hass).async_update_device(device.id, area_id=self.area_id)
+        registry = er.async_get(self.hass)
+        for entity in self.entities[start:]:
+            domain = type(entity).__module__.rsplit(".", 1)[-1]
+            registered = registry.async_get_or_create(
+                domain, DOMAIN, entity.unique_id, config_entry=entry, device_id=device.id
+            )
+            if entity.unique_id.endswith("_auto_brightness"):
+                self.entity_ids[entry.entry_id] = registered.entity_id
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", type=int, default=24)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    args = parser.parse_args()
+
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+
+    simulators = [
+        DeviceSimulator(push=False, latency=args.latency, jitter=args.jitter)
+        for _ in range(args.clocks)
+    ]
+    ports = [await simulator.start() for simulator in simulators]
+    hass = HomeAssistant(tempfile.mkdtemp())
+    # Service calls expand old-style groups through the loader
+    loader.async_setup(hass)
+    await load_registries(hass)
+    area = ar.async_get(hass).async_create("First floor")
+    entries = _entries(ports)
+    platforms = RegisteringPlatformSetup(hass, entries, area.id)
+    hass.config_entries = platforms
+    try:
+        await asyncio.gather(*(integration.async_setup_entry(hass, entry) for entry in entries))
+
+        start = time.monotonic()
+        for entry in entries:
+            await hass.services.async_call(
+                DOMAIN,
+                "configure_auto_brightness",
+                {"entity_id": platforms.entity_ids[entry.entry_id], "min": 40},
+                blocking=True,
+            )
+        per_entity = time.monotonic() - start
+
+        requests_before = sum(simulator.request_count for simulator in simulators)
+        start = time.monotonic()
+        await hass.services.async_call(
+            DOMAIN, "configure_auto_brightness", {"area_id": area.id, "min": 60}, blocking=True
+        )
+        per_area = time.monotonic() - start
+        requests = sum(simulator.request_count for simulator in simulators) - requests_before
+        applied = sum(simulator.state["autoBrightnessMin"] == 60 for simulator in simulators)
+    finally:
+        for entry in entries:
+            await integration.async_unload_entry(hass, entry)
+        await hass.async_stop(force=True)
+        for simulator in simulators:
+            await simulator.stop()
+
+    print(f"{args.clocks} clocks in one area, {args.latency * 1000:.0f} ms latency")
+    print(f"  one call per entity       {per_entity * 1000:>8.0f} ms")
+    print(f"  one call for the area     {per_area * 1000:>8.0f} ms  ({per_entity / per_area:.1f}x)")
+    print(f"  clocks changed            {applied:>8}  ({requests} requests)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""Scrolling text benchmark: render cost and many clocks scrolling at once.
+
+First times the renderer alone (rasterizing a string, producing scroll
+frames). Then starts N simulated clocks and scrolls text on all of them
+through `async_show_text`, reporting the frame rate each clock received,
+CPU time per frame (integration and simulators share the process) and
+event-loop lag.
+
+Usage (from the repository root):
+    python scripts/bench_text.py [--clocks 24] [--speed 20] [--repeat 2] [--text "..."]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.ticker import render_text, scroll_frames  # noqa: E402
+from bench_integration import LoopLag, _percentile  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+
+def bench_renderer(text: str) -> int:
+    """Print the cost of rendering alone; return the frames per pass."""
+    frames = len(list(scroll_frames(text)))
+    uncached = timeit.timeit(lambda: render_text.__wrapped__(text), number=200) / 200
+    per_pass = timeit.timeit(lambda: list(scroll_frames(text)), number=50) / 50
+    print(f"renderer, {len(text)} characters, {frames} frames per pass")
+    print(f"  rasterize text (uncached) {uncached * 1e6:>8.1f} µs")
+    print(f"  per frame                 {per_pass / frames * 1e6:>8.2f} µs")
+    return frames
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", type=int, default=24)
+    parser.add_argument("--speed", type=float, default=20.0, help="columns (frames) per second")
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--text", default="Guten Morgen! 21.5°C, 48 % Luftfeuchte")
+    args = parser.parse_args()
+
+    frames_per_pass = bench_renderer(args.text)
+
+    simulators = [DeviceSimulator(push=False) for _ in range(args.clocks)]
+    ports = [await simulator.start() for simulator in simulators]
+    hass = HomeAssistant(tempfile.mkdtemp())
+    coordinators = [IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port) for port in ports]
+    for coordinator in coordinators:
+        await coordinator.async_refresh()
+
+    lag = LoopLag()
+    lag_task = asyncio.create_task(lag.track())
+    try:
+        cpu_start = time.process_time()
+        for coordinator in coordinators:
+            coordinator.async_show_text(args.text, args.speed, args.repeat)
+        await asyncio.gather(*(coordinator._playback_task for coordinator in coordinators))
+        cpu = time.process_time() - cpu_start
+    finally:
+        lag_task.cancel()
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        for simulator in simulators:
+            await simulator.stop()
+        await hass.async_stop(force=True)
+
+    received = [simulator.frame_count for simulator in simulators]
+    rates = [
+        (simulator.frame_count - 1) / (simulator.frame_last - simulator.frame_first)
+        for simulator in simulators
+        if simulator.frame_count > 1
+    ]
+    total = sum(received)
+    print(f"{args.clocks} clocks scrolling at {args.speed:.0f} columns/s, {args.repeat} passes")
+    print(f"  frames received           {total:>8}  (expected {args.clocks * frames_per_pass * args.repeat})")
+    print(f"  frame rate per clock min  {min(rates, default=0):>8.1f} fps")
+    print(f"  CPU per frame, all sides  {cpu / max(total, 1) * 1e6:>8.0f} µs")
+    print(f"  loop lag p95 / max        {_percentile(lag.samples, 95) * 1000:.1f} / "
+          f"{max(lag.samples, default=0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,328 @@
+"""Local stand-in for an Ikea Obegraensad device.
+
+Serves the firmware's HTTP API from memory so the integration can be
+exercised without hardware. With push enabled, `/api/status` advertises an
+`eventStream` and `/api/events` streams status deltas as server-sent events.
+With batching enabled, it advertises `stateApi` and accepts several settings
+in one JSON POST to `/api/setState`. With frames enabled, it advertises
+`frameStream` and takes raw frames over a WebSocket at `/api/frame`.
+
+Responses can be delayed (latency plus random jitter), fail at a given rate
+with HTTP 500, and be served one at a time like the ESP web server does.
+
+Usage:
+    python scripts/device_simulator.py [--port 8080] [--no-push] [--no-batch] [--no-frames] [--ambient 5]
+        [--latency 0.02] [--jitter 0.01] [--error-rate 0.05] [--serial]
+
+Point the integration (or other scripts) at 127.0.0.1:<port>.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import struct
+import time
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+ROWS = 16
+ROW_BYTES = 8
+
+
+class DeviceSimulator:
+    """In-memory device exposing the firmware's HTTP API."""
+
+    def __init__(
+        self,
+        push: bool = True,
+        batch: bool = True,
+        ambient_interval: float | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        serial: bool = False,
+        frames: bool = True,
+        mac: str | None = None,
+    ) -> None:
+        """Initialize the simulator."""
+        self.push = push
+        self.batch = batch
+        self.ambient_interval = ambient_interval
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.serial = serial
+        self.frames = frames
+        # The ESP web server works through one request at a time
+        self._serial_lock = asyncio.Lock()
+        self.state: dict[str, Any] = {
+            "displayEnabled": True,
+            "brightness": 512,
+            "currentEffect": "clock",
+            "time": time.strftime("%H:%M:%S"),
+            "presence": False,
+            "sensorValue": 300,
+            "ipAddress": "127.0.0.1",
+            "autoBrightnessEnabled": False,
+            "autoBrightnessMin": 50,
+            "autoBrightnessMax": 800,
+            "autoBrightnessSensorMin": 100,
+            "autoBrightnessSensorMax": 900,
+            "timezone": "Europe/Berlin",
+            "firmwareVersion": "sim-1.0",
+        }
+        if push:
+            self.state["eventStream"] = "/api/events"
+        if batch:
+            self.state["stateApi"] = "/api/setState"
+        if frames:
+            self.state["frameStream"] = "/api/frame"
+        if mac:
+            self.state["macAddress"] = mac
+        self.sensor_data: dict[str, str] = {}
+        self.slide_config: dict[str, str] = {}
+        self.request_count = 0
+        self.error_count = 0
+        # Raw frames: packed rows shown, messages/bytes received, protocol errors
+        self.framebuffer: list[bytes] | None = None
+        self.frame_count = 0
+        self.frame_bytes = 0
+        self.frame_errors = 0
+        self.frame_first: float | None = None
+        self.frame_last: float | None = None
+        self._subscribers: set[asyncio.Queue[dict[str, Any] | None]] = set()
+        self._runner: web.AppRunner | None = None
+        self._ambient_task: asyncio.Task | None = None
+        self.port: int | None = None
+
+    def build_app(self) -> web.Application:
+        """Create the aiohttp application with all firmware routes."""
+        app = web.Application(middlewares=[self._latency_middleware])
+        app.router.add_get("/api/status", self._handle_status)
+        app.router.add_get("/api/setDisplay", self._handle_set_display)
+        app.router.add_get("/api/setBrightness", self._handle_set_brightness)
+        app.router.add_get("/api/setAutoBrightness", self._handle_set_auto_brightness)
+        app.router.add_get("/api/setTimezone", self._handle_set_timezone)
+        app.router.add_get("/api/setSensorData", self._handle_set_sensor_data)
+        app.router.add_get("/api/setSlideConfig", self._handle_set_slide_config)
+        app.router.add_get("/effect/{name}", self._handle_effect)
+        if self.batch:
+            app.router.add_post("/api/setState", self._handle_set_state)
+        if self.push:
+            app.router.add_get("/api/events", self._handle_events)
+        if self.frames:
+            app.router.add_get("/api/frame", self._handle_frames)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving and return the bound port."""
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        if self.ambient_interval:
+            self._ambient_task = asyncio.create_task(self._ambient_loop())
+        return self.port
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._ambient_task is not None:
+            self._ambient_task.cancel()
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def update(self, **changes: Any) -> None:
+        """Change device state and notify event stream subscribers."""
+        delta = {key: value for key, value in changes.items() if self.state.get(key) != value}
+        if not delta:
+            return
+        self.state.update(delta)
+        for queue in self._subscribers:
+            queue.put_nowait(delta)
+
+    async def _ambient_loop(self) -> None:
+        """Simulate LDR and presence changes made on the device."""
+        while True:
+            await asyncio.sleep(self.ambient_interval)
+            self.update(
+                sensorValue=random.randint(0, 1024),
+                presence=random.random() < 0.3,
+            )
+
+    @web.middleware
+    async def _latency_middleware(self, request: web.Request, handler):
+        """Delay, serialize and fail requests like the ESP web server would."""
+        if request.path in ("/api/events", "/api/frame"):
+            # Long-lived streams; not subject to request handling limits
+            return await handler(request)
+        if self.serial:
+            async with self._serial_lock:
+                return await self._handle_slowly(request, handler)
+        return await self._handle_slowly(request, handler)
+
+    async def _handle_slowly(self, request: web.Request, handler):
+        """Apply latency, jitter and the error rate to one request."""
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and random.random() < self.error_rate:
+            self.request_count += 1
+            self.error_count += 1
+            return web.Response(status=500, text="Simulated error")
+        return await handler(request)
+
+    def _ok(self) -> web.Response:
+        self.request_count += 1
+        return web.Response(text="OK")
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        self.request_count += 1
+        self.state["time"] = time.strftime("%H:%M:%S")
+        return web.Response(text=json.dumps(self.state), content_type="application/json")
+
+    async def _handle_set_display(self, request: web.Request) -> web.Response:
+        self.update(displayEnabled=request.query.get("enabled") == "true")
+        return self._ok()
+
+    async def _handle_set_brightness(self, request: web.Request) -> web.Response:
+        self.update(brightness=int(request.query["b"]))
+        return self._ok()
+
+    async def _handle_set_auto_brightness(self, request: web.Request) -> web.Response:
+        query = request.query
+        changes: dict[str, Any] = {"autoBrightnessEnabled": query.get("enabled") == "true"}
+        for param, key in (
+            ("min", "autoBrightnessMin"),
+            ("max", "autoBrightnessMax"),
+            ("sensorMin", "autoBrightnessSensorMin"),
+            ("sensorMax", "autoBrightnessSensorMax"),
+        ):
+            if param in query:
+                changes[key] = int(query[param])
+        self.update(**changes)
+        return self._ok()
+
+    async def _handle_set_timezone(self, request: web.Request) -> web.Response:
+        self.update(timezone=request.query["tz"])
+        return self._ok()
+
+    async def _handle_set_sensor_data(self, request: web.Request) -> web.Response:
+        self.sensor_data = dict(request.query)
+        return self._ok()
+
+    async def _handle_set_slide_config(self, request: web.Request) -> web.Response:
+        self.slide_config = dict(request.query)
+        return self._ok()
+
+    async def _handle_effect(self, request: web.Request) -> web.Response:
+        self.update(currentEffect=request.match_info["name"])
+        return self._ok()
+
+    async def _handle_set_state(self, request: web.Request) -> web.Response:
+        self.update(**await request.json())
+        return self._ok()
+
+    async def _handle_events(self, request: web.Request) -> web.StreamResponse:
+        self.request_count += 1
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    delta = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    await response.write(b": ping\n\n")
+                    continue
+                if delta is None:
+                    break
+                await response.write(f"data: {json.dumps(delta)}\n\n".encode())
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            self._subscribers.discard(queue)
+        return response
+
+
+    async def _handle_frames(self, request: web.Request) -> web.WebSocketResponse:
+        self.request_count += 1
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        # A new connection must start with a full frame
+        rows: list[bytes] | None = None
+        last_sequence: int | None = None
+        async for message in ws:
+            if message.type != WSMsgType.BINARY:
+                continue
+            data = message.data
+            sequence, mask = struct.unpack_from(">HH", data)
+            included = [index for index in range(ROWS) if mask & (1 << index)]
+            stale = last_sequence is not None and (sequence - last_sequence) & 0xFFFF >= 0x8000
+            if (
+                len(data) != 4 + ROW_BYTES * len(included)
+                or (rows is None and len(included) != ROWS)
+                or stale
+            ):
+                self.frame_errors += 1
+                continue
+            rows = rows or [b""] * ROWS
+            for position, index in enumerate(included):
+                rows[index] = data[4 + position * ROW_BYTES:4 + (position + 1) * ROW_BYTES]
+            last_sequence = sequence
+            self.framebuffer = list(rows)
+            self.frame_count += 1
+            self.frame_bytes += len(data)
+            self.frame_last = time.monotonic()
+            if self.frame_first is None:
+                self.frame_first = self.frame_last
+        # Connection closed: the device goes back to its effect
+        self.framebuffer = None
+        return ws
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--no-push", action="store_true", help="do not advertise an event stream")
+    parser.add_argument("--no-batch", action="store_true", help="do not advertise the state endpoint")
+    parser.add_argument("--no-frames", action="store_true", help="do not advertise the frame stream")
+    parser.add_argument("--ambient", type=float, default=None, help="seconds between simulated LDR/presence changes")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra seconds (0..jitter) per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--serial", action="store_true", help="handle one request at a time like the ESP")
+    parser.add_argument("--mac", default=None, help="MAC address reported in the status")
+    args = parser.parse_args()
+
+    simulator = DeviceSimulator(
+        push=not args.no_push,
+        batch=not args.no_batch,
+        ambient_interval=args.ambient,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        serial=args.serial,
+        frames=not args.no_frames,
+        mac=args.mac,
+    )
+    port = await simulator.start(args.host, args.port)
+    print(f"Simulated device listening on http://{args.host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
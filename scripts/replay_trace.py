@@ -0,0 +1,208 @@
+"""Replay a recorded request trace through the coordinator and entities.
+
+Reads a trace written by the integration's request recorder (enable "record
+requests" in a clock's options; the file and its rotated predecessors are
+read oldest first). A local stand-in server answers with the recorded
+responses, in recorded order per endpoint, after the recorded latency.
+Requests that failed in the trace are answered by dropping the connection.
+
+One coordinator with all platform entities is driven through the same
+requests: status polls go through `async_refresh` (decoding, diffing,
+entity updates), commands through the coordinator's request path. Timing
+follows the trace, sped up by --speed (1 = original, 10 = ten times faster,
+0 = back to back without latency).
+
+Reports decoding and entity update cost per poll, state writes and how far
+the replay fell behind the recorded schedule.
+
+Usage (from the repository root):
+    python scripts/replay_trace.py <config>/ikea_obegraensad/trace_<entry_id>.jsonl [--speed 0]
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict, deque
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad import coordinator as coordinator_module  # noqa: E402
+from custom_components.ikea_obegraensad.breaker import CircuitBreaker  # noqa: E402
+from custom_components.ikea_obegraensad.const import API_STATUS, DOMAIN  # noqa: E402
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.trace import load_trace, record_body  # noqa: E402
+from bench_integration import PLATFORM_MODULES, _percentile  # noqa: E402
+
+
+class TraceServer:
+    """Answer requests with the responses recorded in a trace."""
+
+    def __init__(self, records: list[dict[str, Any]], speed: float) -> None:
+        self.speed = speed
+        self._responses: dict[tuple[str, str], deque[dict[str, Any]]] = defaultdict(deque)
+        for record in records:
+            self._responses[(record["m"], record["p"])].append(record)
+        self.unmatched = 0
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> int:
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        queue = self._responses.get((request.method, request.path))
+        if not queue:
+            self.unmatched += 1
+            return web.Response(status=404)
+        # The last response of an endpoint answers any extra requests
+        record = queue.popleft() if len(queue) > 1 else queue[0]
+        if self.speed:
+            await asyncio.sleep(record["l"] / 1000 / self.speed)
+        if record.get("e") is not None or record.get("s") is None:
+            request.transport.close()
+            return web.Response(status=503)
+        return web.Response(status=record["s"], body=record_body(record), content_type="application/json")
+
+
+def _timed(func, samples: list[float]):
+    """Wrap a function and record its duration."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+
+    return wrapper
+
+
+async def _setup_entities(hass: HomeAssistant, coordinator: IkeaObegraensadDataUpdateCoordinator) -> int:
+    """Add all platform entities for the replayed clock."""
+    entry = ConfigEntry(
+        version=2,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Replay",
+        data={"host": coordinator.host, "port": coordinator.port, "name": "Replay"},
+        source="user",
+        options={},
+    )
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    entities: list[Any] = []
+    for module in PLATFORM_MODULES:
+        await module.async_setup_entry(hass, entry, entities.extend)
+    for position, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"{entity.__module__.rsplit('.', 1)[-1]}.replay_{position}"
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state()
+    return len(entities)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", help="trace file written by the integration")
+    parser.add_argument("--speed", type=float, default=0.0, help="1 = recorded timing, 0 = as fast as possible")
+    args = parser.parse_args()
+
+    # Entities are added without an entity platform; skip the per-entity report
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+    logging.getLogger("custom_components.ikea_obegraensad").setLevel(logging.CRITICAL)
+
+    records = load_trace(args.trace)
+    if not records:
+        sys.exit(f"No records in {args.trace}")
+    server = TraceServer(records, args.speed)
+    port = await server.start()
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port)
+    # Every recorded request has to reach the stand-in, failed ones included
+    coordinator.breaker = CircuitBreaker(failure_threshold=len(records) + 1)
+    decode_samples: list[float] = []
+    update_samples: list[float] = []
+    coordinator_module.decode_json = _timed(coordinator_module.decode_json, decode_samples)
+    coordinator.async_update_listeners = _timed(coordinator.async_update_listeners, update_samples)
+    entity_count = await _setup_entities(hass, coordinator)
+    update_samples.clear()
+
+    state_writes = 0
+
+    def _count_write(event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+
+    polls = commands = failed = 0
+    behind: list[float] = []
+    loop = asyncio.get_running_loop()
+    first = records[0]["t"]
+    start = loop.time()
+    try:
+        for record in records:
+            if args.speed:
+                delay = (record["t"] - first) / args.speed - (loop.time() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    behind.append(-delay)
+            if record["m"] == "GET" and record["p"] == API_STATUS:
+                polls += 1
+                await coordinator.async_refresh()
+                continue
+            commands += 1
+            query = record.get("q")
+            kwargs = {"params": query} if record["m"] == "GET" else {"json": query}
+            try:
+                await coordinator._async_request(record["m"], record["p"], **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                failed += 1
+        elapsed = loop.time() - start
+    finally:
+        await coordinator.async_shutdown()
+        await server.stop()
+        await hass.async_stop(force=True)
+
+    recorded = records[-1]["t"] - first
+    print(f"{args.trace}: {len(records)} records over {recorded:.0f} s, {entity_count} entities")
+    print(f"  replayed in               {elapsed:>8.2f} s  (speed {args.speed or 'max'})")
+    print(f"  status polls / commands   {polls} / {commands}  ({failed} transport errors)")
+    print(f"  decode per poll p50 / max {_percentile(decode_samples, 50) * 1e6:.0f} / "
+          f"{max(decode_samples, default=0) * 1e6:.0f} µs")
+    print(f"  entity updates p50 / max  {_percentile(update_samples, 50) * 1e6:.0f} / "
+          f"{max(update_samples, default=0) * 1e6:.0f} µs per status update")
+    print(f"  state writes              {state_writes:>8}  (suppressed {coordinator.update_stats['suppressed']})")
+    if args.speed:
+        print(f"  behind schedule p95 / max {_percentile(behind, 95) * 1000:.1f} / "
+              f"{max(behind, default=0) * 1000:.1f} ms")
+    if server.unmatched:
+        print(f"  requests without a recorded response: {server.unmatched}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
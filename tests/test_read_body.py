@@ -0,0 +1,54 @@
+"""The bounded reader gives up on a body that trickles in forever."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+import pytest  # noqa: E402
+
+from custom_components.ikea_obegraensad.decoder import (  # noqa: E402
+    ResponseTooSlow,
+    read_body,
+)
+
+
+async def _trickle(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(headers={"Content-Type": "application/json"})
+    await response.prepare(request)
+    try:
+        for _ in range(100):
+            await response.write(b" ")
+            await asyncio.sleep(0.05)
+    except (ConnectionResetError, RuntimeError):
+        pass
+    return response
+
+
+async def _read_trickle() -> float:
+    app = web.Application()
+    app.router.add_get("/", _trickle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    start = time.monotonic()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{port}/") as response:
+                with pytest.raises(ResponseTooSlow):
+                    await read_body(response, stall_timeout=0.5, body_timeout=0.5)
+    finally:
+        await runner.cleanup()
+    return time.monotonic() - start
+
+
+def test_trickling_body_hits_the_deadline() -> None:
+    # Every chunk arrives well within the stall timeout
+    assert asyncio.run(_read_trickle()) < 1.5
@@ -0,0 +1,50 @@
+"""Requests keep working while the push and frame streams are open."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.ikea_obegraensad.coordinator import (  # noqa: E402
+    IkeaObegraensadDataUpdateCoordinator,
+)
+from custom_components.ikea_obegraensad.framebuffer import pack_frame  # noqa: E402
+from device_simulator import DeviceSimulator  # noqa: E402
+
+
+async def _command_while_streaming() -> None:
+    simulator = DeviceSimulator(push=True, frames=True)
+    port = await simulator.start()
+    hass = HomeAssistant(tempfile.mkdtemp())
+    coordinator = IkeaObegraensadDataUpdateCoordinator(hass, "127.0.0.1", port)
+    try:
+        await coordinator.async_refresh()
+        for _ in range(100):
+            if coordinator.event_stream is not None and coordinator.event_stream.connected:
+                break
+            await asyncio.sleep(0.02)
+        assert coordinator.event_stream.connected
+        assert await coordinator.async_draw_frame(pack_frame([[15] * 16] * 16))
+        assert coordinator.frame_stream.connected
+
+        start = time.monotonic()
+        assert await coordinator.async_set_effect("rain")
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert time.monotonic() - start < 2
+        assert simulator.state["currentEffect"] == "rain"
+    finally:
+        await coordinator.async_shutdown()
+        await simulator.stop()
+        await hass.async_stop(force=True)
+
+
+def test_command_while_push_and_frame_streams_are_open() -> None:
+    asyncio.run(_command_while_streaming())